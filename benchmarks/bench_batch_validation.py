@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks/bench_batch_validation.py
+------------------------------------
+Measures validating batches of ProjectCreateRequest rows one pydantic model at a
+time against the columnar BatchValidator, for rows given as dictionaries and as
+columns.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_batch_validation --json
+"""
+
+import argparse
+import logging
+import time
+
+import orjson
+from pydantic import ValidationError
+
+from portalcx.models.admin_project_models import ProjectCreateRequest
+from portalcx.utils.batch_validation import validate_project_rows
+
+from .bench_model_serialization import COUNTS, project_row
+
+
+def per_row(rows: list) -> int:
+    invalid = 0
+    for row in rows:
+        try:
+            ProjectCreateRequest(**row)
+        except ValidationError:
+            invalid += 1
+    return invalid
+
+
+def columnar(rows: list) -> int:
+    return len(validate_project_rows(rows).errors)
+
+
+def run(counts, subscribers: int) -> list:
+    results = []
+    for count in counts:
+        rows = [project_row(index, subscribers) for index in range(count)]
+        # One bad row in a hundred
+        for row in rows[::100]:
+            row["countryId"] = "US"
+        columns = {name: [row.get(name) for row in rows] for name in rows[0]}
+
+        for name, validate, batch in (("per_row", per_row, rows), ("columnar_rows", columnar, rows),
+                                      ("columnar_columns", columnar, columns)):
+            start = time.perf_counter()
+            invalid = validate(batch)
+            elapsed = time.perf_counter() - start
+            results.append({
+                "rows": count,
+                "subscribers": subscribers,
+                "method": name,
+                "invalid": invalid,
+                "seconds": round(elapsed, 3),
+                "rows_per_second": round(count / elapsed),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=list(COUNTS), help="Rows per run")
+    parser.add_argument("--subscribers", type=int, default=2, help="Nested subscribers per project")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results = run(args.counts, args.subscribers)
+
+    if args.json:
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        return
+
+    for result in results:
+        print(f"{result['rows']:>7} rows  {result['method']:<17} {result['seconds']:>8.3f} s "
+              f"{result['rows_per_second']:>9} rows/s  {result['invalid']} invalid")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks/bench_connection_pool.py
+-----------------------------------
+Compares a new connection per call (module-level ``httpx.request``) against the
+pooled client shared by the PortalCX API classes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_connection_pool --calls 500
+
+The stand-in server speaks plain HTTP, so the savings shown here are the TCP
+handshakes plus the client and SSL context that ``httpx.request`` builds on every
+call; against the real API each avoided connection also skips a TLS handshake.
+"""
+
+import argparse
+import logging
+import time
+
+import httpx
+import orjson
+
+from portalcx import PortalCX
+
+from .local_server import LocalServer
+
+
+def per_call_connections(base_url: str, calls: int):
+    for project_id in range(calls):
+        httpx.request("DELETE", f"{base_url}/api/Admin/Project/DeleteProject?projectId={project_id}")
+
+
+def pooled_client(base_url: str, calls: int):
+    with PortalCX(base_url=base_url, auth_token="benchmark") as pxc:
+        for project_id in range(calls):
+            pxc.delete_project(project_id)
+
+
+def run(calls: int) -> list:
+    results = []
+
+    with LocalServer() as server:
+        for name, func in (("per_call_connections", per_call_connections),
+                           ("pooled_client", pooled_client)):
+            server.reset()
+            start = time.perf_counter()
+            func(server.base_url, calls)
+            elapsed = time.perf_counter() - start
+
+            results.append({
+                "benchmark": name,
+                "calls": calls,
+                "seconds": round(elapsed, 4),
+                "calls_per_second": round(calls / elapsed, 1),
+                "connections": server.connections,
+            })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="Number of requests per benchmark")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Keep the SDK's INFO lines out of the timings
+    logging.disable(logging.INFO)
+
+    results = run(args.calls)
+
+    if args.json:
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        return
+
+    for result in results:
+        print(f"{result['benchmark']:<22} {result['calls']:>6} calls  {result['seconds']:>8.3f}s  "
+              f"{result['calls_per_second']:>9.1f} calls/s  {result['connections']:>5} connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks/bench_logging_overhead.py
+------------------------------------
+Measures the logging cost of AdminProject.create_project_request when INFO is
+disabled, comparing eager f-string messages with the deferred, level-guarded
+messages the SDK uses.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_logging_overhead --json
+"""
+
+import argparse
+import logging
+import time
+
+import httpx
+import orjson
+
+from portalcx.api.admin_projects import AdminProject
+from portalcx.models.admin_project_models import ProjectCreateRequest
+from portalcx.utils.logger import set_log_level
+
+PROJECT = ProjectCreateRequest(
+    templateId="3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    firstName="The",
+    lastName="Dude",
+    email="thedude@portalcx.com",
+    phoneNumber="8016697921",
+    notifyViaEmail=True,
+    notifyViaSMS=True,
+    completeFirstStage=False,
+    countryId=1,
+)
+
+
+def eager_messages(logger: logging.Logger, project_data: ProjectCreateRequest):
+    """
+    The log lines of create_project_request written as f-strings, formatted on
+    every call whether or not INFO is enabled.
+    """
+    logger.info(
+        f"Creating a new project for {project_data.firstName} {project_data.lastName}"
+        f" and phone number {project_data.phoneNumber} using the template id:"
+        f" {project_data.templateId}"
+    )
+    logger.info("Successfully created a new project")
+
+
+def deferred_messages(logger: logging.Logger, project_data: ProjectCreateRequest):
+    """
+    The log lines of create_project_request as the SDK writes them.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Creating a new project for %s %s and phone number %s using the template id: %s",
+            project_data.firstName, project_data.lastName, project_data.phoneNumber, project_data.templateId
+        )
+    logger.info("Successfully created a new project")
+
+
+def time_per_call(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def run(calls: int) -> list:
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"projectId": 1})))
+    admin_project = AdminProject("https://portalcx.test", token="benchmark", client=client)
+    logger = admin_project.logger
+
+    set_log_level(logging.WARNING, "api.admin_projects")
+    try:
+        results = [
+            {"benchmark": "log_lines_eager", "calls": calls,
+             "nanoseconds_per_call": time_per_call(lambda: eager_messages(logger, PROJECT), calls)},
+            {"benchmark": "log_lines_deferred", "calls": calls,
+             "nanoseconds_per_call": time_per_call(lambda: deferred_messages(logger, PROJECT), calls)},
+            {"benchmark": "create_project_request", "calls": calls // 10,
+             "nanoseconds_per_call": time_per_call(lambda: admin_project.create_project_request(PROJECT),
+                                                   calls // 10)},
+        ]
+    finally:
+        set_log_level(logging.NOTSET, "api.admin_projects")
+        client.close()
+
+    for result in results:
+        result["nanoseconds_per_call"] = round(result["nanoseconds_per_call"], 1)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000, help="Number of calls per benchmark")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.calls)
+
+    if args.json:
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        return
+
+    for result in results:
+        print(f"{result['benchmark']:<24} {result['calls']:>8} calls  {result['nanoseconds_per_call']:>10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
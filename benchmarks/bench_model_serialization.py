@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks/bench_model_serialization.py
+---------------------------------------
+Measures building ProjectCreateRequest bodies from raw rows, with and without
+nested subscribers:
+
+- validated_dict: validate, to_dict(), then json.dumps as httpx's json= argument did
+- validated_json: validate, then the cached orjson serializer (to_json)
+- trusted_json: trusted() construction without validation, then to_json
+
+Run from the repository root::
+
+    python -m benchmarks.bench_model_serialization --json
+"""
+
+import argparse
+import json
+import logging
+import time
+
+import orjson
+
+from portalcx.models.admin_project_models import ProjectCreateRequest
+
+COUNTS = (10_000, 100_000)
+TEMPLATE_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+
+def project_row(index: int, subscribers: int) -> dict:
+    row = {
+        "templateId": TEMPLATE_ID, "firstName": "First", "lastName": f"Last {index}",
+        "email": f"user{index}@portalcx.com", "phoneNumber": "8015551234", "addressLine1": "123 Main Street",
+        "city": "Salt Lake City", "stateCode": "UT", "zip": "84101", "notifyViaEmail": False,
+        "notifyViaSMS": False, "completeFirstStage": False, "countryId": 1,
+    }
+    if subscribers:
+        row["projectSubscribers"] = [
+            {"firstName": "Sub", "lastName": f"Scriber {number}", "email": f"sub{number}@portalcx.com",
+             "phonenumber": "8015551234", "notifyViaEmail": True, "notifyViaSMS": False, "countryId": 1}
+            for number in range(subscribers)
+        ]
+    return row
+
+
+def validated_dict(row: dict) -> bytes:
+    return json.dumps(ProjectCreateRequest(**row).to_dict()).encode()
+
+
+def validated_json(row: dict) -> bytes:
+    return ProjectCreateRequest(**row).to_json()
+
+
+def trusted_json(row: dict) -> bytes:
+    return ProjectCreateRequest.trusted(**row).to_json()
+
+
+METHODS = {"validated_dict": validated_dict, "validated_json": validated_json, "trusted_json": trusted_json}
+
+
+def run(counts, subscribers: int) -> list:
+    results = []
+    for count in counts:
+        for nested in sorted({0, subscribers}):
+            rows = [project_row(index, nested) for index in range(count)]
+            for name, build in METHODS.items():
+                start = time.perf_counter()
+                body_bytes = sum(len(build(row)) for row in rows)
+                elapsed = time.perf_counter() - start
+                results.append({
+                    "objects": count,
+                    "subscribers": nested,
+                    "method": name,
+                    "seconds": round(elapsed, 3),
+                    "microseconds_per_object": round(elapsed / count * 1e6, 2),
+                    "objects_per_second": round(count / elapsed),
+                    "body_bytes": body_bytes,
+                })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=list(COUNTS), help="Objects per run")
+    parser.add_argument("--subscribers", type=int, default=3, help="Nested subscribers per project")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results = run(args.counts, args.subscribers)
+
+    if args.json:
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        return
+
+    for result in results:
+        print(f"{result['objects']:>7} objects {result['subscribers']:>2} subscribers  {result['method']:<15} "
+              f"{result['seconds']:>8.3f} s {result['microseconds_per_object']:>8.2f} us/object "
+              f"{result['objects_per_second']:>9} objects/s")
+
+
+if __name__ == "__main__":
+    main()
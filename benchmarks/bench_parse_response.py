@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks/bench_parse_response.py
+----------------------------------
+Measures APIBase.parse_response_data over stage lists and error bodies of
+increasing size, against the text-based parser it replaced.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parse_response --json
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+
+import httpx
+import orjson
+
+from portalcx.api.admin_templates import AdminTemplate
+
+SIZES = (10, 100, 1_000, 10_000)
+
+
+def stages_payload(count: int) -> bytes:
+    return orjson.dumps({"data": {"templateStages": [
+        {
+            "templateStageId": stage_id,
+            "stageName": f"Stage {stage_id}",
+            "stageDescription": "Stage description " * 4,
+            "stagePromptButtonCopy": "Learn more",
+            "stagePromptButtonUrl": "https://portalcx.com/",
+        }
+        for stage_id in range(count)
+    ]}})
+
+
+def error_payload(count: int) -> bytes:
+    return orjson.dumps({"errorMessage": "Validation failed", "errors": [f"Row {i} is invalid" for i in range(count)]})
+
+
+def text_parse(response: httpx.Response) -> dict:
+    """
+    The text-based parser: decode the body, scan it for JSON characters and parse
+    the decoded text.
+    """
+    response_data = {"status": response.status_code, "message": "", "data": None}
+    if any(char in response.text for char in ['{', '[']):
+        response_data["data"] = orjson.loads(response.text)
+    else:
+        response_data["message"] = response.text
+    return response_data
+
+
+def measure(parse, payload: bytes, repeat: int) -> dict:
+    # Build fresh responses up front so cached decoded text is not reused between runs
+    responses = [httpx.Response(200, content=payload) for _ in range(repeat)]
+
+    start = time.perf_counter()
+    for response in responses:
+        parse(response)
+    elapsed = time.perf_counter() - start
+
+    response = httpx.Response(200, content=payload)
+    tracemalloc.start()
+    parse(response)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"microseconds_per_call": round(elapsed / repeat * 1e6, 2), "peak_bytes": peak}
+
+
+def run(repeat: int) -> list:
+    parser = AdminTemplate("https://portalcx.test")
+    results = []
+
+    for payload_name, payload_factory in (("stages", stages_payload), ("error", error_payload)):
+        for size in SIZES:
+            payload = payload_factory(size)
+            for parser_name, parse in (("text_scan", text_parse), ("bytes", parser.parse_response_data)):
+                result = {"payload": payload_name, "items": size, "payload_bytes": len(payload), "parser": parser_name}
+                result.update(measure(parse, payload, max(1, repeat // size)))
+                results.append(result)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=100_000, help="Total items parsed per benchmark")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results = run(args.repeat)
+
+    if args.json:
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        return
+
+    for result in results:
+        print(f"{result['payload']:<7} {result['items']:>6} items {result['payload_bytes']:>9} bytes  "
+              f"{result['parser']:<10} {result['microseconds_per_call']:>10.2f} us/call  "
+              f"{result['peak_bytes']:>10} peak bytes")
+
+
+if __name__ == "__main__":
+    main()
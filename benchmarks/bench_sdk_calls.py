@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks/bench_sdk_calls.py
+-----------------------------
+Measures the SDK's own cost per call against the in-process mock PortalCX server:
+single-call latency, response parse time and memory for each endpoint, and bulk
+throughput for project creation and stage completion.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_sdk_calls --json --output results.json
+
+The JSON output records the git commit and library versions so results from
+different commits can be compared.
+"""
+
+import argparse
+import asyncio
+import logging
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import httpx
+import orjson
+
+from portalcx import AsyncPortalCX, PortalCX
+from portalcx.models.admin_project_models import ProjectCreateRequest
+from portalcx.models.admin_template_models import (CreateTemplate,
+                                                   ProjectStageCompleteRequest,
+                                                   TemplateStageCreateRequest)
+from portalcx.utils.instrumentation import Instrumentation
+
+from .mock_portalcx import MockPortalCX
+
+TEMPLATE_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+TEMPLATE = CreateTemplate(templateName="Benchmark", projectTitle="Benchmark project",
+                          supportEmailAddress="support@portalcx.com", supportPhoneNumber="8015551234",
+                          companyName="PortalCX", isCustomerReferrals=False, countryId=1)
+
+STAGE = TemplateStageCreateRequest(templateId=TEMPLATE_ID, stageName="Stage 1",
+                                   stageDescription="The first stage of the project",
+                                   stagePromptButtonCopy="Learn more",
+                                   stagePromptButtonUrl="https://portalcx.com/")
+
+
+def project(index: int) -> ProjectCreateRequest:
+    return ProjectCreateRequest(templateId=TEMPLATE_ID, firstName="First", lastName=f"Last {index}",
+                                email=f"user{index}@portalcx.com", phoneNumber="8015551234",
+                                addressLine1="123 Main Street", city="Salt Lake City", stateCode="UT",
+                                zip="84101", notifyViaEmail=False, notifyViaSMS=False,
+                                completeFirstStage=False, countryId=1)
+
+
+def stage_completion(index: int) -> ProjectStageCompleteRequest:
+    return ProjectStageCompleteRequest(projectId=index, completedStageLabel="Stage 1",
+                                       completedDate="2023-06-01T00:00:00+00:00",
+                                       notifyViaEmail=False, notifyViaSms=False)
+
+
+# Each call gets the client and the call number
+OPERATIONS = {
+    "create_template": lambda pxc, i: pxc.create_template(TEMPLATE),
+    "create_template_stage": lambda pxc, i: pxc.create_template_stage(STAGE),
+    "create_project": lambda pxc, i: pxc.create_project(project(i)),
+    "complete_project_stage": lambda pxc, i: pxc.complete_project_stage(stage_completion(i)),
+    "delete_stage": lambda pxc, i: pxc.delete_stage(i),
+    "delete_template": lambda pxc, i: pxc.delete_template(TEMPLATE_ID),
+    "delete_project": lambda pxc, i: pxc.delete_project(i),
+}
+
+
+def mock_client(server: MockPortalCX, instrumentation: Instrumentation = None) -> PortalCX:
+    client = httpx.Client(transport=server.transport())
+    return PortalCX(base_url=MockPortalCX.BASE_URL, auth_token="benchmark", client=client,
+                    instrumentation=instrumentation)
+
+
+def bench_call(name: str, operation, calls: int) -> dict:
+    server = MockPortalCX()
+
+    with mock_client(server) as pxc:
+        for i in range(min(calls, 50)):  # warm up
+            operation(pxc, i)
+
+        durations = []
+        for i in range(calls):
+            start = time.perf_counter()
+            operation(pxc, i)
+            durations.append(time.perf_counter() - start)
+
+    # Parse time from a separate instrumented pass, so hooks do not skew the latencies
+    instrumentation = Instrumentation()
+    with mock_client(server, instrumentation) as pxc:
+        for i in range(calls):
+            operation(pxc, i)
+    (series,) = instrumentation.snapshot().values()
+
+    # Allocations while tracing; tracemalloc slows calls down, so it gets its own pass
+    memory_calls = max(1, calls // 10)
+    with mock_client(server) as pxc:
+        operation(pxc, 0)
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(memory_calls):
+            operation(pxc, i)
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    durations.sort()
+    return {
+        "operation": name,
+        "calls": calls,
+        "mean_us": round(statistics.fmean(durations) * 1e6, 2),
+        "p50_us": round(durations[len(durations) // 2] * 1e6, 2),
+        "p99_us": round(durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1e6, 2),
+        "parse_mean_us": round(series["parse"]["mean"] * 1e6, 2),
+        "request_bytes": series["request_bytes"]["max"],
+        "response_bytes": series["response_bytes"]["max"],
+        "retained_bytes_per_call": round((after - before) / memory_calls, 1),
+        "peak_bytes": peak - before,
+    }
+
+
+def bench_bulk(name: str, items: int, concurrency: int, latency: float) -> dict:
+    server = MockPortalCX(latency=latency)
+
+    if name.startswith("async_"):
+        async def run():
+            client = httpx.AsyncClient(transport=server.async_transport())
+            async with AsyncPortalCX(base_url=MockPortalCX.BASE_URL, auth_token="benchmark", client=client) as pxc:
+                executor = bulk(pxc)
+                await executor.run()
+                return executor
+
+        bulk = (lambda pxc: pxc.create_projects_bulk((project(i) for i in range(items)), concurrency=concurrency))
+        executor = asyncio.run(run())
+    else:
+        with mock_client(server) as pxc:
+            if name == "create_projects_bulk":
+                executor = pxc.create_projects_bulk((project(i) for i in range(items)), concurrency=concurrency)
+            else:
+                executor = pxc.complete_project_stages_bulk((stage_completion(i % 100) for i in range(items)),
+                                                            concurrency=concurrency)
+            executor.run()
+
+    stats = executor.stats
+    return {
+        "operation": name,
+        "items": items,
+        "concurrency": concurrency,
+        "server_latency_ms": latency * 1000,
+        "seconds": round(stats.elapsed, 4),
+        "items_per_second": round(stats.throughput, 1),
+        "failed": stats.failed,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(calls: int, items: int, latency: float) -> dict:
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "httpx": httpx.__version__,
+            "calls": calls,
+            "items": items,
+            "server_latency_ms": latency * 1000,
+        },
+        "calls": [bench_call(name, operation, calls) for name, operation in OPERATIONS.items()],
+        "bulk": [],
+    }
+
+    for name, concurrencies in (("create_projects_bulk", (1, 8, 32)),
+                                ("complete_project_stages_bulk", (1, 8, 32)),
+                                ("async_create_projects_bulk", (8, 100))):
+        for concurrency in concurrencies:
+            results["bulk"].append(bench_bulk(name, items, concurrency, latency))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000, help="Calls per endpoint for latency and parse cost")
+    parser.add_argument("--items", type=int, default=500, help="Items per bulk run")
+    parser.add_argument("--latency", type=float, default=0.005, help="Emulated server time per request in seconds "
+                                                                    "for bulk runs")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--output", help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    # Keep the SDK's INFO lines out of the timings
+    logging.disable(logging.INFO)
+
+    results = run(args.calls, args.items, args.latency)
+
+    if args.output:
+        with open(args.output, "wb") as output:
+            output.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+
+    if args.json:
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
+        return
+
+    for result in results["calls"]:
+        print(f"{result['operation']:<24} {result['mean_us']:>9.1f} us/call  p99 {result['p99_us']:>9.1f} us  "
+              f"parse {result['parse_mean_us']:>7.1f} us  {result['retained_bytes_per_call']:>9.1f} B/call retained  "
+              f"{result['peak_bytes']:>8} peak bytes")
+    for result in results["bulk"]:
+        print(f"{result['operation']:<30} concurrency {result['concurrency']:>3}  {result['seconds']:>7.3f}s  "
+              f"{result['items_per_second']:>8.1f} items/s  {result['failed']} failed")
+
+
+if __name__ == "__main__":
+    main()
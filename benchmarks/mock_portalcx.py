@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+benchmarks/mock_portalcx.py
+---------------------------
+An in-process stand-in for the PortalCX endpoints used by the SDK, served through
+``httpx.MockTransport`` so benchmarks measure the SDK rather than the network.
+
+Responses follow the shapes returned by the live API: CreateTemplate answers with
+the new template id as a JSON string, CreateProject with a JSON object holding the
+projectId and portalId, and the stage and delete endpoints with plain text.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+import uuid
+from typing import Dict, List
+
+import httpx
+import orjson
+
+TEXT = {"Content-Type": "text/plain; charset=utf-8"}
+JSON = {"Content-Type": "application/json"}
+
+
+class MockPortalCX:
+    """
+    Keeps templates, stages and projects in memory and answers SDK requests.
+
+    Usage::
+
+        server = MockPortalCX()
+        PortalCX(base_url=MockPortalCX.BASE_URL, client=httpx.Client(transport=server.transport()))
+
+    :param latency: Seconds each request takes on the server, to emulate network and
+                    server time in throughput benchmarks
+    """
+    BASE_URL = "https://portalcx.mock"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.templates: Dict[str, dict] = {}
+        self.stages: Dict[int, dict] = {}
+        self.projects: Dict[int, dict] = {}
+        self.requests = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+        self._routes = {
+            ("POST", "/api/AuthManagement/Login"): self._login,
+            ("POST", "/api/Admin/Template/CreateTemplate"): self._create_template,
+            ("POST", "/api/Admin/Template/CreateStage"): self._create_stage,
+            ("GET", "/api/Admin/Template/GetAllStagesByTemplateId"): self._get_stages,
+            ("POST", "/api/Admin/Project/CompleteProjectStage"): self._complete_stage,
+            ("DELETE", "/api/Admin/Template/DeleteStage"): self._delete_stage,
+            ("DELETE", "/api/Admin/Template/DeleteTemplate"): self._delete_template,
+            ("POST", "/api/Admin/Project/CreateProject"): self._create_project,
+            ("DELETE", "/api/Admin/Project/DeleteProject"): self._delete_project,
+        }
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        A transport for httpx.Client.
+        """
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """
+        A transport for httpx.AsyncClient; server latency does not block the event loop.
+        """
+        return httpx.MockTransport(self.handle_async)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._dispatch(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._dispatch(request)
+
+    def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        route = self._routes.get((request.method, request.url.path))
+        if route is None:
+            return httpx.Response(404, headers=JSON, content=b'{"errorMessage":"Not found"}')
+        with self._lock:
+            self.requests += 1
+            return route(request)
+
+    def _login(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers=JSON, content=orjson.dumps({"token": "mock-token", "result": True}))
+
+    def _create_template(self, request: httpx.Request) -> httpx.Response:
+        template_id = str(uuid.uuid4())
+        self.templates[template_id] = {"templateId": template_id, "bytes": len(request.read())}
+        return httpx.Response(200, headers=TEXT, content=orjson.dumps(template_id))
+
+    def _create_stage(self, request: httpx.Request) -> httpx.Response:
+        stage = orjson.loads(request.read())
+        stage["templateStageId"] = next(self._ids)
+        self.stages[stage["templateStageId"]] = stage
+        return httpx.Response(200, headers=TEXT, content=b"Template Stage created successfully")
+
+    def _get_stages(self, request: httpx.Request) -> httpx.Response:
+        template_id = request.url.params.get("templateId")
+        stages: List[dict] = [stage for stage in self.stages.values() if stage["templateId"] == template_id]
+        return httpx.Response(200, headers=JSON, content=orjson.dumps({"templateStages": stages}))
+
+    def _complete_stage(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        return httpx.Response(200, headers=TEXT, content=b"Project stage completed successfully")
+
+    def _delete_stage(self, request: httpx.Request) -> httpx.Response:
+        self.stages.pop(int(request.url.params.get("templateStageId")), None)
+        return httpx.Response(200, headers=TEXT, content=b"Template Stage deleted successfully")
+
+    def _delete_template(self, request: httpx.Request) -> httpx.Response:
+        self.templates.pop(request.url.params.get("templateId"), None)
+        return httpx.Response(200, headers=TEXT, content=b"Template deleted successfully")
+
+    def _create_project(self, request: httpx.Request) -> httpx.Response:
+        project = orjson.loads(request.read())
+        project_id = next(self._ids)
+        portal_id = str(uuid.uuid4())
+        self.projects[project_id] = project
+        return httpx.Response(200, headers=JSON, content=orjson.dumps({
+            "message": "Project created successfully",
+            "projectId": project_id,
+            "portalId": portal_id,
+        }))
+
+    def _delete_project(self, request: httpx.Request) -> httpx.Response:
+        self.projects.pop(int(request.url.params.get("projectId")), None)
+        return httpx.Response(200, headers=TEXT, content=b"Project deleted successfully")
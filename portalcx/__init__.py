@@ -1,21 +1,72 @@
 """
 portalcx/__init__.py
 --------------------
-This module contains the PortalCX class which serves as the main entry point for the SDK.
+This module contains the PortalCX class which serves as the main entry point for the SDK,
+and its asyncio counterpart AsyncPortalCX.
 """
 
+from functools import partial
+from typing import Callable, Iterable, Optional, Union
+
+import httpx
 from pydantic import ValidationError
 
-from .api.admin_projects import AdminProject
-from .api.admin_templates import AdminTemplate
-from .api.auth_management import AuthManagement
+from .api.admin_projects import AdminProject, AsyncAdminProject
+from .api.admin_templates import AdminTemplate, AsyncAdminTemplate
+from .api.admin_templates import created_template_id, template_stage_ids
+from .api.api_base import create_async_http_client, create_http_client
+from .api.auth_management import AsyncAuthManagement, AuthManagement
 from .models.admin_project_models import ProjectCreateRequest
 from .models.admin_template_models import (CreateTemplate,
                                            GetAllStagesByTemplateIdParams,
                                            TemplateStageCreateRequest,
                                            ProjectStageCompleteRequest)
 from .models.auth_management_models import AuthManagementRegister
+from .utils.bulk import AsyncBulkExecutor, BulkExecutor
+from .utils.cache import ResponseCache
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.idempotency import IdempotencyStore
+from .utils.instrumentation import Instrumentation
+from .utils.journal import BulkJournal
 from .utils.logger import get_logger
+from .utils.provisioning import (ProvisionedTemplate, ProvisioningError, check_stage_names,
+                                 provisioned_template, stages_for_template)
+from .utils.rate_limiter import RateLimiter
+from .utils.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from .utils.singleflight import AsyncSingleFlight, SingleFlight
+from .utils.teardown import TEARDOWN_PHASES, TeardownReport, async_delete_if_exists, delete_if_exists
+from .utils.token_cache import TokenCache
+from .utils.token_manager import AsyncTokenManager, TokenManager
+
+
+def validate_template_id(template_id: str, logger):
+    """
+    Validate a template id before it is sent to the API.
+
+    :param template_id: A UUID string of the template
+    :param logger: The logger used to report an invalid id
+    :raise: ValidationError if the template id is invalid
+    """
+    try:
+        GetAllStagesByTemplateIdParams(templateId=template_id)
+    except ValidationError as e:
+        logger.error("Invalid template ID: %s", template_id)
+        raise e
+
+
+def project_stage_key(complete_stage_data: ProjectStageCompleteRequest) -> tuple:
+    """
+    The key used to serialize stage completions for the same project in bulk runs.
+
+    Completions that refer to one project by projectId and another time by portalId
+    cannot be matched client-side and get different keys.
+
+    :param complete_stage_data: A ProjectStageCompleteRequest object
+    :return: A hashable key identifying the project
+    """
+    if complete_stage_data.projectId is not None:
+        return 'projectId', complete_stage_data.projectId
+    return 'portalId', complete_stage_data.portalId
 
 
 class PortalCX:
@@ -23,34 +74,110 @@ class PortalCX:
     Main class for the PortalCX SDK.
     """
 
-    def __init__(self, base_url, auth_token=None):
+    def __init__(self,
+                 base_url,
+                 auth_token=None,
+                 client: Optional[httpx.Client] = None,
+                 timeout: Union[float, httpx.Timeout, None] = None,
+                 limits: Optional[httpx.Limits] = None,
+                 stages_cache: Optional[ResponseCache] = None,
+                 lazy_responses: bool = False,
+                 retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 token_manager: Optional[TokenManager] = None,
+                 token_cache: Optional[TokenCache] = None,
+                 coalesce_requests: bool = False,
+                 idempotency_store: Optional[IdempotencyStore] = None):
         """
         Initialize the API base class with base URL and optional authentication token.
 
+        All API classes share a single pooled httpx client, so connections are kept
+        alive and reused across auth, template and project calls.
+
         :param base_url: The base URL of the API
         :param auth_token: The authentication token (optional)
+        :param client: An httpx.Client to use instead of creating one (optional).
+                       A client passed in is not closed by close().
+        :param timeout: Request timeout in seconds or an httpx.Timeout (optional)
+        :param limits: Connection pool limits as an httpx.Limits (optional)
+        :param stages_cache: A ResponseCache for get_all_stages_by_template_id (optional).
+                             Entries are invalidated when stages or the template change.
+        :param lazy_responses: Return APIResponse envelopes that parse the body on first
+                               access instead of dictionaries (optional)
+        :param retry_policy: The RetryPolicy for failed requests. By default GET and DELETE
+                             requests are retried on transport errors and 429/502/503/504
+                             responses; pass None to disable retries.
+        :param rate_limiter: A RateLimiter shared by all API classes of this client (optional)
+        :param circuit_breaker: A CircuitBreaker shared by all API classes of this client (optional).
+                                While it is open, requests raise CircuitOpenError without being sent.
+        :param instrumentation: An Instrumentation with request hooks and per-endpoint metrics (optional)
+        :param token_manager: The token manager shared by all API classes (optional). After
+                              login(), it refreshes the token before it expires and when a
+                              request is answered with 401.
+        :param token_cache: A TokenCache that login() reads before logging in and updates
+                            afterwards, shared with other processes (optional)
+        :param coalesce_requests: Let identical GETs made concurrently (same URL, token and
+                                  headers) share one in-flight request (optional)
+        :param idempotency_store: An IdempotencyStore that answers a repeated project creation,
+                                  stage creation or stage completion with the response of the
+                                  one that already succeeded, instead of sending it (optional)
         """
         self.base_url = base_url
-        self.auth_token = auth_token
-        self.logger = get_logger()
+        self.token_manager = token_manager if token_manager is not None else TokenManager()
+        if auth_token is not None:
+            self.token_manager.token = auth_token
+        self.token_cache = token_cache
+        self.logger = get_logger(__name__)
+
+        self._owns_client = client is None
+        self.client = client if client is not None else create_http_client(timeout=timeout, limits=limits)
+
+        # Initialize API classes with base URL, auth token and the shared client
+        self.auth_management = AuthManagement(base_url, client=self.client, token_manager=self.token_manager)
+        self.stages_cache = stages_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.instrumentation = instrumentation
+        self.admin_template = AdminTemplate(base_url, client=self.client, stages_cache=stages_cache,
+                                            token_manager=self.token_manager)
+        self.admin_project = AdminProject(base_url, client=self.client, token_manager=self.token_manager)
+
+        self.single_flight = SingleFlight() if coalesce_requests else None
+
+        for api in (self.auth_management, self.admin_template, self.admin_project):
+            api.single_flight = self.single_flight
+            api.lazy_responses = lazy_responses
+            api.retry_policy = retry_policy
+            api.rate_limiter = rate_limiter
+            api.circuit_breaker = circuit_breaker
+            api.instrumentation = instrumentation
+            api.idempotency_store = idempotency_store
+
+    def close(self):
+        """
+        Close the shared HTTP client and release its pooled connections.
+        """
+        if self._owns_client:
+            self.client.close()
 
-        # Initialize API classes with base URL and auth token
-        self.auth_management = AuthManagement(base_url)
-        self.admin_template = AdminTemplate(base_url, auth_token)
-        self.admin_project = AdminProject(base_url, auth_token)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @property
-    def token(self):
-        return self.auth_token
+    def auth_token(self):
+        return self.token_manager.token
 
-    @token.setter
-    def token(self, value):
-        self.auth_token = value
+    @auth_token.setter
+    def auth_token(self, value):
+        # All API classes read the token from the shared token manager
+        self.token_manager.token = value
 
-        # Update the token in the API classes
-        self.auth_management.token = value
-        self.admin_template.token = value
-        self.admin_project.token = value
+    token = auth_token
 
     # _____________________________  Auth Management Section  _____________________________
     def login(self, email: str, password: str) -> str:
@@ -61,7 +188,16 @@ class PortalCX:
         :param password: The password of the user
         :return: The token received from the login operation
         """
-        self.token = self.auth_management.login(email, password)
+        # Keep the credentials so the token manager can log in again when the token expires
+        login = partial(self.auth_management.login, email, password)
+        if self.token_cache is not None:
+            login = self.token_cache.cached_login(self.base_url, email, login)
+
+        token = login()
+        # Only install the callback once the credentials are known to work, so a failed
+        # login is not repeated by every later request
+        self.token_manager.login = login
+        self.token = token
         return self.token
 
     def register(self, user_data: AuthManagementRegister) -> dict:
@@ -83,14 +219,16 @@ class PortalCX:
         """
         return self.admin_template.create_template_request(template_data)
 
-    def create_template_stage(self, stage_data: TemplateStageCreateRequest) -> dict:
+    def create_template_stage(self, stage_data: TemplateStageCreateRequest,
+                              idempotency_key: Optional[str] = None) -> dict:
         """
         Creates a new template stage with the provided information.
 
         :param stage_data: A TemplateStageCreateRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key sent with the request (defaults to one derived from the body)
         :return: The JSON response from the API
         """
-        return self.admin_template.create_template_stage_request(stage_data)
+        return self.admin_template.create_template_stage_request(stage_data, idempotency_key=idempotency_key)
 
     def get_all_stages_by_template_id(self, template_id: str) -> dict:
         """
@@ -99,22 +237,47 @@ class PortalCX:
         :param template_id: A UUID string of the template
         :return: The JSON response from the API
         """
-        try:
-            GetAllStagesByTemplateIdParams(templateId=template_id)
-        except ValidationError as e:
-            self.logger.error(f"Invalid template ID: {template_id}")
-            raise e
+        validate_template_id(template_id, self.logger)
 
         return self.admin_template.get_all_stages_by_template_id_request(template_id)
 
-    def complete_project_stage(self, complete_stage_data: ProjectStageCompleteRequest) -> dict:
+    def complete_project_stage(self, complete_stage_data: ProjectStageCompleteRequest,
+                               idempotency_key: Optional[str] = None) -> dict:
         """
         Completes a project stage.
 
         :param complete_stage_data: A ProjectStageCompleteRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key sent with the request (defaults to one derived from the body)
         :return: The JSON response from the API
         """
-        return self.admin_template.complete_project_stage_request(complete_stage_data=complete_stage_data)
+        return self.admin_template.complete_project_stage_request(complete_stage_data=complete_stage_data,
+                                                                  idempotency_key=idempotency_key)
+
+    def complete_project_stages_bulk(self,
+                                     stages: Iterable[ProjectStageCompleteRequest],
+                                     concurrency: int = 8,
+                                     ordered: bool = True,
+                                     journal: Optional[BulkJournal] = None) -> BulkExecutor:
+        """
+        Completes many project stages concurrently.
+
+        Completions for the same project (by projectId or portalId) are sent one at a
+        time in input order, while different projects proceed in parallel. The stages
+        are read lazily and results are yielded as the returned executor is iterated,
+        so memory use does not grow with the size of the input.
+
+        :param stages: An iterable of ProjectStageCompleteRequest objects
+        :param concurrency: The maximum number of requests in flight
+        :param ordered: Yield results in input order (True) or completion order (False)
+        :param journal: A BulkJournal that records completed stages; stages it holds are not sent again (optional)
+        :return: A BulkExecutor yielding BulkItemResult objects
+        """
+        func, skip = self.complete_project_stage, None
+        if journal is not None:
+            func = journal.recording(func, "complete_project_stage")
+            skip = partial(journal.completed_response, namespace="complete_project_stage")
+        return BulkExecutor(func, stages, concurrency=concurrency,
+                            ordered=ordered, key=project_stage_key, name="bulk stage completion", skip=skip)
 
     def delete_stage(self, template_stage_id: int) -> dict:
         """
@@ -134,16 +297,102 @@ class PortalCX:
         """
         return self.admin_template.delete_template_request(template_id)
 
+    def provision_template(self,
+                           template_data: CreateTemplate,
+                           stages: Iterable[TemplateStageCreateRequest],
+                           concurrency: int = 8,
+                           preserve_order: bool = True) -> ProvisionedTemplate:
+        """
+        Creates a template and its stages, and reads back the stage ids.
+
+        The API lists stages in the order they were created, so by default they are
+        created one at a time in the given order. With preserve_order=False up to
+        `concurrency` stages are created at once. The templateId of each stage is set
+        to the new template. If any step fails, the created stages and the template
+        are deleted and a ProvisioningError is raised.
+
+        :param template_data: A CreateTemplate object containing the template information
+        :param stages: TemplateStageCreateRequest objects, with unique stage names
+        :param concurrency: The maximum number of stage creations in flight
+        :param preserve_order: Create the stages sequentially in the given order
+        :return: A ProvisionedTemplate with the template id and a stage name to id map
+        :raise: ProvisioningError if the template could not be fully provisioned
+        """
+        stages = list(stages)
+        check_stage_names(stages)
+
+        template_id = created_template_id(self.create_template(template_data))
+        try:
+            stages = stages_for_template(template_id, stages)
+            key = (lambda stage: template_id) if preserve_order else None
+            for result in BulkExecutor(self.create_template_stage, stages, concurrency=concurrency,
+                                       key=key, name="template stage creation").run():
+                if not result.ok:
+                    raise result.error
+            return provisioned_template(template_id, stages, self.get_all_stages_by_template_id(template_id))
+        except Exception as error:
+            self.logger.error("Provisioning template %s failed: %s", template_id, error)
+            raise ProvisioningError(template_id, error, self._rollback_template(template_id)) from error
+
+    def _rollback_template(self, template_id: str) -> bool:
+        """
+        Deletes a partially provisioned template and its stages.
+
+        :return: Whether the rollback succeeded
+        """
+        try:
+            for template_stage_id in template_stage_ids(self.get_all_stages_by_template_id(template_id)):
+                self.delete_stage(template_stage_id)
+            self.delete_template(template_id)
+        except Exception as error:
+            self.logger.error("Rolling back template %s failed: %s", template_id, error)
+            return False
+        return True
+
     # _____________________________  Projects Section  _____________________________
 
-    def create_project(self, project_data: ProjectCreateRequest) -> dict:
+    def create_project(self, project_data: ProjectCreateRequest,
+                       idempotency_key: Optional[str] = None) -> dict:
         """
         Creates a new project with the provided information.
 
         :param project_data: A ProjectCreateRequest object containing the project information
+        :param idempotency_key: The Idempotency-Key sent with the request (defaults to one derived from the body)
         :return: The JSON response from the API
         """
-        return self.admin_project.create_project_request(project_data)
+        return self.admin_project.create_project_request(project_data, idempotency_key=idempotency_key)
+
+    def create_projects_bulk(self,
+                             projects: Iterable[ProjectCreateRequest],
+                             concurrency: int = 8,
+                             ordered: bool = True,
+                             journal: Optional[BulkJournal] = None) -> BulkExecutor:
+        """
+        Creates many projects, keeping up to `concurrency` requests in flight.
+
+        The projects are read lazily and the returned executor yields a BulkItemResult
+        per project as it is iterated. A failed project is reported in its result
+        (e.g. as an APIBaseError) and does not abort the batch. Throughput statistics are
+        available from the executor's `stats` once iteration completes.
+
+        With a journal, every created project is recorded with its response. Projects
+        the journal already holds are not sent again; their results carry the recorded
+        response and skipped=True, and keep their index in the input. Rerunning a job
+        that died part way with the same journal therefore only creates the projects
+        that are missing.
+
+        :param projects: An iterable of ProjectCreateRequest objects
+        :param concurrency: The maximum number of requests in flight
+        :param ordered: Yield results in input order (True) or completion order (False)
+        :param journal: A BulkJournal that records created projects; projects it holds are not sent again (optional)
+        :return: A BulkExecutor yielding BulkItemResult objects
+        """
+        func, skip = self.create_project, None
+        if journal is not None:
+            func = journal.recording(func, "create_project")
+            skip = partial(journal.completed_response, namespace="create_project")
+        return BulkExecutor(func, projects, concurrency=concurrency,
+                            ordered=ordered, name="bulk project creation", skip=skip)
 
     def delete_project(self, project_id: int) -> dict:
         """
@@ -153,3 +402,394 @@ class PortalCX:
         :return: The JSON response from the API
         """
         return self.admin_project.delete_project_request(project_id)
+
+    # _____________________________  Teardown Section  _____________________________
+
+    def teardown(self,
+                 project_ids: Iterable[int] = (),
+                 template_stage_ids: Iterable[int] = (),
+                 template_ids: Iterable[str] = (),
+                 concurrency: int = 16,
+                 progress: Optional[Callable[[str, int, int], None]] = None) -> TeardownReport:
+        """
+        Deletes projects, then template stages, then templates, each with up to
+        `concurrency` deletes in flight.
+
+        Items that no longer exist (404) count as deleted, so a teardown can be re-run
+        after a partial failure. When a phase has failures the later phases are
+        skipped rather than deleting stages or templates that are still in use.
+
+        :param project_ids: The projects to delete
+        :param template_stage_ids: The template stages to delete
+        :param template_ids: The templates to delete
+        :param concurrency: The maximum number of deletes in flight
+        :param progress: Called as progress(phase, completed, total) after each delete (optional)
+        :return: A TeardownReport with the deleted, missing and failed items per phase
+        """
+        report = TeardownReport({"projects": project_ids, "stages": template_stage_ids,
+                                 "templates": template_ids}, progress)
+        deletes = {"projects": self.delete_project, "stages": self.delete_stage, "templates": self.delete_template}
+
+        for phase in TEARDOWN_PHASES:
+            if not report.start(phase):
+                continue
+            for result in BulkExecutor(partial(delete_if_exists, deletes[phase]), report.items[phase],
+                                       concurrency=concurrency, ordered=False, name=f"teardown of {phase}"):
+                report.record(phase, result)
+
+        return report.finish()
+
+
+class AsyncPortalCX:
+    """
+    Asyncio client for the PortalCX SDK. Mirrors PortalCX with awaitable methods.
+
+    All API classes share a single httpx.AsyncClient. To keep many calls in flight on
+    one event loop, raise the pool limits accordingly, e.g.
+    ``AsyncPortalCX(base_url, limits=httpx.Limits(max_connections=1000))``.
+    """
+
+    def __init__(self,
+                 base_url,
+                 auth_token=None,
+                 client: Optional[httpx.AsyncClient] = None,
+                 timeout: Union[float, httpx.Timeout, None] = None,
+                 limits: Optional[httpx.Limits] = None,
+                 stages_cache: Optional[ResponseCache] = None,
+                 lazy_responses: bool = False,
+                 retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 token_manager: Optional[AsyncTokenManager] = None,
+                 token_cache: Optional[TokenCache] = None,
+                 coalesce_requests: bool = False,
+                 idempotency_store: Optional[IdempotencyStore] = None):
+        """
+        Initialize the async client with base URL and optional authentication token.
+
+        :param base_url: The base URL of the API
+        :param auth_token: The authentication token (optional)
+        :param client: An httpx.AsyncClient to use instead of creating one (optional).
+                       A client passed in is not closed by aclose().
+        :param timeout: Request timeout in seconds or an httpx.Timeout (optional)
+        :param limits: Connection pool limits as an httpx.Limits (optional)
+        :param stages_cache: A ResponseCache for get_all_stages_by_template_id (optional).
+                             Entries are invalidated when stages or the template change.
+        :param lazy_responses: Return APIResponse envelopes that parse the body on first
+                               access instead of dictionaries (optional)
+        :param retry_policy: The RetryPolicy for failed requests. By default GET and DELETE
+                             requests are retried on transport errors and 429/502/503/504
+                             responses; pass None to disable retries.
+        :param rate_limiter: A RateLimiter shared by all API classes of this client (optional)
+        :param circuit_breaker: A CircuitBreaker shared by all API classes of this client (optional).
+                                While it is open, requests raise CircuitOpenError without being sent.
+        :param instrumentation: An Instrumentation with request hooks and per-endpoint metrics (optional)
+        :param token_manager: The token manager shared by all API classes (optional). After
+                              login(), it refreshes the token before it expires and when a
+                              request is answered with 401.
+        :param token_cache: A TokenCache that login() reads before logging in and updates
+                            afterwards, shared with other processes (optional)
+        :param coalesce_requests: Let identical GETs made concurrently (same URL, token and
+                                  headers) share one in-flight request (optional)
+        :param idempotency_store: An IdempotencyStore that answers a repeated project creation,
+                                  stage creation or stage completion with the response of the
+                                  one that already succeeded, instead of sending it (optional)
+        """
+        self.base_url = base_url
+        self.token_manager = token_manager if token_manager is not None else AsyncTokenManager()
+        if auth_token is not None:
+            self.token_manager.token = auth_token
+        self.token_cache = token_cache
+        self.logger = get_logger(__name__)
+
+        self._owns_client = client is None
+        self.client = client if client is not None else create_async_http_client(timeout=timeout, limits=limits)
+
+        # Initialize API classes with base URL, auth token and the shared client
+        self.auth_management = AsyncAuthManagement(base_url, client=self.client, token_manager=self.token_manager)
+        self.stages_cache = stages_cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.instrumentation = instrumentation
+        self.admin_template = AsyncAdminTemplate(base_url, client=self.client, stages_cache=stages_cache,
+                                                 token_manager=self.token_manager)
+        self.admin_project = AsyncAdminProject(base_url, client=self.client, token_manager=self.token_manager)
+
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+
+        for api in (self.auth_management, self.admin_template, self.admin_project):
+            api.single_flight = self.single_flight
+            api.lazy_responses = lazy_responses
+            api.retry_policy = retry_policy
+            api.rate_limiter = rate_limiter
+            api.circuit_breaker = circuit_breaker
+            api.instrumentation = instrumentation
+            api.idempotency_store = idempotency_store
+
+    async def aclose(self):
+        """
+        Close the shared HTTP client and release its pooled connections.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @property
+    def auth_token(self):
+        return self.token_manager.token
+
+    @auth_token.setter
+    def auth_token(self, value):
+        # All API classes read the token from the shared token manager
+        self.token_manager.token = value
+
+    token = auth_token
+
+    # _____________________________  Auth Management Section  _____________________________
+    async def login(self, email: str, password: str) -> str:
+        """
+        Logs into the PortalCX API with the provided credentials.
+
+        :param email: The email of the user
+        :param password: The password of the user
+        :return: The token received from the login operation
+        """
+        # Keep the credentials so the token manager can log in again when the token expires
+        login = partial(self.auth_management.login, email, password)
+        if self.token_cache is not None:
+            login = self.token_cache.async_cached_login(self.base_url, email, login)
+
+        token = await login()
+        # Only install the callback once the credentials are known to work, so a failed
+        # login is not repeated by every later request
+        self.token_manager.login = login
+        self.token = token
+        return self.token
+
+    async def register(self, user_data: AuthManagementRegister) -> dict:
+        """
+        Registers a new user with the provided information.
+
+        :param user_data: A UserRegistration object containing the user information
+        :return: The JSON response from the API
+        """
+        return await self.auth_management.register(user_data)
+
+    # _____________________________ Templates Section  _____________________________
+    async def create_template(self, template_data: CreateTemplate) -> dict:
+        """
+        Creates a new template with the provided information.
+
+        :param template_data: A CreateTemplateRequest object containing the template information
+        :return: The JSON response from the API
+        """
+        return await self.admin_template.create_template_request(template_data)
+
+    async def create_template_stage(self, stage_data: TemplateStageCreateRequest,
+                                    idempotency_key: Optional[str] = None) -> dict:
+        """
+        Creates a new template stage with the provided information.
+
+        :param stage_data: A TemplateStageCreateRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key sent with the request (defaults to one derived from the body)
+        :return: The JSON response from the API
+        """
+        return await self.admin_template.create_template_stage_request(stage_data, idempotency_key=idempotency_key)
+
+    async def get_all_stages_by_template_id(self, template_id: str) -> dict:
+        """
+        Gets all template stages for a specific template.
+
+        :param template_id: A UUID string of the template
+        :return: The JSON response from the API
+        """
+        validate_template_id(template_id, self.logger)
+
+        return await self.admin_template.get_all_stages_by_template_id_request(template_id)
+
+    async def complete_project_stage(self, complete_stage_data: ProjectStageCompleteRequest,
+                                     idempotency_key: Optional[str] = None) -> dict:
+        """
+        Completes a project stage.
+
+        :param complete_stage_data: A ProjectStageCompleteRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key sent with the request (defaults to one derived from the body)
+        :return: The JSON response from the API
+        """
+        return await self.admin_template.complete_project_stage_request(complete_stage_data=complete_stage_data,
+                                                                        idempotency_key=idempotency_key)
+
+    def complete_project_stages_bulk(self,
+                                     stages: Iterable[ProjectStageCompleteRequest],
+                                     concurrency: int = 100,
+                                     ordered: bool = True,
+                                     journal: Optional[BulkJournal] = None) -> AsyncBulkExecutor:
+        """
+        Completes many project stages concurrently.
+
+        Consume the returned executor with ``async for``; see
+        PortalCX.complete_project_stages_bulk.
+
+        :param stages: An iterable of ProjectStageCompleteRequest objects
+        :param concurrency: The maximum number of requests in flight
+        :param ordered: Yield results in input order (True) or completion order (False)
+        :param journal: A BulkJournal that records completed stages; stages it holds are not sent again (optional)
+        :return: An AsyncBulkExecutor yielding BulkItemResult objects
+        """
+        func, skip = self.complete_project_stage, None
+        if journal is not None:
+            func = journal.async_recording(func, "complete_project_stage")
+            skip = partial(journal.completed_response, namespace="complete_project_stage")
+        return AsyncBulkExecutor(func, stages, concurrency=concurrency,
+                                 ordered=ordered, key=project_stage_key, name="bulk stage completion", skip=skip)
+
+    async def delete_stage(self, template_stage_id: int) -> dict:
+        """
+        Deletes a stage with the provided id.
+
+        :param template_stage_id: An integer containing the stage id
+        :return: The JSON response from the API
+        """
+        return await self.admin_template.delete_stage_request(template_stage_id)
+
+    async def delete_template(self, template_id: str) -> dict:
+        """
+        Deletes a template with the provided id.
+
+        :param template_id: A UUID string containing the template id
+        :return: The JSON response from the API
+        """
+        return await self.admin_template.delete_template_request(template_id)
+
+    async def provision_template(self,
+                                 template_data: CreateTemplate,
+                                 stages: Iterable[TemplateStageCreateRequest],
+                                 concurrency: int = 8,
+                                 preserve_order: bool = True) -> ProvisionedTemplate:
+        """
+        Creates a template and its stages, and reads back the stage ids.
+        See PortalCX.provision_template.
+
+        :param template_data: A CreateTemplate object containing the template information
+        :param stages: TemplateStageCreateRequest objects, with unique stage names
+        :param concurrency: The maximum number of stage creations in flight
+        :param preserve_order: Create the stages sequentially in the given order
+        :return: A ProvisionedTemplate with the template id and a stage name to id map
+        :raise: ProvisioningError if the template could not be fully provisioned
+        """
+        stages = list(stages)
+        check_stage_names(stages)
+
+        template_id = created_template_id(await self.create_template(template_data))
+        try:
+            stages = stages_for_template(template_id, stages)
+            key = (lambda stage: template_id) if preserve_order else None
+            for result in await AsyncBulkExecutor(self.create_template_stage, stages, concurrency=concurrency,
+                                                  key=key, name="template stage creation").run():
+                if not result.ok:
+                    raise result.error
+            return provisioned_template(template_id, stages,
+                                        await self.get_all_stages_by_template_id(template_id))
+        except Exception as error:
+            self.logger.error("Provisioning template %s failed: %s", template_id, error)
+            raise ProvisioningError(template_id, error, await self._rollback_template(template_id)) from error
+
+    async def _rollback_template(self, template_id: str) -> bool:
+        """
+        Deletes a partially provisioned template and its stages.
+
+        :return: Whether the rollback succeeded
+        """
+        try:
+            response_data = await self.get_all_stages_by_template_id(template_id)
+            for template_stage_id in template_stage_ids(response_data):
+                await self.delete_stage(template_stage_id)
+            await self.delete_template(template_id)
+        except Exception as error:
+            self.logger.error("Rolling back template %s failed: %s", template_id, error)
+            return False
+        return True
+
+    # _____________________________  Projects Section  _____________________________
+
+    async def create_project(self, project_data: ProjectCreateRequest,
+                             idempotency_key: Optional[str] = None) -> dict:
+        """
+        Creates a new project with the provided information.
+
+        :param project_data: A ProjectCreateRequest object containing the project information
+        :param idempotency_key: The Idempotency-Key sent with the request (defaults to one derived from the body)
+        :return: The JSON response from the API
+        """
+        return await self.admin_project.create_project_request(project_data, idempotency_key=idempotency_key)
+
+    def create_projects_bulk(self,
+                             projects: Iterable[ProjectCreateRequest],
+                             concurrency: int = 100,
+                             ordered: bool = True,
+                             journal: Optional[BulkJournal] = None) -> AsyncBulkExecutor:
+        """
+        Creates many projects, keeping up to `concurrency` requests in flight.
+
+        Consume the returned executor with ``async for``; see PortalCX.create_projects_bulk.
+
+        :param projects: An iterable of ProjectCreateRequest objects
+        :param concurrency: The maximum number of requests in flight
+        :param ordered: Yield results in input order (True) or completion order (False)
+        :param journal: A BulkJournal that records created projects; projects it holds are not sent again (optional)
+        :return: An AsyncBulkExecutor yielding BulkItemResult objects
+        """
+        func, skip = self.create_project, None
+        if journal is not None:
+            func = journal.async_recording(func, "create_project")
+            skip = partial(journal.completed_response, namespace="create_project")
+        return AsyncBulkExecutor(func, projects, concurrency=concurrency,
+                                 ordered=ordered, name="bulk project creation", skip=skip)
+
+    async def delete_project(self, project_id: int) -> dict:
+        """
+        Deletes a project with the provided id.
+
+        :param project_id: An integer containing the project id
+        :return: The JSON response from the API
+        """
+        return await self.admin_project.delete_project_request(project_id)
+
+    # _____________________________  Teardown Section  _____________________________
+
+    async def teardown(self,
+                       project_ids: Iterable[int] = (),
+                       template_stage_ids: Iterable[int] = (),
+                       template_ids: Iterable[str] = (),
+                       concurrency: int = 16,
+                       progress: Optional[Callable[[str, int, int], None]] = None) -> TeardownReport:
+        """
+        Deletes projects, then template stages, then templates, each with up to
+        `concurrency` deletes in flight. See PortalCX.teardown.
+
+        :param project_ids: The projects to delete
+        :param template_stage_ids: The template stages to delete
+        :param template_ids: The templates to delete
+        :param concurrency: The maximum number of deletes in flight
+        :param progress: Called as progress(phase, completed, total) after each delete (optional)
+        :return: A TeardownReport with the deleted, missing and failed items per phase
+        """
+        report = TeardownReport({"projects": project_ids, "stages": template_stage_ids,
+                                 "templates": template_ids}, progress)
+        deletes = {"projects": self.delete_project, "stages": self.delete_stage, "templates": self.delete_template}
+
+        for phase in TEARDOWN_PHASES:
+            if not report.start(phase):
+                continue
+            async for result in AsyncBulkExecutor(partial(async_delete_if_exists, deletes[phase]),
+                                                  report.items[phase], concurrency=concurrency, ordered=False,
+                                                  name=f"teardown of {phase}"):
+                report.record(phase, result)
+
+        return report.finish()
@@ -0,0 +1,14 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+portalcx/__main__.py
+--------------------
+Runs the `portalcx` console command as `python -m portalcx`.
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -7,10 +7,15 @@ api/admin_projects.py
 This module represents all API calls in the /api/Admin/Project section.
 """
 
-from typing import Dict
+import logging
+from typing import Dict, Optional
+
+import httpx
 
 from portalcx.models.admin_project_models import ProjectCreateRequest
-from .api_base import APIBase
+from ..utils.idempotency import derive_idempotency_key
+from ..utils.token_manager import AsyncTokenManager, TokenManager
+from .api_base import APIBase, AsyncAPIBase, json_body
 
 
 class AdminProject(APIBase):
@@ -18,35 +23,39 @@ class AdminProject(APIBase):
     Class for managing template-related operations.
     """
 
-    def __init__(self, base_url: str, token: str = None):
-        super().__init__(base_url)
-        self.token = token
-        
-    def create_project_request(self, project_data: ProjectCreateRequest) -> Dict:
+    def __init__(self, base_url: str, token: str = None, client: httpx.Client = None,
+                 token_manager: Optional[TokenManager] = None):
+        super().__init__(base_url, token, client=client, token_manager=token_manager)
+
+    def create_project_request(self, project_data: ProjectCreateRequest,
+                               idempotency_key: Optional[str] = None) -> Dict:
         """
         Creates a new project with the provided information.
 
         :param project_data: A CreateProject object containing the project information
+        :param idempotency_key: The Idempotency-Key of the request (defaults to one derived from the body)
         :return: The JSON response from the API
         :raise: APIBaseError if the request fails
         """
         create_project_url = "/api/Admin/Project/CreateProject"
-        headers = {'Authorization': f'Bearer {self.token}'}
 
-        self.logger.info(
-            f"Creating a new project for {project_data.firstName} {project_data.lastName}"
-            f" and phone number {project_data.phoneNumber} using the template id:"
-            f" {project_data.templateId}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Creating a new project for %s %s and phone number %s using the template id: %s",
+                project_data.firstName, project_data.lastName, project_data.phoneNumber, project_data.templateId
+            )
 
         # Convert to JSON
-        project_data_dict = project_data.to_dict()
+        project_body = json_body(project_data)
+
+        if idempotency_key is None:
+            idempotency_key = derive_idempotency_key(create_project_url, project_body['content'])
 
         # Make the request and process the response
         response_data = self.request("POST",
                                     create_project_url,
-                                    json=project_data_dict,
-                                    headers=headers)
+                                    idempotency_key=idempotency_key,
+                                    **project_body)
 
         self.logger.info("Successfully created a new project")
 
@@ -61,13 +70,73 @@ class AdminProject(APIBase):
         :raise: APIBaseError if the request fails
         """
         delete_project_url = f"/api/Admin/Project/DeleteProject?projectId={project_id}"
-        headers = {'Authorization': f'Bearer {self.token}'}
 
-        self.logger.info(f"Deleting project with id: {project_id}")
+        self.logger.info("Deleting project with id: %s", project_id)
+
+        # Make the request and process the response
+        response_data = self.request("DELETE", delete_project_url)
+
+        self.logger.info("Successfully deleted project: %s", project_id)
+
+        return response_data
+
+
+class AsyncAdminProject(AsyncAPIBase):
+    """
+    Asyncio counterpart of AdminProject.
+    """
+
+    def __init__(self, base_url: str, token: str = None, client: httpx.AsyncClient = None,
+                 token_manager: Optional[AsyncTokenManager] = None):
+        super().__init__(base_url, token, client=client, token_manager=token_manager)
+
+    async def create_project_request(self, project_data: ProjectCreateRequest,
+                                     idempotency_key: Optional[str] = None) -> Dict:
+        """
+        Creates a new project with the provided information.
+
+        :param project_data: A CreateProject object containing the project information
+        :param idempotency_key: The Idempotency-Key of the request (defaults to one derived from the body)
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        create_project_url = "/api/Admin/Project/CreateProject"
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Creating a new project for %s %s and phone number %s using the template id: %s",
+                project_data.firstName, project_data.lastName, project_data.phoneNumber, project_data.templateId
+            )
+
+        project_body = json_body(project_data)
+        if idempotency_key is None:
+            idempotency_key = derive_idempotency_key(create_project_url, project_body['content'])
+
+        # Make the request and process the response
+        response_data = await self.request("POST",
+                                           create_project_url,
+                                           idempotency_key=idempotency_key,
+                                           **project_body)
+
+        self.logger.info("Successfully created a new project")
+
+        return response_data
+
+    async def delete_project_request(self, project_id: int) -> Dict:
+        """
+        Delete a project.
+
+        :param project_id: An integer containing the project id
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        delete_project_url = f"/api/Admin/Project/DeleteProject?projectId={project_id}"
+
+        self.logger.info("Deleting project with id: %s", project_id)
 
         # Make the request and process the response
-        response_data = self.request("DELETE", delete_project_url, headers=headers)
+        response_data = await self.request("DELETE", delete_project_url)
 
-        self.logger.info(f"Successfully deleted project: {project_id}")
+        self.logger.info("Successfully deleted project: %s", project_id)
 
         return response_data
@@ -7,15 +7,118 @@ api/admin_templates.py
 This module represents all API calls in the /api/Admin/Template section.
 """
 
-from typing import Dict
+from contextlib import ExitStack
+from typing import Dict, List, Optional
+
+import httpx
 
 from portalcx.models.admin_template_models import (
     CreateTemplate,
+    FileUpload,
     TemplateStageCreateRequest,
     ProjectStageCompleteRequest
 )
 
-from .api_base import APIBase
+from ..utils.cache import ResponseCache
+from ..utils.idempotency import derive_idempotency_key
+from ..utils.token_manager import AsyncTokenManager, TokenManager
+from .api_base import APIBase, AsyncAPIBase, json_body
+
+
+def template_multipart_data(template_data: CreateTemplate, files: ExitStack) -> Dict:
+    """
+    Convert a CreateTemplate object into the multipart/form-data fields expected by
+    the CreateTemplate endpoint.
+
+    FileUpload values become file parts with their filename and content type. They
+    are opened on `files` and streamed in chunks when the request is sent.
+
+    :param template_data: A CreateTemplateRequest object containing the template information
+    :param files: Closes the files opened for the request
+    :return: A dictionary of multipart fields
+    """
+    multipart_data = {}
+    for key, value in template_data.to_dict().items():
+        if isinstance(value, FileUpload):
+            multipart_data[key] = (value.filename, files.enter_context(value.open()), value.content_type)
+        else:
+            multipart_data[key] = ('', str(value))
+    return multipart_data
+
+
+def created_template_id(response_data: Dict) -> str:
+    """
+    Extract the new template id from a CreateTemplate response, which is the id as a
+    JSON string.
+
+    :param response_data: The processed response
+    :return: The template id
+    :raise: ValueError if the response holds no template id
+    """
+    template_id = response_data.get('data')
+    if not isinstance(template_id, str):
+        template_id = response_data.get('message') or ''
+    template_id = template_id.strip().strip('"')
+    if not template_id:
+        raise ValueError("The CreateTemplate response did not contain a template id")
+    return template_id
+
+
+def template_stages(response_data: Dict) -> List[Dict]:
+    """
+    Extract the stage objects from a GetAllStagesByTemplateId response.
+
+    :param response_data: The processed response
+    :return: A list of stage dictionaries
+    """
+    data = response_data.get('data')
+    if isinstance(data, dict):
+        data = data.get('templateStages', data.get('data'))
+        if isinstance(data, dict):
+            data = data.get('templateStages')
+    if not isinstance(data, list):
+        return []
+    return [stage for stage in data if isinstance(stage, dict)]
+
+
+def template_stage_ids(response_data: Dict) -> List:
+    """
+    Extract the templateStageId values from a GetAllStagesByTemplateId response.
+
+    :param response_data: The processed response
+    :return: A list of stage ids
+    """
+    return [stage.get('templateStageId') for stage in template_stages(response_data)]
+
+
+def stage_ids_by_name(response_data: Dict) -> Dict[str, int]:
+    """
+    Map stage names to templateStageId values from a GetAllStagesByTemplateId response.
+
+    :param response_data: The processed response
+    :return: A dictionary of stage name to stage id
+    """
+    return {stage['stageName']: stage['templateStageId'] for stage in template_stages(response_data)
+            if 'stageName' in stage and 'templateStageId' in stage}
+
+
+def invalidate_template_stages(stages_cache: Optional[ResponseCache], template_id: str):
+    """
+    Drop the cached stages of a template.
+    """
+    if stages_cache is not None:
+        stages_cache.invalidate(template_id)
+
+
+def invalidate_stage(stages_cache: Optional[ResponseCache], template_stage_id: int):
+    """
+    Drop the cached stages of whichever template contains the given stage.
+    """
+    if stages_cache is None:
+        return
+    template_id = stages_cache.find(lambda response_data: template_stage_id in template_stage_ids(response_data))
+    if template_id is not None:
+        stages_cache.invalidate(template_id)
 
 
 class AdminTemplate(APIBase):
@@ -23,9 +126,14 @@ class AdminTemplate(APIBase):
     Class for managing template-related operations.
     """
 
-    def __init__(self, base_url: str, token: str = None):
-        super().__init__(base_url)
-        self.token = token
+    def __init__(self,
+                 base_url: str,
+                 token: str = None,
+                 client: httpx.Client = None,
+                 stages_cache: Optional[ResponseCache] = None,
+                 token_manager: Optional[TokenManager] = None):
+        super().__init__(base_url, token, client=client, token_manager=token_manager)
+        self.stages_cache = stages_cache
 
     def create_template_request(self, template_data: CreateTemplate) -> Dict:
         """
@@ -36,47 +144,51 @@ class AdminTemplate(APIBase):
         :raise: APIBaseError if the request fails
         """
         create_template_url = "/api/Admin/Template/CreateTemplate"
-        headers = {'Authorization': f'Bearer {self.token}'}
 
-        self.logger.info(f"Creating a new template with title: {template_data.templateName}")
+        self.logger.info("Creating a new template with title: %s", template_data.templateName)
 
-        # Convert to JSON
-        template_data_dict = template_data.to_dict()
+        # Prepare multipart/form-data body; logo files are streamed and closed afterwards
+        with ExitStack() as files:
+            multipart_data = template_multipart_data(template_data, files)
 
-        # Prepare multipart/form-data body
-        multipart_data = {key: ('', str(value)) for key, value in template_data_dict.items()}
+            # Make the request and process the response
+            response_data = self.request("POST",
+                                         create_template_url,
+                                         files=multipart_data)
 
-        # Make the request and process the response
-        response_data = self.request("POST",
-                                     create_template_url,
-                                     files=multipart_data,
-                                     headers=headers)
-        
         self.logger.info("Successfully created a new template")
 
         return response_data
 
-    def create_template_stage_request(self, stage_data: TemplateStageCreateRequest) -> Dict:
+    def create_template_stage_request(self, stage_data: TemplateStageCreateRequest,
+                                      idempotency_key: Optional[str] = None) -> Dict:
         """
         Creates a new template stage with the provided information.
 
         :param stage_data: A TemplateStageCreateRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key of the request (defaults to one derived from the body)
         :return: The JSON response from the API
         :raise: APIBaseError if the request fails
         """
         create_stage_url = "/api/Admin/Template/CreateStage"
-        headers = {'Authorization': f'Bearer {self.token}'}
 
-        self.logger.info(f"Creating a new template stage with name: {stage_data.stageName} for template id: {stage_data.templateId}")
+        self.logger.info("Creating a new template stage with name: %s for template id: %s",
+                         stage_data.stageName, stage_data.templateId)
 
         # Convert to JSON
-        stage_data_dict = stage_data.to_dict()
+        stage_body = json_body(stage_data)
+
+        if idempotency_key is None:
+            idempotency_key = derive_idempotency_key(create_stage_url, stage_body['content'])
 
         # Make the request and process the response
-        response_data = self.request("POST",
-                                     create_stage_url,
-                                     json=stage_data_dict,
-                                     headers=headers)
+        try:
+            response_data = self.request("POST",
+                                         create_stage_url,
+                                         idempotency_key=idempotency_key,
+                                         **stage_body)
+        finally:
+            invalidate_template_stages(self.stages_cache, stage_data.templateId)
 
         self.logger.info("Successfully created a new template stage")
 
@@ -89,42 +201,73 @@ class AdminTemplate(APIBase):
         :return: The JSON response from the API
         :raise: APIBaseError if the request fails
         """
-        headers = {'Authorization': f'Bearer {self.token}'}
 
         get_stages_url = f"/api/Admin/Template/GetAllStagesByTemplateId?templateId={template_id}"
 
-        self.logger.info(f"Getting all stages for Template Id: {template_id}")
+        self.logger.info("Getting all stages for Template Id: %s", template_id)
     
         # Make the request and process the response
-        response_data = self.request("GET", get_stages_url, headers=headers)
+        if self.stages_cache is None:
+            response_data = self.request("GET", get_stages_url)
+        else:
+            response_data = self._get_cached_stages(template_id, get_stages_url)
         
         self.logger.info("Successfully retrieved template stages")
 
         return response_data
 
-    def complete_project_stage_request(self, complete_stage_data: ProjectStageCompleteRequest) -> Dict:
+    def _get_cached_stages(self, template_id: str, get_stages_url: str) -> Dict:
+        """
+        Serve template stages from the stages cache, revalidating stale entries with a
+        conditional request when the API supplied an ETag or Last-Modified header.
+        """
+        response_data, conditional_headers = self.stages_cache.lookup(template_id)
+        if response_data is not None:
+            self.logger.info("Using cached stages for Template Id: %s", template_id)
+            return response_data
+
+        generation = self.stages_cache.generation
+        response = self.send("GET", get_stages_url, headers=dict(conditional_headers))
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            response_data = self.stages_cache.revalidated(template_id)
+            if response_data is not None:
+                return response_data
+            # The entry was invalidated while the request was in flight
+            response = self.send("GET", get_stages_url)
+
+        response_data = self.process_response(response)
+        self.stages_cache.store(template_id, response_data, response, generation)
+
+        return response_data
+
+    def complete_project_stage_request(self, complete_stage_data: ProjectStageCompleteRequest,
+                                       idempotency_key: Optional[str] = None) -> Dict:
         """
         Complete a project stage.
 
         :param complete_stage_data: A ProjectStageCompleteRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key of the request (defaults to one derived from the body)
         :return: The JSON response from the API
         :raise: APIBaseError if the request fails
         """
         complete_stage_url = "/api/Admin/Project/CompleteProjectStage"
-        headers = {'Authorization': f'Bearer {self.token}'}
 
-        self.logger.info(f"Setting stage {complete_stage_data.completedStageLabel} to Complete")
+        self.logger.info("Setting stage %s to Complete", complete_stage_data.completedStageLabel)
 
         # Convert to JSON
-        complete_stage_data_dict = complete_stage_data.to_dict()
+        complete_stage_body = json_body(complete_stage_data)
+
+        if idempotency_key is None:
+            idempotency_key = derive_idempotency_key(complete_stage_url, complete_stage_body['content'])
 
         # Make the request and process the response
         response_data = self.request("POST",
                                      complete_stage_url,
-                                     json=complete_stage_data_dict,
-                                     headers=headers)
+                                     idempotency_key=idempotency_key,
+                                     **complete_stage_body)
 
-        self.logger.info(f"Successfully completed stage: {complete_stage_data.completedStageLabel}")
+        self.logger.info("Successfully completed stage: %s", complete_stage_data.completedStageLabel)
 
         return response_data
 
@@ -137,14 +280,16 @@ class AdminTemplate(APIBase):
         :raise: APIBaseError if the request fails
         """
         delete_stage_url = f"/api/Admin/Template/DeleteStage?templateStageId={template_stage_id}"
-        headers = {'Authorization': f'Bearer {self.token}'}
 
-        self.logger.info(f"Deleting stage with id: {template_stage_id}")
+        self.logger.info("Deleting stage with id: %s", template_stage_id)
 
         # Make the request and process the response
-        response_data = self.request("DELETE", delete_stage_url, headers=headers)
+        try:
+            response_data = self.request("DELETE", delete_stage_url)
+        finally:
+            invalidate_stage(self.stages_cache, template_stage_id)
 
-        self.logger.info(f"Successfully deleted stage: {template_stage_id}")
+        self.logger.info("Successfully deleted stage: %s", template_stage_id)
 
         return response_data
 
@@ -157,13 +302,203 @@ class AdminTemplate(APIBase):
         :raise: APIBaseError if the request fails
         """
         delete_template_url = f"/api/Admin/Template/DeleteTemplate?templateId={template_id}"
-        headers = {'Authorization': f'Bearer {self.token}'}
 
-        self.logger.info(f"Deleting template with id: {template_id}")
+        self.logger.info("Deleting template with id: %s", template_id)
+
+        # Make the request and process the response
+        try:
+            response_data = self.request("DELETE", delete_template_url)
+        finally:
+            invalidate_template_stages(self.stages_cache, template_id)
+
+        self.logger.info("Successfully deleted template: %s", template_id)
+
+        return response_data
+
+
+class AsyncAdminTemplate(AsyncAPIBase):
+    """
+    Asyncio counterpart of AdminTemplate.
+    """
+
+    def __init__(self,
+                 base_url: str,
+                 token: str = None,
+                 client: httpx.AsyncClient = None,
+                 stages_cache: Optional[ResponseCache] = None,
+                 token_manager: Optional[AsyncTokenManager] = None):
+        super().__init__(base_url, token, client=client, token_manager=token_manager)
+        self.stages_cache = stages_cache
+
+    async def create_template_request(self, template_data: CreateTemplate) -> Dict:
+        """
+        Creates a new template with the provided information.
+
+        :param template_data: A CreateTemplateRequest object containing the template information
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        create_template_url = "/api/Admin/Template/CreateTemplate"
+
+        self.logger.info("Creating a new template with title: %s", template_data.templateName)
+
+        # Make the request and process the response; logo files are streamed and closed afterwards
+        with ExitStack() as files:
+            response_data = await self.request("POST",
+                                               create_template_url,
+                                               files=template_multipart_data(template_data, files))
+
+        self.logger.info("Successfully created a new template")
+
+        return response_data
+
+    async def create_template_stage_request(self, stage_data: TemplateStageCreateRequest,
+                                            idempotency_key: Optional[str] = None) -> Dict:
+        """
+        Creates a new template stage with the provided information.
+
+        :param stage_data: A TemplateStageCreateRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key of the request (defaults to one derived from the body)
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        create_stage_url = "/api/Admin/Template/CreateStage"
+
+        self.logger.info("Creating a new template stage with name: %s for template id: %s",
+                         stage_data.stageName, stage_data.templateId)
+
+        stage_body = json_body(stage_data)
+        if idempotency_key is None:
+            idempotency_key = derive_idempotency_key(create_stage_url, stage_body['content'])
+
+        # Make the request and process the response
+        try:
+            response_data = await self.request("POST",
+                                               create_stage_url,
+                                               idempotency_key=idempotency_key,
+                                               **stage_body)
+        finally:
+            invalidate_template_stages(self.stages_cache, stage_data.templateId)
+
+        self.logger.info("Successfully created a new template stage")
+
+        return response_data
+
+    async def get_all_stages_by_template_id_request(self, template_id: str) -> Dict:
+        """
+        Gets all template stages for a specific template.
+
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+
+        get_stages_url = f"/api/Admin/Template/GetAllStagesByTemplateId?templateId={template_id}"
+
+        self.logger.info("Getting all stages for Template Id: %s", template_id)
+
+        # Make the request and process the response
+        if self.stages_cache is None:
+            response_data = await self.request("GET", get_stages_url)
+        else:
+            response_data = await self._get_cached_stages(template_id, get_stages_url)
+
+        self.logger.info("Successfully retrieved template stages")
+
+        return response_data
+
+    async def _get_cached_stages(self, template_id: str, get_stages_url: str) -> Dict:
+        """
+        Serve template stages from the stages cache, revalidating stale entries with a
+        conditional request when the API supplied an ETag or Last-Modified header.
+        """
+        response_data, conditional_headers = self.stages_cache.lookup(template_id)
+        if response_data is not None:
+            self.logger.info("Using cached stages for Template Id: %s", template_id)
+            return response_data
+
+        generation = self.stages_cache.generation
+        response = await self.send("GET", get_stages_url, headers=dict(conditional_headers))
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            response_data = self.stages_cache.revalidated(template_id)
+            if response_data is not None:
+                return response_data
+            # The entry was invalidated while the request was in flight
+            response = await self.send("GET", get_stages_url)
+
+        response_data = self.process_response(response)
+        self.stages_cache.store(template_id, response_data, response, generation)
+
+        return response_data
+
+    async def complete_project_stage_request(self, complete_stage_data: ProjectStageCompleteRequest,
+                                             idempotency_key: Optional[str] = None) -> Dict:
+        """
+        Complete a project stage.
+
+        :param complete_stage_data: A ProjectStageCompleteRequest object containing the stage information
+        :param idempotency_key: The Idempotency-Key of the request (defaults to one derived from the body)
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        complete_stage_url = "/api/Admin/Project/CompleteProjectStage"
+
+        self.logger.info("Setting stage %s to Complete", complete_stage_data.completedStageLabel)
+
+        complete_stage_body = json_body(complete_stage_data)
+        if idempotency_key is None:
+            idempotency_key = derive_idempotency_key(complete_stage_url, complete_stage_body['content'])
+
+        # Make the request and process the response
+        response_data = await self.request("POST",
+                                           complete_stage_url,
+                                           idempotency_key=idempotency_key,
+                                           **complete_stage_body)
+
+        self.logger.info("Successfully completed stage: %s", complete_stage_data.completedStageLabel)
+
+        return response_data
+
+    async def delete_stage_request(self, template_stage_id: int) -> Dict:
+        """
+        Delete a stage.
+
+        :param template_stage_id: An integer containing the stage id
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        delete_stage_url = f"/api/Admin/Template/DeleteStage?templateStageId={template_stage_id}"
+
+        self.logger.info("Deleting stage with id: %s", template_stage_id)
+
+        # Make the request and process the response
+        try:
+            response_data = await self.request("DELETE", delete_stage_url)
+        finally:
+            invalidate_stage(self.stages_cache, template_stage_id)
+
+        self.logger.info("Successfully deleted stage: %s", template_stage_id)
+
+        return response_data
+
+    async def delete_template_request(self, template_id: str) -> Dict:
+        """
+        Delete a template.
+
+        :param template_id: A UUID string containing the template id
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        delete_template_url = f"/api/Admin/Template/DeleteTemplate?templateId={template_id}"
+
+        self.logger.info("Deleting template with id: %s", template_id)
 
         # Make the request and process the response
-        response_data = self.request("DELETE", delete_template_url, headers=headers)
+        try:
+            response_data = await self.request("DELETE", delete_template_url)
+        finally:
+            invalidate_template_stages(self.stages_cache, template_id)
 
-        self.logger.info(f"Successfully deleted template: {template_id}")
+        self.logger.info("Successfully deleted template: %s", template_id)
 
-        return response_data
\ No newline at end of file
+        return response_data
@@ -7,15 +7,91 @@ api/api_base.py
 Base class for API integration in the Azure Python Function App.
 """
 
+import asyncio
+import re
+import time
 from abc import ABC
-from json import JSONDecodeError
-from typing import Union
+from collections.abc import Mapping
+from typing import Any, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 import httpx
 import orjson
 from orjson import JSONDecodeError as OrjsonDecodeError
 
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.idempotency import IDEMPOTENCY_HEADER, IdempotencyStore
+from ..utils.instrumentation import Instrumentation, RequestTiming
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import RateLimiter
+from ..utils.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from ..utils.singleflight import AsyncSingleFlight, SingleFlight
+from ..utils.token_manager import AsyncTokenManager, TokenManager
+
+# Defaults for the shared connection pool. The timeout matches httpx's own default.
+DEFAULT_TIMEOUT = httpx.Timeout(5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=100,
+                              max_keepalive_connections=20,
+                              keepalive_expiry=30.0)
+
+
+# Matches a body whose first non-whitespace byte opens a JSON object or array
+_JSON_BODY_START = re.compile(rb'[ \t\r\n]*[{\[]')
+
+
+def is_json_body(content: bytes) -> bool:
+    """
+    Check whether a response body holds a JSON object or array by looking at its
+    first non-whitespace byte, without decoding or copying the body.
+
+    :param content: The raw response body
+    :return: True if the body should be parsed as JSON
+    """
+    return _JSON_BODY_START.match(content) is not None
+
+
+def json_body(model) -> dict:
+    """
+    The request keyword arguments that send a model as a JSON body, encoded by the
+    model's cached serializer (see BaseModel.to_json).
+
+    :param model: A portalcx model
+    :return: The 'content' and 'headers' arguments for request()
+    :raise: TypeError if the model holds a value with no JSON form, such as a FileUpload
+    """
+    return {'content': model.to_json(), 'headers': {'Content-Type': 'application/json'}}
+
+
+def create_http_client(timeout: Union[float, httpx.Timeout, None] = None,
+                       limits: Optional[httpx.Limits] = None,
+                       **kwargs) -> httpx.Client:
+    """
+    Create a pooled httpx client suitable for sharing between API classes.
+
+    :param timeout: Request timeout in seconds or an httpx.Timeout (defaults to DEFAULT_TIMEOUT)
+    :param limits: Connection pool limits (defaults to DEFAULT_LIMITS)
+    :param kwargs: Additional arguments to pass to httpx.Client
+    :return: A new httpx.Client
+    """
+    return httpx.Client(timeout=DEFAULT_TIMEOUT if timeout is None else timeout,
+                        limits=limits or DEFAULT_LIMITS,
+                        **kwargs)
+
+
+def create_async_http_client(timeout: Union[float, httpx.Timeout, None] = None,
+                             limits: Optional[httpx.Limits] = None,
+                             **kwargs) -> httpx.AsyncClient:
+    """
+    Create a pooled httpx async client suitable for sharing between async API classes.
+
+    :param timeout: Request timeout in seconds or an httpx.Timeout (defaults to DEFAULT_TIMEOUT)
+    :param limits: Connection pool limits (defaults to DEFAULT_LIMITS)
+    :param kwargs: Additional arguments to pass to httpx.AsyncClient
+    :return: A new httpx.AsyncClient
+    """
+    return httpx.AsyncClient(timeout=DEFAULT_TIMEOUT if timeout is None else timeout,
+                             limits=limits or DEFAULT_LIMITS,
+                             **kwargs)
 
 
 class APIBaseError(Exception):
@@ -35,28 +111,181 @@ class APIBaseError(Exception):
         super().__init__(f"API Error (Code: {status_code}): {error_message}")
 
 
+class CircuitOpenError(APIBaseError):
+    """
+    Raised instead of sending a request while the circuit for its host is open.
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        """
+        :param host: The host whose circuit is open
+        :param retry_after: Seconds until the circuit allows trial requests again
+        """
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(None, f"Circuit open for {host}; retry in {retry_after:.1f}s")
+
+
+class APIResponse(Mapping):
+    """
+    Lightweight, read-only response envelope that keeps the raw body and parses it
+    only when 'data' or 'message' is first read.
+
+    It behaves like the {"status", "message", "data"} dictionary returned by default,
+    so ``response_data['data']`` keeps working. Callers that never read the body, such
+    as DELETE cleanups, skip parsing it. Malformed JSON raises ValueError when 'data'
+    is first read instead of when the request completes.
+    """
+    __slots__ = ("status", "_content", "_encoding", "_data", "_message")
+
+    _KEYS = ("status", "message", "data")
+    _UNSET = object()
+
+    def __init__(self, status: int, content: bytes, encoding: str = "utf-8"):
+        """
+        :param status: The HTTP status code
+        :param content: The raw response body
+        :param encoding: The text encoding of the body
+        """
+        self.status = status
+        self._content = content
+        self._encoding = encoding
+        self._data = self._UNSET
+        self._message = self._UNSET
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def data(self) -> Any:
+        if self._data is self._UNSET:
+            self._parse()
+        return self._data
+
+    @property
+    def message(self) -> str:
+        if self._message is self._UNSET:
+            self._parse()
+        return self._message
+
+    def _parse(self):
+        if is_json_body(self._content):
+            try:
+                self._data = orjson.loads(self._content)
+            except OrjsonDecodeError:
+                raise ValueError("Error parsing JSON")
+            self._message = ""
+        else:
+            self._data = None
+            self._message = self._content.decode(self._encoding, errors="replace")
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "status":
+            return self.status
+        if key == "message":
+            return self.message
+        if key == "data":
+            return self.data
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def __repr__(self):
+        return f"APIResponse(status={self.status}, bytes={len(self._content)})"
+
+
 class APIBase(ABC):
     """
     Base class for API integration.
     """
-    def __init__(self, base_url, auth_token=None):
+    # Return APIResponse envelopes instead of dictionaries from parse_response_data
+    lazy_responses = False
+    # Retries for failed requests; None disables them
+    retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY
+    # Client-side pacing shared by the API classes of one client; None disables it
+    rate_limiter: Optional[RateLimiter] = None
+    # Per-host circuit breaker shared by the API classes of one client; None disables it
+    circuit_breaker: Optional[CircuitBreaker] = None
+    # Request hooks and per-endpoint metrics shared by the API classes of one client; None disables them
+    instrumentation: Optional[Instrumentation] = None
+    # Coalesces identical concurrent GETs across the API classes of one client; None disables it
+    single_flight: Optional[SingleFlight] = None
+    # Suppresses repeated keyed POSTs across the API classes of one client; None disables it
+    idempotency_store: Optional[IdempotencyStore] = None
+    # Whether requests carry the bearer token; the login endpoints do not
+    authenticated = True
+
+    def __init__(self, base_url, auth_token=None, client: Optional[httpx.Client] = None,
+                 token_manager: Optional[TokenManager] = None):
         """
         Initialize the API base class with base URL and optional authentication token.
 
         :param base_url: The base URL of the API
         :param auth_token: The authentication token (optional)
+        :param client: A shared httpx client (optional). When omitted, a pooled client
+                       is created on first use and closed by close().
+        :param token_manager: A TokenManager shared with other API classes (optional).
+                              When omitted, one holding auth_token is created.
         """
         self.base_url = base_url
-        self._auth_token = auth_token
-        self.logger = get_logger()
+        self.token_manager = token_manager if token_manager is not None else self._create_token_manager()
+        if auth_token is not None:
+            self.token_manager.token = auth_token
+        self._client = client
+        self._owns_client = client is None
+        self.logger = get_logger(type(self).__module__)
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        The httpx client used to send requests. Connections are kept alive and reused
+        between calls.
+        """
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.Client:
+        """
+        Create the client used when none was supplied to the constructor.
+        """
+        return create_http_client()
+
+    def _create_token_manager(self) -> TokenManager:
+        """
+        Create the token manager used when none was supplied to the constructor.
+        """
+        return TokenManager()
+
+    def close(self):
+        """
+        Close the underlying client if it is owned by this instance.
+        """
+        if self._owns_client and self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @property
     def auth_token(self):
-        return self._auth_token
+        return self.token_manager.token
 
     @auth_token.setter
     def auth_token(self, value):
-        self._auth_token = value
+        self.token_manager.token = value
+
+    # The name used by the API classes; both read and write the shared token
+    token = auth_token
 
     def get(self, endpoint, **kwargs):
         """
@@ -88,18 +317,13 @@ class APIBase(ABC):
 
         :param method: The HTTP method to use (e.g., 'GET', 'POST', etc.)
         :param endpoint: The API endpoint to call
-        :param kwargs: Additional arguments to pass to the httpx.request method
+        :param kwargs: Additional arguments to pass to the httpx.Client.request method
         :return: The JSON response from the API
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = kwargs.pop('headers', {})
-
-        # Add the authentication token to headers if it exists
-        if self.auth_token:
-            headers['Authorization'] = f"Bearer {self.auth_token}"
+        url, headers = self.prepare_request(endpoint, kwargs)
 
         # Use httpx to make the request
-        response = httpx.request(method, url, headers=headers, **kwargs)
+        response = self.client.request(method, url, headers=headers, **kwargs)
 
         # Process the JSON response using process_response method
         return self.process_response(response)
@@ -112,6 +336,16 @@ class APIBase(ABC):
         :return: The JSON response data
         :raise: APIBaseError if the request fails
         """
+        if self.instrumentation is None:
+            return self._process_response(response)
+
+        started_at = time.perf_counter()
+        try:
+            return self._process_response(response)
+        finally:
+            self.instrumentation.record_parse(response.request.url.path, time.perf_counter() - started_at)
+
+    def _process_response(self, response: httpx.Response) -> dict:
         if response.status_code not in [200, 204]:  # add other success status codes if needed
             self.handle_error_response(response)
 
@@ -125,68 +359,376 @@ class APIBase(ABC):
         :raise: APIBaseError
         """
         response_data = self.parse_response_data(response)
-        self.logger.error(f"API request failed: {response_data.get('errorMessage', 'Unknown error')}")
+        self.logger.error("API request failed: %s", response_data.get('errorMessage', 'Unknown error'))
         raise APIBaseError(response.status_code, response_data.get('errorMessage', 'Unknown error'))
 
     def parse_response_data(self, response: httpx.Response) -> dict:
         """
         Parse HTTP response data.
 
+        Bodies that start with a JSON object or array are parsed straight from the
+        response bytes into 'data'; anything else is returned as text in 'message'.
+        When lazy_responses is set, an APIResponse is returned and parsing is deferred
+        until its data is read.
+
         :param response: The HTTP response
         :return: The parsed response data
         """
+        if self.lazy_responses:
+            return APIResponse(response.status_code, response.content, response.encoding or "utf-8")
+
         # Initialize an empty dictionary for the response
         response_data = {"status": response.status_code, "message": "", "data": None}
 
-        # Check if the response text contains JSON elements
-        if any(char in response.text for char in ['{', '[']):
+        content = response.content
+        if is_json_body(content):
             try:
-                response_data["data"] = orjson.loads(response.text)
-            except OrjsonDecodeError:
-                try:
-                    response_data["data"] = response.orjson()
-                except Exception as _exc:
-                    self.logger.error(
-                        f"Error parsing JSON. Status code: {response.status_code}, "
-                        "Headers: {response.headers}, Text: {response.text}\n"
-                        "Error: {_exc}"
-                    )
-                    raise ValueError("Error parsing JSON")
+                response_data["data"] = orjson.loads(content)
+            except OrjsonDecodeError as _exc:
+                self.logger.error(
+                    "Error parsing JSON. Status code: %s, Headers: %s, Text: %s\nError: %s",
+                    response.status_code, response.headers, response.text, _exc
+                )
+                raise ValueError("Error parsing JSON")
         else:
             response_data["message"] = response.text
 
         return response_data
 
-    def request(self, method, endpoint, **kwargs):
+    def request(self, method, endpoint, idempotency_key: Optional[str] = None, **kwargs):
         """
         Make an HTTP request to the specified API endpoint.
 
         :param method: The HTTP method to use (e.g., 'GET', 'POST', etc.)
         :param endpoint: The API endpoint to call
-        :param kwargs: Additional arguments to pass to the httpx.request method
+        :param idempotency_key: A key sent in the Idempotency-Key header (optional). When
+                                idempotency_store holds a recent success for the key, its
+                                response is returned without sending the request.
+        :param kwargs: Additional arguments to pass to the httpx.Client.request method,
+                       plus the optional 'retry' override accepted by send()
         :return: The JSON response from the API
         :raise: APIBaseError if the request fails
         """
+        if idempotency_key is not None:
+            response_data = self.prepare_idempotent_request(method, endpoint, idempotency_key, kwargs)
+            if response_data is not None:
+                return response_data
+
+        response = self.send(method, endpoint, **kwargs)
+
+        # Process the JSON response using process_response method
+        response_data = self.process_response(response)
+        self.record_idempotent_request(idempotency_key, response_data)
+        return response_data
+
+    def prepare_idempotent_request(self, method, endpoint, idempotency_key: str, kwargs) -> Optional[Any]:
+        """
+        Add the Idempotency-Key header to a request and look the key up in the
+        idempotency store, if one is configured. When the store allows it, the request
+        is retried by the retry policy like an idempotent method.
+
+        :param method: The HTTP method of the request
+        :param endpoint: The API endpoint to call
+        :param idempotency_key: The key of the request
+        :param kwargs: The keyword arguments passed to request()
+        :return: The recorded response of an earlier request with the key, or None to send it
+        """
+        kwargs.setdefault('headers', {})[IDEMPOTENCY_HEADER] = idempotency_key
+        if self.idempotency_store is None:
+            return None
+
+        if self.idempotency_store.retry and kwargs.get('retry') is None:
+            kwargs['retry'] = True
+        response_data = self.idempotency_store.lookup(idempotency_key)
+        if response_data is not None:
+            self.logger.info("Not sending %s %s again: idempotency key %s already succeeded",
+                             method, endpoint, idempotency_key)
+        return response_data
+
+    def record_idempotent_request(self, idempotency_key: Optional[str], response_data: Any):
+        """
+        Record the response of a keyed request that succeeded in the idempotency store.
+        """
+        if idempotency_key is not None and self.idempotency_store is not None:
+            self.idempotency_store.record(idempotency_key, response_data)
+
+    def send(self, method, endpoint, retry: Optional[bool] = None, **kwargs) -> httpx.Response:
+        """
+        Send an HTTP request and return the raw response without processing it.
+
+        Each attempt is refused with CircuitOpenError while the circuit breaker, if
+        any, is open for the host, then waits for the rate limiter, if any, and is sent
+        with the current token from token_manager. A 401 answer is re-sent once with a
+        refreshed token when the token manager can log in again. Failed attempts are
+        retried according to retry_policy. A 304 Not Modified
+        answer to a conditional request is returned rather than treated as an error.
+        When single_flight is set, identical GETs issued while one is in flight share
+        its response.
+
+        :param method: The HTTP method to use (e.g., 'GET', 'POST', etc.)
+        :param endpoint: The API endpoint to call
+        :param retry: True to allow retries for any method (e.g. an idempotent POST),
+                      False to disable them, None to follow retry_policy
+        :param kwargs: Additional arguments to pass to the httpx.Client.request method
+        :return: The httpx response
+        :raise: APIBaseError if the request fails, CircuitOpenError if the circuit is open
+        """
+        key = self.coalescing_key(method, endpoint, kwargs)
+        if key is None:
+            return self._send(method, endpoint, retry, **kwargs)
+        return self.single_flight.do(key, lambda: self._send(method, endpoint, retry, **kwargs))
+
+    def _send(self, method, endpoint, retry: Optional[bool], **kwargs) -> httpx.Response:
+        url, headers = self.prepare_request(endpoint, kwargs)
+        attempt = 0
+        reauthenticated = False
+
+        while True:
+            attempt += 1
+            self.check_circuit(url)
+            token = self.authorize(headers)
+
+            delay = self.get_rate_limit_delay(endpoint)
+            if delay:
+                time.sleep(delay)
+
+            timing = self.start_attempt(method, endpoint, url, headers, attempt, kwargs)
+
+            # Use httpx to make the request
+            started_at = time.monotonic()
+            try:
+                response = self.client.request(method, url, headers=headers, **kwargs)
+                self.finish_attempt(url, timing, started_at, response)
+                return response
+            except Exception as error:
+                delay = self.failed_attempt(method, url, attempt, error, timing, started_at, token, retry,
+                                            reauthenticated)
+                if delay is None:
+                    # Re-sending with a fresh token is not a retry, so it keeps the attempt count
+                    attempt -= 1
+                    reauthenticated = True
+                    self.token_manager.refresh(token)
+                    continue
+
+            time.sleep(delay)
+
+    def start_attempt(self, method, endpoint, url, headers: dict, attempt: int, kwargs) -> Optional[RequestTiming]:
+        """
+        Start timing an attempt, if instrumentation is configured, and add its trace
+        hook to the request extensions.
+
+        :param kwargs: The keyword arguments of the request; the caller's extensions,
+                       such as a per-request timeout, are kept
+        :return: The RequestTiming of the attempt, or None
+        """
+        timing = self.start_timing(method, endpoint, url, headers, attempt)
+        if timing is not None:
+            kwargs['extensions'] = {**kwargs.get('extensions', {}), 'trace': self.trace_hook(timing)}
+        return timing
+
+    @staticmethod
+    def trace_hook(timing: RequestTiming):
+        """
+        The httpx trace extension of a timed attempt.
+        """
+        return timing.trace
+
+    def finish_attempt(self, url, timing: Optional[RequestTiming], started_at: float, response: httpx.Response):
+        """
+        Record an attempt that got a response.
+
+        :raise: httpx.HTTPStatusError if the response is unsuccessful
+        """
+        self.finish_timing(timing, response)
+        self.raise_for_status(response)
+        self.record_circuit(url, started_at)
+
+    def failed_attempt(self, method, url, attempt: int, error: Exception, timing: Optional[RequestTiming],
+                       started_at: float, token: Optional[str], retry: Optional[bool],
+                       reauthenticated: bool) -> Optional[float]:
+        """
+        Record a failed attempt and decide what happens next. Must be called from within
+        the except block that caught the error.
+
+        :param method: The HTTP method of the request
+        :param url: The URL of the request
+        :param attempt: The number of the attempt, starting at 1
+        :param error: The exception raised by the attempt
+        :param timing: The RequestTiming of the attempt, or None
+        :param started_at: The time.monotonic() value when the attempt started
+        :param token: The token sent with the attempt
+        :param retry: The per-call retry override
+        :param reauthenticated: Whether the request was already re-sent with a refreshed token
+        :return: None to refresh the token and re-send at once, or the seconds to wait before retrying
+        :raise: APIBaseError or the original exception when the request is not retried
+        """
+        self.finish_timing(timing, error=error)
+        self.record_circuit(url, started_at, error)
+        if not reauthenticated and self.should_reauthenticate(error, token):
+            return None
+
+        delay = self.get_retry_delay(method, url, attempt, error, retry)
+        if delay is None:
+            self.handle_exception(error)
+        return delay
+
+    def coalescing_key(self, method, endpoint, kwargs) -> Optional[tuple]:
+        """
+        The key under which identical requests share one in-flight call, or None if the
+        request must be sent on its own. Only GETs without a body or extra options are
+        coalesced, and the token and headers are part of the key.
+        """
+        if self.single_flight is None or method.upper() != "GET" or set(kwargs) - {'headers'}:
+            return None
+
+        headers = kwargs.get('headers') or {}
+        return self.base_url, endpoint, self.auth_token, tuple(sorted(headers.items()))
+
+    def authorize(self, headers: dict) -> Optional[str]:
+        """
+        Set the Authorization header to the current token, refreshing it first if it is
+        about to expire.
+
+        :param headers: The request headers
+        :return: The token sent, or None
+        """
+        if not self.authenticated:
+            return None
+
+        token = self.token_manager.get_token()
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        return token
+
+    def should_reauthenticate(self, error: Exception, token: Optional[str]) -> bool:
+        """
+        Check whether a request was rejected with 401 and may be re-sent with a new token.
+
+        :param error: The exception raised by the attempt
+        :param token: The token sent with the attempt
+        """
+        return (token is not None
+                and self.token_manager.can_refresh
+                and isinstance(error, httpx.HTTPStatusError)
+                and error.response.status_code == httpx.codes.UNAUTHORIZED)
+
+    def check_circuit(self, url):
+        """
+        Ask the circuit breaker, if one is configured, whether a request may be sent.
+
+        :param url: The URL of the request
+        :raise: CircuitOpenError if the circuit for the host is open
+        """
+        if self.circuit_breaker is None:
+            return
+
+        host = urlsplit(url).netloc
+        retry_after = self.circuit_breaker.before_request(host)
+        if retry_after:
+            raise CircuitOpenError(host, retry_after)
+
+    def record_circuit(self, url, started_at: float, error: Optional[Exception] = None):
+        """
+        Report the outcome of an attempt to the circuit breaker, if one is configured.
+
+        :param url: The URL of the request
+        :param started_at: The time.monotonic() value when the attempt started
+        :param error: The exception raised by the attempt, if any
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(urlsplit(url).netloc, time.monotonic() - started_at, error)
+
+    def start_timing(self, method, endpoint, url, headers: dict, attempt: int) -> Optional[RequestTiming]:
+        """
+        Start timing an attempt and run the pre-request hooks, if instrumentation is configured.
+
+        :return: The RequestTiming of the attempt, or None
+        """
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.start(method, endpoint, url, headers, attempt)
+
+    def finish_timing(self, timing: Optional[RequestTiming], response: Optional[httpx.Response] = None,
+                      error: Optional[Exception] = None):
+        """
+        Record a timed attempt and run the post-response hooks.
+        """
+        if timing is not None and timing.finished_at is None:
+            self.instrumentation.finish(timing, response, error)
+
+    def get_rate_limit_delay(self, endpoint) -> float:
+        """
+        Reserve a slot with the rate limiter, if one is configured.
+
+        :param endpoint: The API endpoint to call
+        :return: The number of seconds to wait before sending the request
+        """
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve(endpoint)
+
+    def get_retry_delay(self, method, url, attempt: int, error: Exception, retry: Optional[bool]) -> Optional[float]:
+        """
+        Ask the retry policy whether a failed attempt should be retried.
+
+        :param method: The HTTP method of the request
+        :param url: The URL of the request
+        :param attempt: The number of the attempt that failed, starting at 1
+        :param error: The exception raised by the attempt
+        :param retry: The per-call retry override
+        :return: The number of seconds to wait before retrying, or None to give up
+        """
+        if self.retry_policy is None:
+            return None
+
+        delay = self.retry_policy.get_delay(method, attempt, error, retry)
+        if delay is not None:
+            self.logger.warning("Retrying %s %s in %.2fs after attempt %s failed: %s",
+                                method, url, delay, attempt, error)
+        return delay
+
+    @staticmethod
+    def raise_for_status(response: httpx.Response):
+        """
+        Raise httpx.HTTPStatusError for unsuccessful responses, except 304 Not Modified.
+
+        :param response: The httpx response
+        """
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+
+    def prepare_request(self, endpoint, kwargs) -> Tuple[str, dict]:
+        """
+        Build the full URL and headers for a request. The 'headers' entry is removed
+        from kwargs.
+
+        :param endpoint: The API endpoint to call
+        :param kwargs: The keyword arguments passed to request()
+        :return: A tuple of the URL and the request headers
+        """
         url = f"{self.base_url}{endpoint}"
         headers = kwargs.pop('headers', {})
 
         # Add the authentication token to headers if it exists
-        if self.auth_token:
+        if self.authenticated and self.auth_token:
             headers['Authorization'] = f"Bearer {self.auth_token}"
 
-        # Use httpx to make the request
-        try:
-            response = httpx.request(method, url, headers=headers, **kwargs)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as status_error:
-            self.handle_http_status_error(status_error)
-        except httpx.RequestError as request_error:
-            self.handle_request_error(request_error)
-        except Exception as e:
-            self.handle_generic_error(e)
+        return url, headers
 
-        # Process the JSON response using process_response method
-        return self.process_response(response)
+    def handle_exception(self, error: Exception):
+        """
+        Dispatch an exception raised while sending a request to the matching handler.
+        Must be called from within an except block.
+
+        :param error: The exception raised by httpx
+        :raise: APIBaseError or the original exception
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            self.handle_http_status_error(error)
+        elif isinstance(error, httpx.RequestError):
+            self.handle_request_error(error)
+        else:
+            self.handle_generic_error(error)
 
     def handle_http_status_error(self, status_error: httpx.HTTPStatusError):
         """
@@ -195,17 +737,17 @@ class APIBase(ABC):
         :param status_error: The httpx HTTPStatusError
         :raise: APIBaseError
         """
-        self.logger.error(f"API request failed with status error: {status_error}")
+        self.logger.error("API request failed with status error: %s", status_error)
 
         # Check if response object is available and raise APIBaseError with status code and error message
         if hasattr(status_error, 'response') and status_error.response is not None:
             error_message = self.get_error_message_from_response(status_error.response)
 
             # Log the entire response content for better debugging
-            self.logger.error(f"Error response from the API: {status_error.response.content}")
+            self.logger.error("Error response from the API: %s", status_error.response.content)
 
             # Use the logger to log the error message before raising the error
-            self.logger.error(f"Error message from the API: {error_message}")
+            self.logger.error("Error message from the API: %s", error_message)
 
             raise APIBaseError(status_error.response.status_code, error_message)
         else:
@@ -218,7 +760,7 @@ class APIBase(ABC):
         :param request_error: The httpx RequestError
         :raise: request_error
         """
-        self.logger.error(f"API request failed with request error: {request_error}")
+        self.logger.error("API request failed with request error: %s", request_error)
         raise
 
     def handle_generic_error(self, e: Exception):
@@ -228,7 +770,7 @@ class APIBase(ABC):
         :param e: The error
         :raise: e
         """
-        self.logger.error(f"API request failed: {e}")
+        self.logger.error("API request failed: %s", e)
         raise
 
     def get_error_message_from_response(self, response: httpx.Response) -> str:
@@ -238,9 +780,196 @@ class APIBase(ABC):
         :param response: The httpx response
         :return: The error message
         """
-        try:
-            error_message = response.json().get('errorMessage', 'Unknown error')
-        except JSONDecodeError:
-            error_message = response.text
+        content = response.content
+        if is_json_body(content):
+            try:
+                body = orjson.loads(content)
+                if isinstance(body, dict):
+                    return body.get('errorMessage', 'Unknown error')
+            except OrjsonDecodeError:
+                pass
+
+        return response.text
+
+
+class AsyncAPIBase(APIBase):
+    """
+    Base class for asyncio API integration.
+
+    Request preparation, response processing and error handling are inherited from
+    APIBase; only sending the request is asynchronous.
+    """
+    single_flight: Optional[AsyncSingleFlight] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create the async client used when none was supplied to the constructor.
+        """
+        return create_async_http_client()
+
+    def _create_token_manager(self) -> AsyncTokenManager:
+        """
+        Create the async token manager used when none was supplied to the constructor.
+        """
+        return AsyncTokenManager()
+
+    async def authorize(self, headers: dict) -> Optional[str]:
+        """
+        Set the Authorization header to the current token, refreshing it first if it is
+        about to expire.
+
+        :param headers: The request headers
+        :return: The token sent, or None
+        """
+        if not self.authenticated:
+            return None
+
+        token = await self.token_manager.get_token()
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        return token
 
-        return error_message
+    @staticmethod
+    def trace_hook(timing: RequestTiming):
+        """
+        The httpx trace extension of a timed attempt.
+        """
+        return timing.atrace
+
+    def close(self):
+        raise TypeError(f"{type(self).__name__} must be closed with 'await aclose()'")
+
+    def __enter__(self):
+        raise TypeError(f"{type(self).__name__} must be used with 'async with'")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def aclose(self):
+        """
+        Close the underlying client if it is owned by this instance.
+        """
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def get(self, endpoint, **kwargs):
+        """
+        Send a GET request to the specified API endpoint.
+        """
+        return await self._request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint, **kwargs):
+        """
+        Send a POST request to the specified API endpoint.
+        """
+        return await self._request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint, **kwargs):
+        """
+        Send a PUT request to the specified API endpoint.
+        """
+        return await self._request("PUT", endpoint, **kwargs)
+
+    async def delete(self, endpoint, **kwargs):
+        """
+        Send a DELETE request to the specified API endpoint.
+        """
+        return await self._request("DELETE", endpoint, **kwargs)
+
+    async def _request(self, method, endpoint, **kwargs):
+        """
+        Make an HTTP request to the specified API endpoint.
+
+        :param method: The HTTP method to use (e.g., 'GET', 'POST', etc.)
+        :param endpoint: The API endpoint to call
+        :param kwargs: Additional arguments to pass to the httpx.AsyncClient.request method
+        :return: The JSON response from the API
+        """
+        url, headers = self.prepare_request(endpoint, kwargs)
+
+        # Use httpx to make the request
+        response = await self.client.request(method, url, headers=headers, **kwargs)
+
+        # Process the JSON response using process_response method
+        return self.process_response(response)
+
+    async def request(self, method, endpoint, idempotency_key: Optional[str] = None, **kwargs):
+        """
+        Make an HTTP request to the specified API endpoint.
+
+        :param method: The HTTP method to use (e.g., 'GET', 'POST', etc.)
+        :param endpoint: The API endpoint to call
+        :param idempotency_key: A key sent in the Idempotency-Key header (optional); see APIBase.request
+        :param kwargs: Additional arguments to pass to the httpx.AsyncClient.request method,
+                       plus the optional 'retry' override accepted by send()
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        if idempotency_key is not None:
+            response_data = self.prepare_idempotent_request(method, endpoint, idempotency_key, kwargs)
+            if response_data is not None:
+                return response_data
+
+        response = await self.send(method, endpoint, **kwargs)
+
+        # Process the JSON response using process_response method
+        response_data = self.process_response(response)
+        self.record_idempotent_request(idempotency_key, response_data)
+        return response_data
+
+    async def send(self, method, endpoint, retry: Optional[bool] = None, **kwargs) -> httpx.Response:
+        """
+        Send an HTTP request and return the raw response without processing it.
+
+        :param method: The HTTP method to use (e.g., 'GET', 'POST', etc.)
+        :param endpoint: The API endpoint to call
+        :param retry: True to allow retries for any method, False to disable them,
+                      None to follow retry_policy
+        :param kwargs: Additional arguments to pass to the httpx.AsyncClient.request method
+        :return: The httpx response
+        :raise: APIBaseError if the request fails
+        """
+        key = self.coalescing_key(method, endpoint, kwargs)
+        if key is None:
+            return await self._send(method, endpoint, retry, **kwargs)
+        return await self.single_flight.do(key, lambda: self._send(method, endpoint, retry, **kwargs))
+
+    async def _send(self, method, endpoint, retry: Optional[bool], **kwargs) -> httpx.Response:
+        url, headers = self.prepare_request(endpoint, kwargs)
+        attempt = 0
+        reauthenticated = False
+
+        while True:
+            attempt += 1
+            self.check_circuit(url)
+            token = await self.authorize(headers)
+
+            delay = self.get_rate_limit_delay(endpoint)
+            if delay:
+                await asyncio.sleep(delay)
+
+            timing = self.start_attempt(method, endpoint, url, headers, attempt, kwargs)
+
+            # Use httpx to make the request
+            started_at = time.monotonic()
+            try:
+                response = await self.client.request(method, url, headers=headers, **kwargs)
+                self.finish_attempt(url, timing, started_at, response)
+                return response
+            except Exception as error:
+                delay = self.failed_attempt(method, url, attempt, error, timing, started_at, token, retry,
+                                            reauthenticated)
+                if delay is None:
+                    attempt -= 1
+                    reauthenticated = True
+                    await self.token_manager.refresh(token)
+                    continue
+
+            await asyncio.sleep(delay)
@@ -7,19 +7,24 @@ api/auth_management.py
 This module represents all API calls in the /api/AuthManagement section.
 """
 
-from typing import Dict
+from typing import Dict, Optional
+
+import httpx
 
 from ..models.auth_management_models import AuthManagementRegister, UserLoginRequest
-from .api_base import APIBase
+from ..utils.token_manager import AsyncTokenManager, TokenManager
+from .api_base import APIBase, AsyncAPIBase, json_body
 
 
 class AuthManagement(APIBase):
     """
     Class for managing authentication-related operations.
     """
+    # Register and login do not send the bearer token, and never trigger a refresh
+    authenticated = False
 
-    def __init__(self, base_url: str):
-        super().__init__(base_url)
+    def __init__(self, base_url: str, client: httpx.Client = None, token_manager: Optional[TokenManager] = None):
+        super().__init__(base_url, client=client, token_manager=token_manager)
 
     def register(self, user_data: AuthManagementRegister) -> Dict:
         """
@@ -30,10 +35,10 @@ class AuthManagement(APIBase):
         :raise: APIBaseError if the request fails
         """
         register_url = "/api/AuthManagement/Register"
-        self.logger.info(f"Registering a new user with email: {user_data.email}")
+        self.logger.info("Registering a new user with email: %s", user_data.email)
         
         # Make the request and process the response
-        response_data = self.request("POST", register_url, json=user_data.to_dict())
+        response_data = self.request("POST", register_url, **json_body(user_data))
         
         self.logger.info("Successfully registered a new user")
 
@@ -51,10 +56,63 @@ class AuthManagement(APIBase):
         user_login_request = UserLoginRequest(email=email, password=password)
 
         # Log the attempt
-        self.logger.info(f"Logging into PortalCX API with email: {user_login_request.email}")
+        self.logger.info("Logging into PortalCX API with email: %s", user_login_request.email)
+
+        # Make the request and process the response
+        response_data = self.request("POST", login_url, **json_body(user_login_request))
+
+        # Save the token
+        self.token = response_data['data'].get('token')
+
+        self.logger.info("Successfully logged into PortalCX API")
+
+        return self.token
+
+
+class AsyncAuthManagement(AsyncAPIBase):
+    """
+    Asyncio counterpart of AuthManagement.
+    """
+    authenticated = False
+
+    def __init__(self, base_url: str, client: httpx.AsyncClient = None,
+                 token_manager: Optional[AsyncTokenManager] = None):
+        super().__init__(base_url, client=client, token_manager=token_manager)
+
+    async def register(self, user_data: AuthManagementRegister) -> Dict:
+        """
+        Registers a new user with the provided information.
+
+        :param user_data: A UserRegistration object containing the user information
+        :return: The JSON response from the API
+        :raise: APIBaseError if the request fails
+        """
+        register_url = "/api/AuthManagement/Register"
+        self.logger.info("Registering a new user with email: %s", user_data.email)
+
+        # Make the request and process the response
+        response_data = await self.request("POST", register_url, **json_body(user_data))
+
+        self.logger.info("Successfully registered a new user")
+
+        return response_data
+
+    async def login(self, email: str, password: str) -> str:
+        """
+        Logs into the PortalCX API with the provided credentials.
+
+        :param email: The email of the user
+        :param password: The password of the user
+        :return: The token received from the login operation
+        """
+        login_url = "/api/AuthManagement/Login"
+        user_login_request = UserLoginRequest(email=email, password=password)
+
+        # Log the attempt
+        self.logger.info("Logging into PortalCX API with email: %s", user_login_request.email)
 
         # Make the request and process the response
-        response_data = self.request("POST", login_url, json=user_login_request.to_dict())
+        response_data = await self.request("POST", login_url, **json_body(user_login_request))
 
         # Save the token
         self.token = response_data['data'].get('token')
@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+portalcx/cli.py
+---------------
+The `portalcx` console command for bulk imports.
+
+Rows are streamed from a CSV or JSONL file, validated in chunks, submitted
+concurrently and their results appended to a JSONL file as they complete, so
+memory use does not depend on the size of the input::
+
+    portalcx create-projects projects.csv --output results.jsonl --concurrency 32
+    portalcx complete-stages stages.jsonl --output results.jsonl
+
+Credentials are read from --token, or --email and --password, or the
+PORTALCX_TOKEN, PORTALCX_EMAIL and PORTALCX_PASSWORD environment variables.
+
+With --journal, completed rows are recorded in a local journal, and a rerun with the
+same journal skips them, so an interrupted import can be resumed without creating
+duplicates.
+"""
+
+import argparse
+import contextlib
+import csv
+import itertools
+import logging
+import os
+import sys
+import time
+from typing import IO, Any, Callable, Dict, Hashable, Iterable, Iterator, NamedTuple, Optional, Tuple, Type, Union
+
+import orjson
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic.fields import SHAPE_LIST
+
+from . import PortalCX, project_stage_key
+from .api.api_base import APIBaseError
+from .models.admin_project_models import ProjectCreateRequest
+from .models.admin_template_models import ProjectStageCompleteRequest
+from .utils.batch_validation import BatchValidator
+from .utils.bulk import BulkExecutor, BulkItemResult
+from .utils.journal import BulkJournal, item_digest
+from .utils.logger import set_log_level
+from .utils.token_cache import TokenCache
+
+DEFAULT_BASE_URL = "https://api.portalcx.com"
+
+
+class Command(NamedTuple):
+    """
+    A bulk command: the model rows are read into and how each one is submitted.
+    """
+    model_class: Type[PydanticBaseModel]
+    submit: Callable[[PortalCX, Any], dict]
+    key: Optional[Callable[[Any], Hashable]]
+    description: str
+
+
+COMMANDS: Dict[str, Command] = {
+    "create-projects": Command(ProjectCreateRequest, PortalCX.create_project, None,
+                               "Create a project per row"),
+    "complete-stages": Command(ProjectStageCompleteRequest, PortalCX.complete_project_stage, project_stage_key,
+                               "Complete a project stage per row; rows for one project are sent in order"),
+}
+
+
+def parse_json_row(line: str) -> Union[dict, str]:
+    """
+    Parse a JSONL line into a row.
+
+    :return: The row, or an error message when the line is not a JSON object
+    """
+    try:
+        row = orjson.loads(line)
+    except orjson.JSONDecodeError as error:
+        return f"invalid JSON: {error}"
+    if not isinstance(row, dict):
+        return "value is not a valid dict"
+    return row
+
+
+def read_rows(path: str, input_format: Optional[str] = None) -> Iterator[Tuple[int, Union[dict, str]]]:
+    """
+    Stream (row number, row) pairs from a CSV or JSONL file. CSV rows are numbered
+    from 1 after the header, JSONL rows by their line number.
+
+    Empty CSV cells are treated as absent. A JSONL line that is not a JSON object is
+    yielded as an error message instead of a row.
+
+    :param path: The input file, or '-' for standard input
+    :param input_format: 'csv' or 'jsonl' (guessed from the file extension by default)
+    """
+    if input_format is None:
+        input_format = "csv" if path.lower().endswith(".csv") else "jsonl"
+
+    input_file = sys.stdin if path == "-" else open(path, newline="" if input_format == "csv" else None,
+                                                    encoding="utf-8-sig")
+    try:
+        if input_format == "csv":
+            for number, row in enumerate(csv.DictReader(input_file), start=1):
+                yield number, {key: value for key, value in row.items() if key and value != ""}
+        else:
+            for number, line in enumerate(input_file, start=1):
+                if line.strip():
+                    yield number, parse_json_row(line)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+
+def decode_list_fields(model_class: Type[PydanticBaseModel], row: dict) -> dict:
+    """
+    Decode list fields given as JSON text, as CSV cells are, such as projectSubscribers.
+    """
+    for name, field in model_class.__fields__.items():
+        value = row.get(name)
+        if field.shape == SHAPE_LIST and isinstance(value, str) and value.lstrip().startswith("["):
+            try:
+                row[name] = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+    return row
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def error_details(error: Exception) -> dict:
+    if isinstance(error, APIBaseError):
+        return {"status_code": error.status_code, "message": error.error_message}
+    return {"type": type(error).__name__, "message": str(error)}
+
+
+class ResultWriter:
+    """
+    Appends one JSON line per input row to the results file and keeps counts.
+    """
+
+    def __init__(self, output: IO[bytes]):
+        self.output = output
+        self.succeeded = 0
+        self.failed = 0
+        self.invalid = 0
+        self.skipped = 0
+
+    def write(self, row: int, ok: bool, response: Any = None, error: Any = None, **extra):
+        self.output.write(orjson.dumps({"row": row, "ok": ok, "response": response, "error": error, **extra}))
+        self.output.write(b"\n")
+
+    def write_skipped(self, row: int, response: Any):
+        self.skipped += 1
+        self.write(row, True, response=response, skipped=True)
+
+    def write_invalid(self, row: int, errors: Dict[str, str]):
+        self.invalid += 1
+        self.write(row, False, error={"validation": errors})
+
+    def write_result(self, row: int, result: BulkItemResult):
+        if result.skipped:
+            self.write_skipped(row, result.response)
+        elif result.ok:
+            self.succeeded += 1
+            response = dict(result.response) if result.response is not None else None
+            self.write(row, True, response=response)
+        else:
+            self.failed += 1
+            self.write(row, False, error=error_details(result.error))
+
+    def summary(self) -> dict:
+        return {"succeeded": self.succeeded, "failed": self.failed, "invalid": self.invalid, "skipped": self.skipped}
+
+
+def validated_items(rows: Iterable[Tuple[int, Union[dict, str]]], model_class: Type[PydanticBaseModel],
+                    writer: ResultWriter, chunk_size: int = 1000) -> Iterator[Tuple[int, Any]]:
+    """
+    Validate rows in chunks and yield (row number, model) for the valid ones. Invalid
+    rows, and rows read as an error message, are written to the results straight
+    away and never submitted.
+    """
+    validator = BatchValidator(model_class)
+    build = getattr(model_class, "trusted", model_class)
+    for chunk in chunked(rows, chunk_size):
+        for number, row in chunk:
+            if isinstance(row, str):
+                writer.write_invalid(number, {"__root__": row})
+        chunk = [(number, row) for number, row in chunk if not isinstance(row, str)]
+        result = validator.validate([decode_list_fields(model_class, row) for _, row in chunk])
+        for (number, _), values, position in zip(chunk, result.rows, itertools.count()):
+            if position in result.errors:
+                writer.write_invalid(number, result.errors[position])
+            else:
+                yield number, build(**values)
+
+
+def import_file(pxc: PortalCX,
+                command: str,
+                path: str,
+                output: IO[bytes],
+                input_format: Optional[str] = None,
+                concurrency: int = 16,
+                chunk_size: int = 1000,
+                journal: Optional[BulkJournal] = None) -> dict:
+    """
+    Submit every row of a file with a bulk command and write the results.
+
+    :param pxc: The client used to submit the rows
+    :param command: A key of COMMANDS
+    :param path: The input file, or '-' for standard input
+    :param output: A binary file the JSONL results are appended to
+    :param input_format: 'csv' or 'jsonl' (guessed from the file extension by default)
+    :param concurrency: The maximum number of requests in flight
+    :param chunk_size: The number of rows validated at a time
+    :param journal: A BulkJournal recording completed rows; rows it holds are skipped (optional)
+    :return: A summary with the succeeded, failed, invalid and skipped counts and the elapsed time
+    """
+    spec = COMMANDS[command]
+    # The journal namespace of the SDK method, so the journal can be shared with it
+    namespace = spec.submit.__name__
+    writer = ResultWriter(output)
+    started_at = time.perf_counter()
+
+    items = validated_items(read_rows(path, input_format), spec.model_class, writer, chunk_size)
+    skip = (lambda item: journal.completed_response(item[1], namespace)) if journal is not None else None
+
+    def submit(item: Tuple[int, Any]) -> dict:
+        response = spec.submit(pxc, item[1])
+        if journal is not None:
+            journal.record(item_digest(item[1], namespace), response)
+        return response
+
+    key = (lambda item: spec.key(item[1])) if spec.key else None
+    bulk = BulkExecutor(submit, items, concurrency=concurrency, ordered=False, key=key, name=command, skip=skip)
+    for result in bulk:
+        writer.write_result(result.item[0], result)
+
+    output.flush()
+    summary = writer.summary()
+    summary["elapsed"] = round(time.perf_counter() - started_at, 3)
+    return summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="portalcx", description="Bulk imports for the PortalCX API.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, spec in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=spec.description, description=spec.description)
+        subparser.add_argument("input", help="A CSV or JSONL file, or '-' for standard input")
+        subparser.add_argument("-o", "--output", default="-", help="The JSONL results file (default: stdout)")
+        subparser.add_argument("--format", choices=("csv", "jsonl"), dest="input_format",
+                               help="The input format (default: from the file extension)")
+        subparser.add_argument("-c", "--concurrency", type=int, default=16, help="Requests in flight (default: 16)")
+        subparser.add_argument("--base-url", default=os.environ.get("PORTALCX_BASE_URL", DEFAULT_BASE_URL))
+        subparser.add_argument("--token", default=os.environ.get("PORTALCX_TOKEN"))
+        subparser.add_argument("--email", default=os.environ.get("PORTALCX_EMAIL"))
+        subparser.add_argument("--password", default=os.environ.get("PORTALCX_PASSWORD"))
+        subparser.add_argument("--token-cache", action="store_true", help="Share the login through the token cache")
+        subparser.add_argument("--journal", help="Record completed rows in this file and skip the rows it holds")
+        subparser.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    return parser
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    Run the console command.
+
+    :return: The exit status: 0 when every row succeeded, 1 otherwise
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.token is None and not (args.email and args.password):
+        parser.error("pass --token, or --email and --password")
+
+    set_log_level(logging.INFO if args.verbose else logging.WARNING)
+
+    with contextlib.ExitStack() as stack:
+        pxc = stack.enter_context(PortalCX(base_url=args.base_url, auth_token=args.token,
+                                           token_cache=TokenCache() if args.token_cache else None))
+        if args.token is None:
+            pxc.login(args.email, args.password)
+
+        journal = stack.enter_context(BulkJournal(args.journal)) if args.journal else None
+        output = sys.stdout.buffer if args.output == "-" else stack.enter_context(open(args.output, "ab"))
+        summary = import_file(pxc, args.command, args.input, output, args.input_format, args.concurrency,
+                              journal=journal)
+
+    print(f"{args.command}: {summary['succeeded']} succeeded, {summary['failed']} failed, "
+          f"{summary['invalid']} invalid, {summary['skipped']} skipped in {summary['elapsed']}s", file=sys.stderr)
+    return 0 if summary["failed"] == 0 and summary["invalid"] == 0 else 1
@@ -95,3 +95,7 @@ class ProjectStatusEnum(IntEnum):
     STATUS_0 = 0
     STATUS_1 = 1
     STATUS_2 = 2
+
+
+# Resolve the ProjectStatusEnum annotation, which is defined after the model
+GetProjectDetailViewModel.update_forward_refs()
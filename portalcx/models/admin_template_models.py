@@ -9,7 +9,10 @@ This file contains models for representing Admin Template data.
 
 from __future__ import annotations
 
-from typing import Optional, List
+import mimetypes
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, List, Union
 from uuid import UUID
 
 from pydantic import constr, root_validator
@@ -17,6 +20,62 @@ from pydantic import constr, root_validator
 from .base_model import BaseModel
 
 
+class FileUpload:
+    """
+    A file sent as a multipart file part. Paths are opened when the request is sent
+    and read in chunks, so the file is never held in memory as a whole.
+
+    Model fields typed as FileUpload also accept a pathlib.Path or a binary file
+    object, which are wrapped automatically.
+    """
+
+    def __init__(self,
+                 file: Union[str, os.PathLike, BinaryIO],
+                 filename: Optional[str] = None,
+                 content_type: Optional[str] = None):
+        """
+        :param file: A path or a binary file object
+        :param filename: The filename sent to the API (defaults to the file's base name)
+        :param content_type: The MIME type (guessed from the filename by default)
+        """
+        self.file = file
+        if filename is None:
+            name = file if isinstance(file, (str, os.PathLike)) else getattr(file, 'name', None)
+            if isinstance(name, (str, bytes, os.PathLike)):
+                filename = os.path.basename(os.fsdecode(name))
+            else:
+                filename = 'upload'
+        self.filename = filename
+        self.content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value) -> "FileUpload":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, os.PathLike) or hasattr(value, 'read'):
+            return cls(value)
+        raise TypeError("expected a FileUpload, a path or a binary file object")
+
+    @contextmanager
+    def open(self) -> Iterator[BinaryIO]:
+        """
+        Yield a binary file object to read from. Files opened from a path are closed
+        afterwards; file objects passed in are left open for the caller.
+        """
+        if isinstance(self.file, (str, os.PathLike)):
+            with open(self.file, 'rb') as fileobj:
+                yield fileobj
+        else:
+            yield self.file
+
+    def __repr__(self):
+        return f"FileUpload({self.filename!r}, content_type={self.content_type!r})"
+
+
 class CreateTemplate(BaseModel):
     """
     This class represents a template creation request.
@@ -30,8 +89,8 @@ class CreateTemplate(BaseModel):
     companyName: str
     projectAppBrandColor: Optional[str]
     projectForgroundColor: Optional[str]
-    templateAppLogoUpload: Optional[str]
-    emailLogoUpload: Optional[str]
+    templateAppLogoUpload: Optional[Union[FileUpload, str]]
+    emailLogoUpload: Optional[Union[FileUpload, str]]
     isCallToAction: Optional[bool]
     linkText: Optional[str]
     linkUrl: Optional[str]
@@ -4,12 +4,16 @@
 """
 base_model.py
 -------------
-This module defines the BaseModel class, which provides a reusable method
-for converting a model object to a dictionary.
+This module defines the BaseModel class, which provides reusable methods
+for converting a model object to a dictionary or a JSON request body.
 """
 
-from typing import Any, Dict
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple, Type
+
+import orjson
 from pydantic import BaseModel as PydanticBaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
 
 
 def to_camel(string: str) -> str:
@@ -26,6 +30,111 @@ def to_camel(string: str) -> str:
     return components[0] + ''.join(word.capitalize() for word in components[1:])
 
 
+_REQUIRED = object()
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset, Enum)
+
+
+def json_fields(model: PydanticBaseModel) -> Dict[str, Any]:
+    """
+    The fields of a model as to_dict() selects them: set explicitly and not None.
+    Nested models are left as they are for the JSON encoder.
+
+    :param model: A model instance
+    :return: A dictionary of field values
+    """
+    fields_set = model.__fields_set__
+    return {name: value for name, value in model.__dict__.items() if value is not None and name in fields_set}
+
+
+class ModelSerializer:
+    """
+    The compiled JSON serializer of one model class. It writes the fields chosen by
+    json_fields straight to bytes with orjson. Nested models go through the same
+    selection, and other values orjson does not support fall back to the class's
+    pydantic encoder (Config.json_encoders included). Values neither can encode,
+    such as file uploads, make dumps() raise a TypeError naming the field.
+    """
+    __slots__ = ("encoder", "nested", "field_names", "aliases", "defaults")
+
+    def __init__(self, model_class: Type[PydanticBaseModel]):
+        self.encoder = model_class.__json_encoder__
+        # Fields holding a nested model or a list of them: name -> (model class, is list)
+        self.nested: Dict[str, Tuple[Type[PydanticBaseModel], bool]] = {
+            name: (field.type_, field.shape == SHAPE_LIST)
+            for name, field in model_class.__fields__.items()
+            if field.shape in (SHAPE_SINGLETON, SHAPE_LIST)
+            and isinstance(field.type_, type) and issubclass(field.type_, PydanticBaseModel)
+        }
+        self.field_names = frozenset(model_class.__fields__)
+        self.aliases = {field.alias: name for name, field in model_class.__fields__.items() if field.alias != name}
+        # (name, default) of every field for trusted construction, or None when a field
+        # has a default factory or a mutable default and construct() is needed
+        self.defaults = tuple((name, _REQUIRED if field.required else field.default)
+                              for name, field in model_class.__fields__.items())
+        if model_class.__private_attributes__ or any(
+                field.default_factory is not None or not isinstance(field.default, _IMMUTABLE_DEFAULTS)
+                for field in model_class.__fields__.values()):
+            self.defaults = None
+
+    def construct(self, model_class: Type[PydanticBaseModel], values: Dict[str, Any]) -> PydanticBaseModel:
+        """
+        Create a model without validation, like model_class.construct(**values) but
+        using the precomputed defaults. Values may be given by alias or field name.
+        """
+        if self.aliases:
+            # construct() keeps alias keys next to the field names, so map them first
+            values = {self.aliases.get(key, key): value for key, value in values.items()}
+
+        fields_set = set(values)
+        if self.defaults is None or not fields_set <= self.field_names:
+            return model_class.construct(**values)
+
+        model = model_class.__new__(model_class)
+        object.__setattr__(model, '__dict__', {
+            name: values[name] if name in fields_set else default
+            for name, default in self.defaults if default is not _REQUIRED or name in fields_set
+        })
+        object.__setattr__(model, '__fields_set__', fields_set)
+        return model
+
+    def default(self, value: Any) -> Any:
+        if isinstance(value, PydanticBaseModel):
+            return json_fields(value)
+        return self.encoder(value)
+
+    def dumps(self, model: PydanticBaseModel) -> bytes:
+        fields = json_fields(model)
+        try:
+            return orjson.dumps(fields, default=self.default)
+        except TypeError as error:
+            raise TypeError(f"{type(model).__name__} cannot be encoded as JSON: "
+                            f"{self.unencodable_field(fields) or error}") from error
+
+    def unencodable_field(self, fields: Dict[str, Any]) -> Optional[str]:
+        """
+        Describe the first field whose value cannot be encoded as JSON.
+        """
+        for name, value in fields.items():
+            try:
+                orjson.dumps(value, default=self.default)
+            except TypeError:
+                return f"field {name!r} holds a {type(value).__name__}"
+        return None
+
+
+_SERIALIZERS: Dict[type, ModelSerializer] = {}
+
+
+def model_serializer(model_class: Type[PydanticBaseModel]) -> ModelSerializer:
+    """
+    Get the serializer of a model class, compiling it on first use.
+    """
+    serializer = _SERIALIZERS.get(model_class)
+    if serializer is None:
+        serializer = _SERIALIZERS[model_class] = ModelSerializer(model_class)
+    return serializer
+
+
 class BaseModel(PydanticBaseModel):
     """
     BaseModel class that extends Pydantic's BaseModel
@@ -49,3 +158,34 @@ class BaseModel(PydanticBaseModel):
         :return: A dictionary representation of the model object
         """
         return self.dict(exclude_unset=True, exclude_none=True)
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the model to JSON bytes for a request body. The output holds the
+        same fields as to_dict(), but skips building the intermediate dictionaries.
+
+        :return: The JSON encoded model
+        :raise: TypeError if a field holds a value that has no JSON form, such as a
+            FileUpload, which is sent as multipart form data instead
+        """
+        return model_serializer(type(self)).dumps(self)
+
+    @classmethod
+    def trusted(cls, **values: Any) -> "BaseModel":
+        """
+        Create a model from data that is already known to be valid, such as rows
+        checked by a batch validator or loaded from the SDK's own output, without
+        running validation again. Nested models given as dictionaries are built the
+        same way. Invalid data is not detected and is sent to the API as is.
+
+        :param values: The field values
+        :return: A model instance
+        """
+        serializer = model_serializer(cls)
+        for name, (model_class, many) in serializer.nested.items():
+            value = values.get(name)
+            if many and value:
+                values[name] = [model_class.trusted(**item) if isinstance(item, dict) else item for item in value]
+            elif isinstance(value, dict):
+                values[name] = model_class.trusted(**value)
+        return serializer.construct(cls, values)
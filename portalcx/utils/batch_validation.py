@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/batch_validation.py
+-------------------------
+Column-at-a-time validation of large batches of request rows, such as CRM exports
+of ProjectCreateRequest data, before any request is sent.
+"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel as PydanticBaseModel, ValidationError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+from ..models.admin_project_models import ProjectCreateRequest
+
+# Marks a value that is absent from its row
+MISSING = object()
+
+Rows = Union[Sequence[Mapping[str, Any]], Mapping[str, Sequence[Any]]]
+# A per-value check returning an error message, or None when the value is fine
+ValueCheck = Callable[[Any], Optional[str]]
+
+
+class BatchValidationResult:
+    """
+    The outcome of validating a batch.
+
+    `errors` maps the index of every rejected row to {field: message}; nested fields
+    are reported as e.g. 'projectSubscribers.0.email'. Accepted rows hold their values
+    after coercion (e.g. '42' -> 42 for int fields) and only the fields they set.
+    """
+
+    def __init__(self, model_class: Type[PydanticBaseModel], rows: List[Dict[str, Any]],
+                 errors: Dict[int, Dict[str, str]]):
+        self.model_class = model_class
+        self.rows = rows
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def valid_indices(self) -> List[int]:
+        return [index for index in range(len(self.rows)) if index not in self.errors]
+
+    def valid_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the accepted rows as dictionaries.
+        """
+        errors = self.errors
+        return (row for index, row in enumerate(self.rows) if index not in errors)
+
+    def models(self) -> Iterator[PydanticBaseModel]:
+        """
+        Yield a model per accepted row, built with trusted() when the model supports it
+        since the row has already been validated.
+        """
+        build = getattr(self.model_class, 'trusted', None) or self.model_class
+        return (build(**row) for row in self.valid_rows())
+
+    def to_dict(self) -> dict:
+        return {"rows": len(self.rows), "valid": len(self.rows) - len(self.errors),
+                "invalid": len(self.errors), "errors": self.errors}
+
+    def __repr__(self):
+        return f"BatchValidationResult(rows={len(self.rows)}, invalid={len(self.errors)})"
+
+
+class _Column:
+    """
+    The compiled check of one model field.
+    """
+    __slots__ = ("name", "field", "model_class", "fast_type", "enum_values", "nested", "many", "checks")
+
+    def __init__(self, model_class: Type[PydanticBaseModel], field: ModelField, checks: Sequence[ValueCheck]):
+        self.name = field.name
+        self.field = field
+        self.model_class = model_class
+        self.checks = checks
+        self.nested: Optional[BatchValidator] = None
+        self.many = field.shape == SHAPE_LIST
+        self.enum_values = None
+
+        field_type = field.type_
+        # Values of exactly this type are accepted without calling pydantic
+        self.fast_type = field_type if field_type in (str, int, float, bool) else None
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+            self.enum_values = {member.value: member for member in field_type}
+        elif (isinstance(field_type, type) and issubclass(field_type, PydanticBaseModel)
+              and field.shape in (SHAPE_SINGLETON, SHAPE_LIST)):
+            self.nested = BatchValidator(field_type)
+
+    def slow_validate(self, value: Any) -> Any:
+        """
+        Validate and coerce one value with pydantic.
+
+        :raise: ValueError with pydantic's message
+        """
+        value, error = self.field.validate(value, {}, loc=self.name, cls=self.model_class)
+        if error is not None:
+            errors = error if isinstance(error, list) else [error]
+            raise ValueError(str(errors[0].exc))
+        return value
+
+    def _all_enum_values(self, values: List[Any]) -> bool:
+        enum_values = self.enum_values
+        try:
+            return all(value in enum_values for value in values if value is not None and value is not MISSING)
+        except TypeError:  # unhashable values
+            return False
+
+    def validate(self, values: List[Any], errors: Dict[int, Dict[str, str]]) -> List[Any]:
+        """
+        Check a whole column, recording failures in errors.
+
+        :return: The coerced column
+        """
+        name = self.name
+        required = self.field.required
+        allow_none = self.field.allow_none
+
+        if self.nested is not None:
+            values = self._validate_nested(values, errors)
+        elif self.fast_type is not None and set(map(type, values)) == {self.fast_type}:
+            # Every value already has the field's type: nothing to coerce
+            pass
+        elif self.enum_values is not None and self._all_enum_values(values):
+            enum_values = self.enum_values
+            values = [enum_values[value] if value is not MISSING and value is not None else value
+                      for value in values]
+        else:
+            fast_type = self.fast_type
+            coerced = []
+            for index, value in enumerate(values):
+                if value is MISSING or value is None or type(value) is fast_type:
+                    coerced.append(value)
+                    continue
+                try:
+                    coerced.append(self.slow_validate(value))
+                except ValueError as error:
+                    errors.setdefault(index, {})[name] = str(error)
+                    coerced.append(value)
+            values = coerced
+
+        if not self.checks and None not in values and MISSING not in values:
+            return values
+
+        for index, value in enumerate(values):
+            if value is MISSING:
+                if required:
+                    errors.setdefault(index, {})[name] = "field required"
+            elif value is None:
+                if not allow_none:
+                    errors.setdefault(index, {})[name] = "none is not an allowed value"
+            else:
+                for check in self.checks:
+                    message = check(value)
+                    if message:
+                        errors.setdefault(index, {})[name] = message
+                        break
+        return values
+
+    def _validate_nested(self, values: List[Any], errors: Dict[int, Dict[str, str]]) -> List[Any]:
+        # All nested rows of the column are validated as one batch
+        owners = []
+        nested_rows = []
+        for index, value in enumerate(values):
+            if value is MISSING or value is None:
+                continue
+            items = value if self.many else [value]
+            if self.many and not isinstance(value, (list, tuple)):
+                errors.setdefault(index, {})[self.name] = "value is not a valid list"
+                continue
+            for position, item in enumerate(items):
+                if isinstance(item, PydanticBaseModel):
+                    item = item.dict(exclude_unset=True)
+                if type(item) is not dict and not isinstance(item, Mapping):
+                    prefix = f"{self.name}.{position}" if self.many else self.name
+                    errors.setdefault(index, {})[prefix] = "value is not a valid dict"
+                    continue
+                owners.append((index, position))
+                nested_rows.append(item)
+
+        result = self.nested.validate(nested_rows)
+        for nested_index, nested_errors in result.errors.items():
+            index, position = owners[nested_index]
+            prefix = f"{self.name}.{position}" if self.many else self.name
+            for field_name, message in nested_errors.items():
+                errors.setdefault(index, {})[f"{prefix}.{field_name}"] = message
+
+        values = list(values)
+        rebuilt: Dict[int, list] = {}
+        for (index, position), row in zip(owners, result.rows):
+            rebuilt.setdefault(index, []).append(row)
+        for index, rows in rebuilt.items():
+            values[index] = rows if self.many else rows[0]
+        return values
+
+
+class BatchValidator:
+    """
+    Validates many rows of one model class a column at a time instead of building a
+    pydantic model per row.
+
+    Each field is checked over the whole batch in one pass. A column whose values
+    already have the field's type (str, int, float, bool) or are valid enum values
+    is accepted in a single type scan. Other values are coerced and checked through
+    the field's own pydantic validator, so the messages match pydantic's. Nested
+    models, such as projectSubscribers, are validated together as one batch of
+    their own. Models with class or root validators also run full model
+    validation on the rows that pass the column checks.
+
+    Usage::
+
+        result = BatchValidator(ProjectCreateRequest).validate(rows)
+        for index, errors in result.errors.items():
+            print(index, errors)  # {'countryId': 'value is not a valid integer'}
+        bulk = pxc.create_projects_bulk(result.models())
+    """
+
+    def __init__(self, model_class: Type[PydanticBaseModel], checks: Optional[Dict[str, ValueCheck]] = None):
+        """
+        :param model_class: The model the rows are validated against
+        :param checks: Extra per-value checks by field name, returning an error message or None (optional)
+        """
+        self.model_class = model_class
+        checks = checks or {}
+        self.columns = [_Column(model_class, field, [checks[name]] if name in checks else [])
+                        for name, field in model_class.__fields__.items()]
+        self.aliases = {field.alias: name for name, field in model_class.__fields__.items() if field.alias != name}
+        self.model_validators = bool(
+            model_class.__pre_root_validators__ or model_class.__post_root_validators__
+            or any(field.class_validators for field in model_class.__fields__.values())
+        )
+
+    def _columns(self, rows: Rows) -> Dict[str, List[Any]]:
+        if isinstance(rows, Mapping):
+            columns = {self.aliases.get(name, name): list(values) for name, values in rows.items()}
+            lengths = {len(values) for values in columns.values()}
+            if len(lengths) > 1:
+                raise ValueError("All columns must have the same length")
+            return columns
+
+        if self.aliases:
+            rows = [{self.aliases.get(name, name): value for name, value in row.items()} for row in rows]
+        # Keys that are not fields are ignored, as pydantic does
+        return {column.name: [row.get(column.name, MISSING) for row in rows] for column in self.columns}
+
+    def validate(self, rows: Rows) -> BatchValidationResult:
+        """
+        Validate a batch given as a list of row dictionaries or as a dictionary of
+        equally long column lists.
+
+        :param rows: The rows to validate
+        :return: A BatchValidationResult with the coerced rows and the errors per row index
+        """
+        columns = self._columns(rows)
+        row_count = len(next(iter(columns.values()))) if columns else len(rows)
+        errors: Dict[int, Dict[str, str]] = {}
+
+        validated = {}
+        for column in self.columns:
+            values = columns.get(column.name)
+            validated[column.name] = column.validate(values if values is not None else [MISSING] * row_count, errors)
+
+        names = list(validated)
+        output = [
+            {name: value for name, value in zip(names, row_values) if value is not MISSING}
+            for row_values in zip(*validated.values())
+        ] if names else [{} for _ in range(row_count)]
+
+        if self.model_validators:
+            self._validate_models(output, errors)
+        return BatchValidationResult(self.model_class, output, errors)
+
+    def _validate_models(self, rows: List[Dict[str, Any]], errors: Dict[int, Dict[str, str]]):
+        for index, row in enumerate(rows):
+            if index in errors:
+                continue
+            try:
+                self.model_class(**row)
+            except ValidationError as error:
+                errors[index] = {'.'.join(str(part) for part in detail['loc']): detail['msg']
+                                 for detail in error.errors()}
+
+
+_PROJECT_VALIDATOR: Optional[BatchValidator] = None
+
+
+def validate_project_rows(rows: Union[Rows, Iterable[Mapping[str, Any]]]) -> BatchValidationResult:
+    """
+    Validate a batch of ProjectCreateRequest rows.
+
+    :param rows: A list of row dictionaries or a dictionary of column lists
+    :return: A BatchValidationResult
+    """
+    global _PROJECT_VALIDATOR
+    if _PROJECT_VALIDATOR is None:
+        _PROJECT_VALIDATOR = BatchValidator(ProjectCreateRequest)
+    if not isinstance(rows, (Mapping, Sequence)):
+        rows = list(rows)
+    return _PROJECT_VALIDATOR.validate(rows)
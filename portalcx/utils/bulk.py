@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/bulk.py
+-------------
+Bounded-concurrency execution of many API calls with per-item results.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, Optional, Tuple, Type
+
+from .logger import get_logger
+
+# Errors recorded as a failed item instead of aborting the batch. BaseExceptions such
+# as KeyboardInterrupt and asyncio.CancelledError are not caught and stop the run.
+BULK_ITEM_ERRORS: Tuple[Type[Exception], ...] = (Exception,)
+
+
+class BulkItemResult(NamedTuple):
+    """
+    The outcome of a single item in a bulk operation. `skipped` is set when the item
+    was already done and its recorded response is returned without a call.
+    """
+    index: int
+    item: Any
+    response: Optional[dict]
+    error: Optional[Exception]
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkStats:
+    """
+    Throughput statistics for a bulk operation.
+    """
+
+    def __init__(self):
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds since the operation started, up to when it finished.
+        """
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """
+        Completed items per second.
+        """
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed else 0.0
+
+    def record(self, result: BulkItemResult):
+        if result.skipped:
+            self.skipped += 1
+        elif result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(self.throughput, 1),
+        }
+
+    def __repr__(self):
+        return (f"BulkStats(submitted={self.submitted}, succeeded={self.succeeded}, failed={self.failed}, "
+                f"skipped={self.skipped}, "
+                f"elapsed={self.elapsed:.3f}s, throughput={self.throughput:.1f}/s)")
+
+
+class _BulkWindow:
+    """
+    Scheduling state shared by the sync and async executors.
+
+    Items are pulled from the input while fewer than `window` are outstanding
+    (queued, in flight, waiting on their key or buffered for ordered output). Items
+    that share a key are started one at a time, in input order. Items for which
+    `skip` returns a response are not started and complete straight away.
+    """
+
+    def __init__(self, items: Iterable, concurrency: int, window: int, ordered: bool,
+                 key: Optional[Callable[[Any], Hashable]], skip: Optional[Callable[[Any], Optional[Any]]] = None):
+        self.items = enumerate(items)
+        self.concurrency = concurrency
+        self.window = window
+        self.ordered = ordered
+        self.key = key
+        self.skip = skip
+        self.skipped = []
+        self.exhausted = False
+        self.in_flight = 0
+        self.ready = deque()
+        self.waiting = {}
+        self.waiting_count = 0
+        self.running_keys = set()
+        self.buffered = {}
+        self.next_index = 0
+
+    @property
+    def outstanding(self) -> int:
+        return len(self.ready) + self.in_flight + self.waiting_count + len(self.buffered) + len(self.skipped)
+
+    def fill(self) -> int:
+        """
+        Pull items from the input until the window is full.
+
+        :return: The number of items pulled
+        """
+        pulled = 0
+        while not self.exhausted and self.outstanding < self.window:
+            try:
+                index, item = next(self.items)
+            except StopIteration:
+                self.exhausted = True
+                break
+            pulled += 1
+
+            if self.skip is not None:
+                response = self.skip(item)
+                if response is not None:
+                    self.skipped.append(BulkItemResult(index, item, response, None, True))
+                    continue
+
+            item_key = self.key(item) if self.key else None
+            if item_key is not None and item_key in self.running_keys:
+                self.waiting.setdefault(item_key, deque()).append((index, item))
+                self.waiting_count += 1
+                continue
+
+            if item_key is not None:
+                self.running_keys.add(item_key)
+            self.ready.append((index, item))
+        return pulled
+
+    def take_skipped(self, record: Callable[[BulkItemResult], None]) -> list:
+        """
+        Complete the skipped items pulled so far.
+
+        :param record: Called with each skipped result
+        :return: The results that can be yielded now
+        """
+        skipped, self.skipped = self.skipped, []
+        results = []
+        for result in skipped:
+            record(result)
+            results.extend(self.release(result))
+        return results
+
+    def startable(self):
+        """
+        Yield (index, item) pairs that may be started now.
+        """
+        while self.ready and self.in_flight < self.concurrency:
+            self.in_flight += 1
+            yield self.ready.popleft()
+
+    def complete(self, result: BulkItemResult) -> list:
+        """
+        Record a finished item.
+
+        :return: The results that can be yielded now
+        """
+        self.in_flight -= 1
+
+        item_key = self.key(result.item) if self.key else None
+        if item_key is not None:
+            queue = self.waiting.get(item_key)
+            if queue:
+                # Hand the key straight to the next item that shares it
+                index, item = queue.popleft()
+                self.waiting_count -= 1
+                self.ready.append((index, item))
+                if not queue:
+                    del self.waiting[item_key]
+            else:
+                self.running_keys.discard(item_key)
+
+        return self.release(result)
+
+    def release(self, result: BulkItemResult) -> list:
+        """
+        Buffer a finished result for ordered output.
+
+        :return: The results that can be yielded now
+        """
+        if not self.ordered:
+            return [result]
+
+        self.buffered[result.index] = result
+        results = []
+        while self.next_index in self.buffered:
+            results.append(self.buffered.pop(self.next_index))
+            self.next_index += 1
+        return results
+
+
+class BulkExecutor:
+    """
+    Runs a blocking function over a stream of items on a thread pool, keeping at most
+    `concurrency` calls in flight. Items are pulled from the input lazily and at most
+    `window` are held at once, so the input may be a generator of any length.
+
+    Iterating the executor yields a BulkItemResult per item, in input order when
+    `ordered` is true and in completion order otherwise. A failing item is reported in
+    its result and does not stop the batch. Statistics are available from `stats`
+    and are logged when the run finishes.
+
+    When `key` is given, items with the same key are never in flight at the same time
+    and run in input order, while items with different keys run in parallel.
+
+    Usage::
+
+        for result in BulkExecutor(pxc.create_project, projects, concurrency=16):
+            ...
+    """
+
+    def __init__(self,
+                 func: Callable[[Any], dict],
+                 items: Iterable,
+                 concurrency: int = 8,
+                 ordered: bool = True,
+                 key: Optional[Callable[[Any], Hashable]] = None,
+                 window: Optional[int] = None,
+                 name: str = "bulk operation",
+                 skip: Optional[Callable[[Any], Optional[Any]]] = None):
+        """
+        :param func: The function called with each item
+        :param items: The items to process
+        :param concurrency: The maximum number of calls in flight
+        :param ordered: Yield results in input order (True) or completion order (False)
+        :param key: A function returning the key that serializes items (optional)
+        :param window: The maximum number of items held at once (defaults to 4 * concurrency)
+        :param name: A label used when logging statistics
+        :param skip: A function returning the recorded response of an item that is already
+                     done, or None (optional). Such items are not called; they yield a
+                     result with skipped=True and keep their index in the input.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.func = func
+        self.items = items
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.key = key
+        self.window = max(window or 4 * concurrency, concurrency)
+        self.name = name
+        self.skip = skip
+        self.stats = BulkStats()
+        self.logger = get_logger(__name__)
+
+    def _new_window(self) -> _BulkWindow:
+        self.stats.started_at = time.perf_counter()
+        return _BulkWindow(self.items, self.concurrency, self.window, self.ordered, self.key, self.skip)
+
+    def _finish(self):
+        self.stats.finished_at = time.perf_counter()
+        self.logger.info("Finished %s: %s", self.name, self.stats)
+
+    def _call(self, index: int, item: Any) -> BulkItemResult:
+        try:
+            return BulkItemResult(index, item, self.func(item), None)
+        except BULK_ITEM_ERRORS as error:
+            return BulkItemResult(index, item, None, error)
+
+    def __iter__(self):
+        state = self._new_window()
+        pending = set()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                self.stats.submitted += state.fill()
+                yield from state.take_skipped(self.stats.record)
+                for index, item in state.startable():
+                    pending.add(executor.submit(self._call, index, item))
+
+                if not pending:
+                    if state.exhausted:
+                        break
+                    continue
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    self.stats.record(result)
+                    yield from state.complete(result)
+
+        self._finish()
+
+    def run(self) -> list:
+        """
+        Run the whole operation and return the list of results.
+        """
+        return list(self)
+
+
+class AsyncBulkExecutor(BulkExecutor):
+    """
+    Asyncio counterpart of BulkExecutor. `func` is a coroutine function, and results
+    are consumed with ``async for``.
+    """
+
+    async def _call(self, index: int, item: Any) -> BulkItemResult:
+        try:
+            return BulkItemResult(index, item, await self.func(item), None)
+        except BULK_ITEM_ERRORS as error:
+            return BulkItemResult(index, item, None, error)
+
+    def __iter__(self):
+        raise TypeError("AsyncBulkExecutor must be consumed with 'async for'")
+
+    async def __aiter__(self):
+        state = self._new_window()
+        pending = set()
+
+        try:
+            while True:
+                self.stats.submitted += state.fill()
+                for result in state.take_skipped(self.stats.record):
+                    yield result
+                for index, item in state.startable():
+                    pending.add(asyncio.ensure_future(self._call(index, item)))
+
+                if not pending:
+                    if state.exhausted:
+                        break
+                    continue
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    self.stats.record(result)
+                    for ready_result in state.complete(result):
+                        yield ready_result
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self._finish()
+
+    async def run(self) -> list:
+        """
+        Run the whole operation and return the list of results.
+        """
+        return [result async for result in self]
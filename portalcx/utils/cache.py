@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/cache.py
+--------------
+Size-bounded LRU cache with a time-to-live and HTTP validators (ETag and
+Last-Modified) for revalidating stale entries with conditional requests.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import httpx
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "etag", "last_modified")
+
+    def __init__(self, value: Any, expires_at: float, etag: Optional[str], last_modified: Optional[str]):
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of processed API responses.
+
+    Entries are served without a request until their TTL expires. A stale entry with
+    an ETag or Last-Modified validator is kept so it can be revalidated with
+    If-None-Match / If-Modified-Since; a 304 answer renews it. When the cache is full,
+    the least recently used entry is dropped.
+
+    Cached responses are shared between callers and must not be modified.
+
+    Counters: `hits` are answered from the cache without a request, `revalidations`
+    are answered from the cache after a 304, and `misses` are fetched in full.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        """
+        :param maxsize: The maximum number of entries
+        :param ttl: Seconds an entry is served without contacting the API
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[Optional[Any], Dict[str, str]]:
+        """
+        Look up a key.
+
+        :param key: The cache key
+        :return: A tuple of the fresh cached value (or None) and the conditional
+                 request headers to send when the value is stale
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, {}
+
+            self._entries.move_to_end(key)
+            if entry.expires_at > time.monotonic():
+                self.hits += 1
+                return entry.value, {}
+
+            headers = {}
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+            return None, headers
+
+    def store(self, key: Hashable, value: Any, response: httpx.Response, generation: Optional[int] = None):
+        """
+        Store a processed response along with the validators from its headers. Each
+        stored response counts as a miss.
+
+        :param key: The cache key
+        :param value: The processed response
+        :param response: The httpx response the value was built from
+        :param generation: The cache generation read before the request was sent. When
+                           an invalidation happened since, the value is not stored.
+        """
+        entry = _CacheEntry(value,
+                            time.monotonic() + self.ttl,
+                            response.headers.get('ETag'),
+                            response.headers.get('Last-Modified'))
+        with self._lock:
+            self.misses += 1
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key: Hashable) -> Optional[Any]:
+        """
+        Renew an entry after the API answered 304 Not Modified.
+
+        :param key: The cache key
+        :return: The cached value, or None if the entry was invalidated meanwhile
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl
+            self.revalidations += 1
+            return entry.value
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """
+        Drop one entry, or every entry when no key is given.
+
+        :param key: The cache key (optional)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self.invalidations += 1
+            self.generation += 1
+
+    def find(self, predicate) -> Optional[Hashable]:
+        """
+        Return the key of the first entry whose value matches the predicate.
+
+        :param predicate: A function called with each cached value
+        :return: The matching key, or None
+        """
+        with self._lock:
+            for key, entry in self._entries.items():
+                if predicate(entry.value):
+                    return key
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the cache counters.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+        }
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/circuit_breaker.py
+------------------------
+Per-host circuit breaker that stops sending requests to a degraded backend.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from .logger import get_logger
+
+
+class CircuitState(str, Enum):
+    """
+    The states of a circuit.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Called with the host, the previous state and the new state
+StateChangeHook = Callable[[str, CircuitState, CircuitState], None]
+
+
+class _HostCircuit:
+    """
+    The state of the circuit for a single host.
+    """
+
+    def __init__(self, window_size: int):
+        self.state = CircuitState.CLOSED
+        self.outcomes = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.trial_calls = 0
+        self.trials_started_at = 0.0
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of recent requests per host and opens the circuit when too
+    many of them fail or are slow.
+
+    - CLOSED: requests flow; the last `window_size` outcomes are recorded.
+    - OPEN: once at least `minimum_calls` outcomes are recorded and the failure rate
+      reaches `failure_rate_threshold` (or the slow-call rate reaches
+      `slow_call_rate_threshold`), requests are refused for `cooldown` seconds.
+    - HALF_OPEN: after the cooldown, up to `half_open_max_calls` trial requests are let
+      through. If they all succeed the circuit closes, otherwise it opens again.
+
+    Transport errors (connection failures, timeouts) and 5xx responses count as
+    failures; other 4xx responses do not, since they say nothing about backend health.
+    Hooks registered with add_listener() are called on every state change.
+    """
+
+    def __init__(self,
+                 failure_rate_threshold: float = 0.5,
+                 slow_call_threshold: Optional[float] = None,
+                 slow_call_rate_threshold: float = 1.0,
+                 window_size: int = 20,
+                 minimum_calls: int = 10,
+                 cooldown: float = 30.0,
+                 half_open_max_calls: int = 1):
+        """
+        :param failure_rate_threshold: The failure rate (0-1) that opens the circuit
+        :param slow_call_threshold: Seconds after which a call counts as slow (optional)
+        :param slow_call_rate_threshold: The slow-call rate (0-1) that opens the circuit
+        :param window_size: The number of recent outcomes considered
+        :param minimum_calls: The number of outcomes needed before the circuit can open
+        :param cooldown: Seconds the circuit stays open before trial calls are allowed
+        :param half_open_max_calls: The number of trial calls allowed while half-open
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self.listeners: List[StateChangeHook] = []
+        self.logger = get_logger(__name__)
+        self._circuits: Dict[str, _HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def add_listener(self, hook: StateChangeHook):
+        """
+        Register a function called with (host, old_state, new_state) on state changes.
+        """
+        self.listeners.append(hook)
+
+    def state(self, host: str) -> CircuitState:
+        """
+        Return the current state of the circuit for a host.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                return CircuitState.CLOSED
+            if circuit.state is CircuitState.OPEN and self._cooldown_left(circuit) == 0:
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def is_failure(self, error: Optional[Exception]) -> bool:
+        """
+        Check whether an exception raised by a request counts against the backend.
+        """
+        if error is None:
+            return False
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    def before_request(self, host: str) -> float:
+        """
+        Ask whether a request to a host may be sent.
+
+        :param host: The host the request is for
+        :return: 0 if the request may be sent, otherwise the seconds until the circuit
+                 allows trial calls again
+        """
+        changes = []
+        try:
+            with self._lock:
+                circuit = self._circuits.setdefault(host, _HostCircuit(self.window_size))
+
+                if circuit.state is CircuitState.OPEN:
+                    cooldown_left = self._cooldown_left(circuit)
+                    if cooldown_left:
+                        return cooldown_left
+                    self._transition(host, circuit, CircuitState.HALF_OPEN, changes)
+
+                if circuit.state is CircuitState.HALF_OPEN:
+                    now = time.monotonic()
+                    if circuit.trial_calls >= self.half_open_max_calls:
+                        # Trial calls are in flight; refuse others until they report back,
+                        # or until a cooldown passes in case a trial was abandoned
+                        waited = now - circuit.trials_started_at
+                        if waited < self.cooldown:
+                            return self.cooldown - waited
+                        circuit.trial_calls = 0
+                    if circuit.trial_calls == 0:
+                        circuit.trials_started_at = now
+                    circuit.trial_calls += 1
+
+                return 0.0
+        finally:
+            self._notify(changes)
+
+    def record(self, host: str, elapsed: float, error: Optional[Exception] = None):
+        """
+        Record the outcome of a request.
+
+        :param host: The host the request was sent to
+        :param elapsed: The request duration in seconds
+        :param error: The exception raised by the request, if any
+        """
+        failed = self.is_failure(error)
+        slow = self.slow_call_threshold is not None and elapsed >= self.slow_call_threshold
+        changes = []
+
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _HostCircuit(self.window_size))
+
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.trial_calls = max(0, circuit.trial_calls - 1)
+                if failed or slow:
+                    self._transition(host, circuit, CircuitState.OPEN, changes)
+                elif circuit.trial_calls == 0:
+                    self._transition(host, circuit, CircuitState.CLOSED, changes)
+            elif circuit.state is CircuitState.CLOSED:
+                circuit.outcomes.append((failed, slow))
+                if self._should_open(circuit):
+                    self._transition(host, circuit, CircuitState.OPEN, changes)
+
+        self._notify(changes)
+
+    def _should_open(self, circuit: _HostCircuit) -> bool:
+        calls = len(circuit.outcomes)
+        if calls < self.minimum_calls:
+            return False
+        failures = sum(1 for failed, _ in circuit.outcomes if failed)
+        slow_calls = sum(1 for _, slow in circuit.outcomes if slow)
+        return (failures / calls >= self.failure_rate_threshold
+                or (self.slow_call_threshold is not None and slow_calls / calls >= self.slow_call_rate_threshold))
+
+    def _cooldown_left(self, circuit: _HostCircuit) -> float:
+        return max(0.0, circuit.opened_at + self.cooldown - time.monotonic())
+
+    def _transition(self, host: str, circuit: _HostCircuit, state: CircuitState, changes: list):
+        changes.append((host, circuit.state, state))
+        circuit.state = state
+        circuit.trial_calls = 0
+        if state is CircuitState.OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state is CircuitState.CLOSED:
+            circuit.outcomes.clear()
+
+    def _notify(self, changes: list):
+        # Hooks run outside the lock so they may call back into the breaker
+        for host, old_state, new_state in changes:
+            self.logger.warning("Circuit for %s changed from %s to %s", host, old_state.value, new_state.value)
+            for hook in self.listeners:
+                hook(host, old_state, new_state)
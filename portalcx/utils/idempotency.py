@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/idempotency.py
+--------------------
+Idempotency keys for POST requests and a bounded table of the keyed requests that
+already succeeded, so a retried or repeated operation is not sent twice.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# The request header carrying the key
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+def derive_idempotency_key(endpoint: str, body: bytes) -> str:
+    """
+    A stable key for one logical operation: a hash of the endpoint and the JSON request
+    body, so the same model sent to the same endpoint always gets the same key.
+
+    :param endpoint: The API endpoint, e.g. '/api/Admin/Project/CreateProject'
+    :param body: The encoded request body
+    :return: A 32 character hexadecimal key
+    """
+    return hashlib.blake2b(endpoint.encode() + b"\0" + body, digest_size=16).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Thread-safe, size-bounded table of the responses to keyed POST requests that
+    succeeded.
+
+    While an entry is younger than `window` seconds, a request with the same key is
+    answered with the recorded response instead of being sent again. When the table
+    is full the oldest entry is dropped. Only completed requests are recorded: two
+    identical requests sent at the same time are both sent.
+
+    Keys derived from the request body make identical operations, e.g. creating the
+    same project twice, count as one. Pass an explicit idempotency_key to tell such
+    operations apart.
+
+    Recorded responses are shared between callers and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = 10_000, window: float = 600.0, retry: bool = False):
+        """
+        :param maxsize: The maximum number of recorded requests
+        :param window: Seconds a recorded request suppresses identical ones
+        :param retry: Let the retry policy retry keyed POST requests, as it does GETs.
+                      Only safe when the API honours the Idempotency-Key header.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.window = window
+        self.retry = retry
+        self.suppressed = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a key.
+
+        :param key: The idempotency key
+        :return: The recorded response if the key succeeded within the window, else None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self.suppressed += 1
+            return entry[1]
+
+    def record(self, key: Hashable, response: Any):
+        """
+        Record the response of a keyed request that succeeded.
+
+        :param key: The idempotency key
+        :param response: The processed response
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.window, response)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def forget(self, key: Optional[Hashable] = None):
+        """
+        Drop one entry, or every entry when no key is given, so the request can be sent again.
+
+        :param key: The idempotency key (optional)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
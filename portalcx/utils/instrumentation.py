@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/instrumentation.py
+------------------------
+Request hooks and per-endpoint timing and size histograms for API requests.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import httpx
+
+from .rate_limiter import endpoint_path
+
+# Histogram bucket upper bounds: 0.5ms to ~65s, and 64 bytes to 64 MiB, doubling
+SECONDS_BUCKETS = tuple(0.0005 * 2 ** i for i in range(18))
+BYTES_BUCKETS = tuple(64 * 2 ** i for i in range(21))
+
+TIME_METRICS = ("connect", "tls", "server", "total", "parse")
+SIZE_METRICS = ("request_bytes", "response_bytes")
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. Observing a value is a binary search and a counter
+    increment, so the memory used does not grow with the number of observations.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        """
+        :param bounds: The ascending upper bounds of the buckets; larger values go to an overflow bucket
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        """
+        Add a value to the histogram.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in, capped at the
+        largest value observed.
+
+        :param q: The quantile, between 0 and 1
+        :return: The estimate, or None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                bound = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        """
+        Return the histogram as plain data, with non-empty buckets as [upper bound, count]
+        pairs. The overflow bucket has an upper bound of None.
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": [[self.bounds[index] if index < len(self.bounds) else None, bucket_count]
+                        for index, bucket_count in enumerate(self.counts) if bucket_count],
+        }
+
+
+class RequestTiming:
+    """
+    The timings and sizes of one request attempt.
+
+    Connection phases are taken from httpx trace events. Name resolution happens
+    inside the TCP connect and is included in `connect`. `connect` and `tls` are None
+    when a pooled connection was reused. `server` runs from the request being sent to
+    the response headers arriving; without trace events (e.g. a mock transport) it
+    falls back to the total minus the connection phases.
+    """
+    __slots__ = ("method", "endpoint", "url", "headers", "attempt", "started_at", "finished_at",
+                 "status_code", "error", "request_bytes", "response_bytes", "_events")
+
+    def __init__(self, method: str, endpoint: str, url: str, headers: dict, attempt: int):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.headers = headers
+        self.attempt = attempt
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        self.status_code = None
+        self.error = None
+        self.request_bytes = None
+        self.response_bytes = None
+        self._events: Dict[str, float] = {}
+
+    def trace(self, name: str, info: dict):
+        """
+        The httpx 'trace' extension callback for sync clients.
+        """
+        # Event names look like "connection.connect_tcp.started"; keep "connect_tcp.started"
+        self._events[name.split('.', 1)[-1]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: dict):
+        """
+        The httpx 'trace' extension callback for async clients.
+        """
+        self.trace(name, info)
+
+    def _phase(self, start: str, end: str) -> Optional[float]:
+        started, ended = self._events.get(start), self._events.get(end)
+        if started is None or ended is None:
+            return None
+        return ended - started
+
+    @property
+    def connect(self) -> Optional[float]:
+        return self._phase("connect_tcp.started", "connect_tcp.complete")
+
+    @property
+    def tls(self) -> Optional[float]:
+        return self._phase("start_tls.started", "start_tls.complete")
+
+    @property
+    def total(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    @property
+    def server(self) -> Optional[float]:
+        server = self._phase("send_request_body.complete", "receive_response_headers.complete")
+        if server is None and self.status_code is not None:
+            server = self.total - (self.connect or 0.0) - (self.tls or 0.0)
+        return server
+
+    def finish(self, response: Optional[httpx.Response] = None, error: Optional[Exception] = None):
+        """
+        Stop the clock and record the status and sizes of the response, if any.
+        """
+        self.finished_at = time.perf_counter()
+        self.error = error
+        if response is not None:
+            self.status_code = response.status_code
+            content_length = response.request.headers.get('Content-Length')
+            self.request_bytes = int(content_length) if content_length else 0
+            self.response_bytes = len(response.content)
+
+    def __repr__(self):
+        return f"RequestTiming({self.method} {self.endpoint}, status={self.status_code}, total={self.total})"
+
+
+class EndpointMetrics:
+    """
+    Thread-safe per-endpoint histograms of request phases and sizes.
+
+    Series are keyed by the URL path of the request without its query string, so
+    ``DeleteStage?templateStageId=123`` and ``DeleteStage?templateStageId=456``
+    share one series.
+    """
+
+    def __init__(self):
+        self._endpoints: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, endpoint: str) -> dict:
+        series = self._endpoints.get(endpoint)
+        if series is None:
+            series = {"requests": 0, "errors": 0}
+            series.update((name, Histogram(SECONDS_BUCKETS)) for name in TIME_METRICS)
+            series.update((name, Histogram(BYTES_BUCKETS)) for name in SIZE_METRICS)
+            self._endpoints[endpoint] = series
+        return series
+
+    def record(self, timing: RequestTiming):
+        """
+        Add a finished request attempt to the histograms of its endpoint.
+        """
+        values = {
+            "connect": timing.connect,
+            "tls": timing.tls,
+            "server": timing.server,
+            "total": timing.total,
+            "request_bytes": timing.request_bytes,
+            "response_bytes": timing.response_bytes,
+        }
+        with self._lock:
+            series = self._series(urlsplit(timing.url).path)
+            series["requests"] += 1
+            if timing.error is not None or timing.status_code >= 400:
+                series["errors"] += 1
+            for name, value in values.items():
+                if value is not None:
+                    series[name].observe(value)
+
+    def record_parse(self, endpoint: str, seconds: float):
+        """
+        Add the time spent processing a response body to the histograms of its endpoint.
+
+        :param endpoint: The URL path of the request, with or without a query string
+        :param seconds: The processing time
+        """
+        with self._lock:
+            self._series(endpoint_path(endpoint))["parse"].observe(seconds)
+
+    def snapshot(self) -> dict:
+        """
+        Return all series as plain data, ready to be exported or dumped as JSON.
+
+        :return: {endpoint: {"requests": n, "errors": n, metric: histogram snapshot}}
+        """
+        with self._lock:
+            return {endpoint: {name: value.snapshot() if isinstance(value, Histogram) else value
+                               for name, value in series.items()}
+                    for endpoint, series in self._endpoints.items()}
+
+    def reset(self):
+        """
+        Drop all recorded series.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+
+# Hooks are called with the RequestTiming of an attempt
+RequestHook = Callable[[RequestTiming], None]
+
+
+class Instrumentation:
+    """
+    Pre-request and post-response hooks plus per-endpoint metrics for API requests.
+
+    Pre-request hooks run before each attempt is sent and may add entries to
+    ``timing.headers``. Post-response hooks run after each attempt, successful or
+    not, with the finished timing. One instance is shared by every API class of a
+    PortalCX or AsyncPortalCX instance.
+    """
+
+    def __init__(self, metrics: Optional[EndpointMetrics] = None):
+        """
+        :param metrics: The EndpointMetrics to record into (a new one by default)
+        """
+        self.metrics = metrics if metrics is not None else EndpointMetrics()
+        self.pre_request_hooks: List[RequestHook] = []
+        self.post_response_hooks: List[RequestHook] = []
+
+    def add_pre_request_hook(self, hook: RequestHook):
+        """
+        Register a function called with the RequestTiming before each attempt is sent.
+        """
+        self.pre_request_hooks.append(hook)
+
+    def add_post_response_hook(self, hook: RequestHook):
+        """
+        Register a function called with the finished RequestTiming after each attempt.
+        """
+        self.post_response_hooks.append(hook)
+
+    def start(self, method: str, endpoint: str, url: str, headers: dict, attempt: int) -> RequestTiming:
+        """
+        Start timing a request attempt and run the pre-request hooks.
+        """
+        timing = RequestTiming(method, endpoint, url, headers, attempt)
+        for hook in self.pre_request_hooks:
+            hook(timing)
+        return timing
+
+    def finish(self, timing: RequestTiming, response: Optional[httpx.Response] = None,
+               error: Optional[Exception] = None):
+        """
+        Finish timing a request attempt, record it and run the post-response hooks.
+        """
+        timing.finish(response, error)
+        self.metrics.record(timing)
+        for hook in self.post_response_hooks:
+            hook(timing)
+
+    def record_parse(self, endpoint: str, seconds: float):
+        """
+        Record the time spent processing a response body.
+        """
+        self.metrics.record_parse(endpoint, seconds)
+
+    def snapshot(self) -> dict:
+        """
+        Return the per-endpoint metrics as plain data. See EndpointMetrics.snapshot().
+        """
+        return self.metrics.snapshot()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/journal.py
+----------------
+A durable local journal of completed bulk items, so that a restarted job skips the
+items that already succeeded instead of creating them again.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+import orjson
+
+from .logger import get_logger
+
+
+def item_digest(item: Any, namespace: str = "") -> bytes:
+    """
+    A stable 16 byte hash of a request item.
+
+    SDK models are hashed through their request body, so two models that send the
+    same JSON get the same digest. Other items are hashed as JSON with sorted keys.
+
+    :param item: A request model or a JSON serializable value
+    :param namespace: The operation the item is used for, e.g. 'create_project'
+    :return: The digest
+    """
+    to_json = getattr(item, "to_json", None)
+    payload = to_json() if to_json is not None else orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(namespace.encode() + b"\0" + payload, digest_size=16).digest()
+
+
+class BulkJournal:
+    """
+    An append-only SQLite journal (in WAL mode) of the items a bulk job completed,
+    keyed by a hash of each item and holding the API response, such as the new
+    projectId.
+
+    The digests of completed items are loaded into a set when the journal is
+    opened, so checking an item that still has to be done costs one hash and one
+    set lookup. Writes are buffered and committed `batch_size` at a time, or once
+    `flush_interval` seconds have passed since the last commit, in a single
+    transaction. On a crash, at most the uncommitted buffer is lost, and those
+    items are sent again on restart. Use the journal as a context manager, or call close(), so
+    the buffer is committed when the job ends.
+
+    Recording is thread safe, so one journal can be shared by the workers of a
+    BulkExecutor.
+
+    Usage::
+
+        with BulkJournal("projects.journal") as journal:
+            for result in pxc.create_projects_bulk(projects, journal=journal):
+                ...
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 1.0):
+        """
+        :param path: The journal file, created when missing
+        :param batch_size: The number of records committed in one transaction
+        :param flush_interval: The longest time in seconds a record stays uncommitted
+                               while the job keeps recording
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[bytes, bytes, float]] = []
+        self._last_flush = time.monotonic()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only risks the last commits on power loss, never corruption
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS completed ("
+            "digest BLOB PRIMARY KEY, response BLOB NOT NULL, recorded_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._completed: Set[bytes] = {row[0] for row in self._connection.execute("SELECT digest FROM completed")}
+        self.logger.info("Opened journal %s with %d completed items", path, len(self._completed))
+
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self._completed
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def __enter__(self) -> "BulkJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, digest: bytes) -> Optional[dict]:
+        """
+        The recorded response of a completed item.
+
+        :param digest: The item's digest, from item_digest()
+        :return: The response, or None if the item is not in the journal
+        """
+        if digest not in self._completed:
+            return None
+        with self._lock:
+            for pending_digest, response, _ in reversed(self._pending):
+                if pending_digest == digest:
+                    return orjson.loads(response)
+            row = self._connection.execute("SELECT response FROM completed WHERE digest = ?", (digest,)).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def record(self, digest: bytes, response: Optional[dict]):
+        """
+        Record a completed item. The record is committed with the next batch.
+
+        :param digest: The item's digest, from item_digest()
+        :param response: The API response of the item
+        """
+        body = orjson.dumps(dict(response) if response is not None else None)
+        with self._lock:
+            self._completed.add(digest)
+            self._pending.append((digest, body, time.time()))
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+
+    def flush(self):
+        """
+        Commit the buffered records.
+        """
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO completed (digest, response, recorded_at) VALUES (?, ?, ?)", pending
+            )
+
+    def close(self):
+        """
+        Commit the buffered records and close the journal.
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._flush()
+            self._connection.close()
+            self._connection = None
+
+    def completed_response(self, item: Any, namespace: str) -> Optional[dict]:
+        """
+        The recorded response of an item the journal holds for an operation. Pass it
+        as the `skip` function of a BulkExecutor, e.g.
+        ``partial(journal.completed_response, namespace="create_project")``.
+
+        :param item: An item of the bulk job
+        :param namespace: The operation name the items were recorded under
+        :return: The recorded response, or None when the item still has to be done
+        """
+        digest = item_digest(item, namespace)
+        if digest not in self._completed:
+            return None
+        return self.get(digest)
+
+    def recording(self, func: Callable[[Any], dict], namespace: str) -> Callable[[Any], dict]:
+        """
+        Wrap a bulk function so that every item it completes is recorded.
+
+        :param func: The function called with each item
+        :param namespace: The operation name to record the items under
+        :return: The wrapped function
+        """
+        def record_call(item: Any) -> dict:
+            response = func(item)
+            self.record(item_digest(item, namespace), response)
+            return response
+        return record_call
+
+    def async_recording(self, func: Callable[[Any], Awaitable[dict]],
+                        namespace: str) -> Callable[[Any], Awaitable[dict]]:
+        """
+        Asyncio counterpart of recording(), for a coroutine function.
+        """
+        async def record_call(item: Any) -> dict:
+            response = await func(item)
+            self.record(item_digest(item, namespace), response)
+            return response
+        return record_call
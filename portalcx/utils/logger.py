@@ -5,22 +5,140 @@
 utils/logger.py
 ---------------
 Logger for PortalCX SDK.
+
+All SDK loggers are children of the "portalcx" logger, which gets a single
+console handler the first time get_logger() is called. Each module logs to its
+own child logger, so verbosity can be set per module with set_log_level().
+enable_queue_logging() moves the handlers' I/O onto a background thread.
 """
 
+import atexit
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOGGER_NAME = "portalcx"
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_lock = threading.Lock()
+_configured = False
+_queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def _configure():
+    """
+    Attach the console handler to the "portalcx" logger once per process.
+    """
+    global _configured
+
+    with _lock:
+        if _configured:
+            return
+
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.setLevel(logging.DEBUG)
+
+        # Define console handler and formatter
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.DEBUG)
+        console_formatter = logging.Formatter(LOG_FORMAT)
+        console_handler.setFormatter(console_formatter)
+        logger.addHandler(console_handler)
+
+        _configured = True
 
-def get_logger() -> logging.Logger:
+
+def _logger_name(name: str) -> str:
+    """
+    Place a logger name under the "portalcx" hierarchy.
+    """
+    if name == LOGGER_NAME or name.startswith(LOGGER_NAME + "."):
+        return name
+    return f"{LOGGER_NAME}.{name}"
+
+
+def get_logger(name: str = LOGGER_NAME) -> logging.Logger:
     """
-    Returns a configured logger instance.
+    Returns a configured logger instance. Safe to call any number of times; handlers
+    are only attached once.
+
+    :param name: The logger name. Names outside the "portalcx" hierarchy are placed
+                 under it, e.g. "api.admin_projects" becomes "portalcx.api.admin_projects".
     """
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG)
+    if not _configured:
+        _configure()
+
+    return logging.getLogger(_logger_name(name))
+
+
+def set_log_level(level, name: str = LOGGER_NAME):
+    """
+    Set the verbosity of the SDK, or of one of its modules.
+
+    Usage::
+
+        set_log_level(logging.WARNING)                        # the whole SDK
+        set_log_level(logging.DEBUG, "api.admin_templates")   # one module
+
+    :param level: A logging level such as logging.INFO or "WARNING"
+    :param name: The logger name, as accepted by get_logger()
+    """
+    get_logger(name).setLevel(level)
+
+
+def enable_queue_logging() -> QueueListener:
+    """
+    Route SDK log records through a queue so that handler I/O happens on a background
+    thread instead of the thread making API requests.
+
+    The handlers currently attached to the "portalcx" logger are moved behind a
+    QueueListener. Calling this again returns the running listener.
+
+    :return: The running QueueListener
+    """
+    global _queue_listener, _queue_handler
+
+    get_logger()
+
+    with _lock:
+        if _queue_listener is not None:
+            return _queue_listener
+
+        logger = logging.getLogger(LOGGER_NAME)
+        handlers = list(logger.handlers)
+        log_queue = queue.SimpleQueue()
+
+        _queue_handler = QueueHandler(log_queue)
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(_queue_handler)
+        _queue_listener.start()
+
+    atexit.register(disable_queue_logging)
+
+    return _queue_listener
+
+
+def disable_queue_logging():
+    """
+    Flush queued records and attach the handlers directly to the "portalcx" logger again.
+    """
+    global _queue_listener, _queue_handler
+
+    with _lock:
+        if _queue_listener is None:
+            return
 
-    # Define console handler and formatter
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
-    console_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.removeHandler(_queue_handler)
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            logger.addHandler(handler)
 
-    return logger
+        _queue_listener = None
+        _queue_handler = None
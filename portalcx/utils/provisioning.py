@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/provisioning.py
+---------------------
+Helpers shared by the sync and async template provisioning pipelines.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from ..api.admin_templates import stage_ids_by_name
+from ..api.api_base import APIBaseError
+from ..models.admin_template_models import TemplateStageCreateRequest
+
+
+class ProvisionedTemplate(NamedTuple):
+    """
+    A template created together with its stages.
+    """
+    template_id: str
+    # Stage name to templateStageId, in the order the stages were given
+    stage_ids: Dict[str, int]
+
+
+class ProvisioningError(APIBaseError):
+    """
+    Raised when provisioning a template fails part way. The partially created
+    template has been deleted unless `rolled_back` is false.
+    """
+
+    def __init__(self, template_id: Optional[str], error: Exception, rolled_back: bool):
+        """
+        :param template_id: The id of the template that was created, if any
+        :param error: The error that stopped provisioning
+        :param rolled_back: Whether the created stages and template were deleted
+        """
+        self.template_id = template_id
+        self.error = error
+        self.rolled_back = rolled_back
+        state = "rolled back" if rolled_back else "rollback failed"
+        super().__init__(getattr(error, 'status_code', None),
+                         f"Provisioning template {template_id} failed ({state}): {error}")
+
+
+def check_stage_names(stages: Sequence[TemplateStageCreateRequest]):
+    """
+    Make sure stage names are unique, since the result is keyed by name.
+
+    :param stages: The stages to create
+    :raise: ValueError if two stages share a name
+    """
+    seen = set()
+    for stage in stages:
+        if stage.stageName in seen:
+            raise ValueError(f"Duplicate stage name: {stage.stageName}")
+        seen.add(stage.stageName)
+
+
+def stages_for_template(template_id: str,
+                        stages: Sequence[TemplateStageCreateRequest]) -> List[TemplateStageCreateRequest]:
+    """
+    Copy the stage requests with their templateId set to the new template.
+    """
+    return [stage.copy(update={'templateId': template_id}) for stage in stages]
+
+
+def provisioned_template(template_id: str,
+                         stages: Sequence[TemplateStageCreateRequest],
+                         response_data: Dict) -> ProvisionedTemplate:
+    """
+    Build the result from the GetAllStagesByTemplateId response read after the
+    stages were created.
+
+    :param template_id: The id of the new template
+    :param stages: The stages that were created
+    :param response_data: The processed GetAllStagesByTemplateId response
+    :return: A ProvisionedTemplate
+    :raise: ValueError if a created stage is missing from the response
+    """
+    stage_ids = stage_ids_by_name(response_data)
+    missing = [stage.stageName for stage in stages if stage.stageName not in stage_ids]
+    if missing:
+        raise ValueError(f"Stages missing after creation: {', '.join(missing)}")
+    return ProvisionedTemplate(template_id, {stage.stageName: stage_ids[stage.stageName] for stage in stages})
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/rate_limiter.py
+---------------------
+Client-side token-bucket rate limiting for API requests.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+# A rate in requests per second, or a (rate, burst) pair
+RateSpec = Union[float, Tuple[float, float]]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Callers reserve
+    a token and are told how long to wait for it, so waiting callers are served in
+    the order they reserved, and the same bucket works for threads and coroutines.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        :param rate: Tokens added per second
+        :param burst: The bucket capacity (defaults to one second worth of tokens, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, going into debt if necessary.
+
+        :param tokens: The number of tokens to take
+        :return: The number of seconds to wait before using them
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Paces requests with a client-wide token bucket and optional per-endpoint buckets.
+
+    One limiter is shared by every API class of a PortalCX or AsyncPortalCX instance.
+    A request waits for a token from the client-wide bucket and from the bucket of its
+    endpoint, if one is configured.
+
+    Usage::
+
+        RateLimiter(rate=20, endpoint_limits={"/api/Admin/Project/CreateProject": 5})
+    """
+
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: Optional[float] = None,
+                 endpoint_limits: Optional[Dict[str, RateSpec]] = None):
+        """
+        :param rate: Requests per second for the whole client (optional)
+        :param burst: Requests allowed at once for the whole client (optional)
+        :param endpoint_limits: A mapping of endpoint path to a rate or a (rate, burst) pair
+        """
+        self.bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.endpoint_buckets: Dict[str, TokenBucket] = {}
+
+        for endpoint, spec in (endpoint_limits or {}).items():
+            endpoint_rate, endpoint_burst = spec if isinstance(spec, tuple) else (spec, None)
+            self.endpoint_buckets[endpoint_path(endpoint)] = TokenBucket(endpoint_rate, endpoint_burst)
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        Reserve a request to an endpoint.
+
+        :param endpoint: The API endpoint, with or without a query string
+        :return: The number of seconds to wait before sending the request
+        """
+        delay = self.bucket.reserve() if self.bucket is not None else 0.0
+
+        endpoint_bucket = self.endpoint_buckets.get(endpoint_path(endpoint))
+        if endpoint_bucket is not None:
+            delay = max(delay, endpoint_bucket.reserve())
+
+        return delay
+
+
+def endpoint_path(endpoint: str) -> str:
+    """
+    Strip the query string from an endpoint.
+    """
+    return endpoint.split('?', 1)[0]
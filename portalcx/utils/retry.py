@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/retry.py
+--------------
+Retry policy with exponential backoff and full jitter for API requests.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Iterable, Optional
+
+import httpx
+
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given either in seconds or as an HTTP date.
+
+    :param value: The header value
+    :return: The number of seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried and how long to wait first.
+
+    Requests are retried on transport errors (connection failures, resets and
+    timeouts) and on responses with a status in `retry_statuses`. Only methods in
+    `retry_methods` are retried unless a call opts in explicitly, so POSTs are not
+    re-sent by default. Waits use exponential backoff with full jitter, and a
+    Retry-After header is honored when present.
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+                 retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 respect_retry_after: bool = True,
+                 max_retry_after: float = 60.0):
+        """
+        :param max_attempts: The total number of attempts, including the first one
+        :param backoff_base: The backoff ceiling in seconds for the first retry; it doubles on each retry
+        :param backoff_max: The largest backoff ceiling in seconds
+        :param retry_statuses: HTTP status codes that are retried
+        :param retry_methods: HTTP methods that are retried without opting in per call
+        :param respect_retry_after: Wait at least as long as a Retry-After header asks
+        :param max_retry_after: Give up instead of waiting when Retry-After asks for longer than this
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_methods: FrozenSet[str] = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full-jitter backoff: a random wait between zero and the exponential ceiling.
+
+        :param attempt: The number of the attempt that just failed, starting at 1
+        :return: The number of seconds to wait
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        """
+        Check whether an exception raised while sending a request may be retried.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(error, httpx.TransportError)
+
+    def get_delay(self, method: str, attempt: int, error: Exception, retry: Optional[bool] = None) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        :param method: The HTTP method of the request
+        :param attempt: The number of the attempt that just failed, starting at 1
+        :param error: The exception raised by the attempt
+        :param retry: Per-call override; True retries any method, False never retries
+        :return: The number of seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_attempts or retry is False:
+            return None
+        if retry is None and method.upper() not in self.retry_methods:
+            return None
+        if not self.is_retryable_error(error):
+            return None
+
+        delay = self.backoff(attempt)
+
+        if self.respect_retry_after and isinstance(error, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(error.response.headers.get('Retry-After'))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = max(delay, retry_after)
+
+        return delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/teardown.py
+-----------------
+Bookkeeping for bulk deletes of projects, stages and templates.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from ..api.api_base import APIBaseError
+from .bulk import BulkItemResult
+
+# Deletion order: projects use stages, and stages belong to templates
+TEARDOWN_PHASES = ("projects", "stages", "templates")
+
+
+def delete_if_exists(delete: Callable[[Any], dict], item: Any) -> Optional[dict]:
+    """
+    Call a delete function, treating 404 Not Found as already deleted.
+
+    :return: The response, or None if the item did not exist
+    """
+    try:
+        return delete(item)
+    except APIBaseError as error:
+        if error.status_code == 404:
+            return None
+        raise
+
+
+async def async_delete_if_exists(delete: Callable[[Any], Awaitable[dict]], item: Any) -> Optional[dict]:
+    """
+    Asyncio counterpart of delete_if_exists.
+    """
+    try:
+        return await delete(item)
+    except APIBaseError as error:
+        if error.status_code == 404:
+            return None
+        raise
+
+
+class TeardownReport:
+    """
+    The outcome of a teardown, per phase.
+
+    A phase is only started when every earlier phase succeeded, since deleting a
+    template whose projects still exist fails or orphans them. Later phases are
+    listed in `skipped` instead. Deletes are idempotent, so a teardown can simply
+    be run again with the same ids.
+    """
+
+    def __init__(self,
+                 items: Dict[str, Iterable],
+                 progress: Optional[Callable[[str, int, int], None]] = None):
+        """
+        :param items: The ids to delete per phase
+        :param progress: Called as progress(phase, completed, total) after every delete (optional)
+        """
+        self.items: Dict[str, List] = {phase: list(items.get(phase, ())) for phase in TEARDOWN_PHASES}
+        self.progress = progress
+        self.deleted = dict.fromkeys(TEARDOWN_PHASES, 0)
+        self.missing = dict.fromkeys(TEARDOWN_PHASES, 0)
+        self.failures: Dict[str, List[BulkItemResult]] = {phase: [] for phase in TEARDOWN_PHASES}
+        self.skipped: List[str] = []
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.skipped and not any(self.failures.values())
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def completed(self, phase: str) -> int:
+        return self.deleted[phase] + self.missing[phase] + len(self.failures[phase])
+
+    def start(self, phase: str) -> bool:
+        """
+        Decide whether a phase runs.
+
+        :return: False if an earlier phase failed and this one is skipped
+        """
+        if any(self.failures.values()) or self.skipped:
+            self.skipped.append(phase)
+            return False
+        return True
+
+    def record(self, phase: str, result: BulkItemResult):
+        """
+        Count a finished delete and report progress.
+        """
+        if not result.ok:
+            self.failures[phase].append(result)
+        elif result.response is None:
+            self.missing[phase] += 1
+        else:
+            self.deleted[phase] += 1
+
+        if self.progress is not None:
+            self.progress(phase, self.completed(phase), len(self.items[phase]))
+
+    def finish(self) -> "TeardownReport":
+        self.finished_at = time.perf_counter()
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            phase: {
+                "total": len(self.items[phase]),
+                "deleted": self.deleted[phase],
+                "missing": self.missing[phase],
+                "failed": len(self.failures[phase]),
+                "skipped": phase in self.skipped,
+            }
+            for phase in TEARDOWN_PHASES
+        }
+
+    def __repr__(self):
+        return f"TeardownReport(ok={self.ok}, elapsed={self.elapsed:.3f}s, {self.to_dict()})"
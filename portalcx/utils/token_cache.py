@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/token_cache.py
+--------------------
+On-disk cache of API tokens shared by processes on the same machine, so short-lived
+workers can skip the login round trip on a cold start.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+
+from .logger import get_logger
+from .token_manager import jwt_expiry
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "portalcx", "tokens.json")
+
+
+class TokenCache:
+    """
+    A JSON file of tokens keyed by a hash of the base URL and email.
+
+    The file and its directory are only readable by the current user (0600/0700), and
+    every read-modify-write happens under an exclusive lock on a sidecar lock file.
+    Logins through a cache also hold that lock, so when many workers start at once one
+    of them logs in and the others pick up its token from the file. Only tokens whose
+    JWT claims carry an expiry are cached, and a cached token is reused until
+    `min_ttl` seconds before it expires.
+
+    The location defaults to the PORTALCX_TOKEN_CACHE environment variable, or
+    ~/.cache/portalcx/tokens.json.
+    """
+
+    def __init__(self, path: Optional[str] = None, min_ttl: float = 300.0):
+        """
+        :param path: The cache file (optional)
+        :param min_ttl: Cached tokens expiring within this many seconds are not reused
+        """
+        self.path = path or os.environ.get("PORTALCX_TOKEN_CACHE") or DEFAULT_TOKEN_CACHE_PATH
+        self.lock_path = self.path + ".lock"
+        self.min_ttl = min_ttl
+        self.logger = get_logger(__name__)
+
+    @staticmethod
+    def key(base_url: str, email: str) -> str:
+        """
+        The cache key of an account; the email itself is not written to the file.
+        """
+        return hashlib.sha256(f"{base_url.rstrip('/')}\n{email.lower()}".encode()).hexdigest()
+
+    def acquire(self) -> int:
+        """
+        Take the exclusive cache lock, blocking until it is free.
+
+        :return: A handle to pass to release()
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", mode=0o700, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        except OSError:
+            os.close(fd)
+            raise
+        return fd
+
+    def release(self, fd: int):
+        """
+        Release a lock taken with acquire().
+        """
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "rb") as cache_file:
+                entries = orjson.loads(cache_file.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            self.logger.warning("Ignoring unreadable token cache %s: %s", self.path, error)
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: dict):
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as cache_file:
+            cache_file.write(orjson.dumps(entries))
+        os.replace(temp_path, self.path)
+
+    def load(self, base_url: str, email: str) -> Optional[str]:
+        """
+        Return the cached token of an account if it is still valid for at least min_ttl
+        seconds. Call with the lock held.
+        """
+        entry = self._read().get(self.key(base_url, email))
+        if not entry or entry.get("expires_at", 0) - time.time() < self.min_ttl:
+            return None
+        return entry.get("token")
+
+    def store(self, base_url: str, email: str, token: str):
+        """
+        Save the token of an account, dropping expired entries. Call with the lock held.
+        """
+        expires_at = jwt_expiry(token)
+        if expires_at is None:
+            return
+
+        now = time.time()
+        entries = {key: entry for key, entry in self._read().items()
+                   if isinstance(entry, dict) and entry.get("expires_at", 0) > now}
+        entries[self.key(base_url, email)] = {"token": token, "expires_at": expires_at}
+        self._write(entries)
+
+    def cached_login(self, base_url: str, email: str, login: Callable[[], str]) -> "CachedLogin":
+        """
+        Wrap a login function so it reuses and shares tokens through this cache.
+        """
+        return CachedLogin(self, base_url, email, login)
+
+    def async_cached_login(self, base_url: str, email: str,
+                           login: Callable[[], Awaitable[str]]) -> "AsyncCachedLogin":
+        """
+        Wrap an async login function so it reuses and shares tokens through this cache.
+        """
+        return AsyncCachedLogin(self, base_url, email, login)
+
+
+class CachedLogin:
+    """
+    A login function for TokenManager that reads the token cache first.
+
+    A cached token is not returned twice in a row: when the token manager asks again,
+    the token it got last time has gone stale or was rejected, so the login is
+    performed and the cache updated.
+    """
+
+    def __init__(self, cache: TokenCache, base_url: str, email: str, login: Callable[[], Any]):
+        self.cache = cache
+        self.base_url = base_url
+        self.email = email
+        self.login = login
+        self.last_token: Optional[str] = None
+
+    def _cached(self) -> Optional[str]:
+        token = self.cache.load(self.base_url, self.email)
+        if token is not None and token != self.last_token:
+            self.cache.logger.info("Using the cached API token")
+            self.last_token = token
+            return token
+        return None
+
+    def _store(self, token: Optional[str]) -> Optional[str]:
+        if token:
+            self.cache.store(self.base_url, self.email, token)
+        self.last_token = token
+        return token
+
+    def __call__(self) -> Optional[str]:
+        fd = self.cache.acquire()
+        try:
+            return self._cached() or self._store(self.login())
+        finally:
+            self.cache.release(fd)
+
+
+class AsyncCachedLogin(CachedLogin):
+    """
+    Asyncio counterpart of CachedLogin. The file lock is taken on a worker thread so
+    waiting for another process does not block the event loop.
+    """
+
+    async def __call__(self) -> Optional[str]:
+        fd = await asyncio.get_running_loop().run_in_executor(None, self.cache.acquire)
+        try:
+            return self._cached() or self._store(await self.login())
+        finally:
+            self.cache.release(fd)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+utils/token_manager.py
+----------------------
+One bearer token shared by every API class of a client, refreshed before it expires.
+"""
+
+import asyncio
+import base64
+import binascii
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import orjson
+
+from .logger import get_logger
+
+
+def jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """
+    Read the expiry time of a JWT without verifying its signature.
+
+    :param token: The JWT
+    :return: The 'exp' claim as a Unix timestamp, or None if the token is not a JWT
+             or has no expiry
+    """
+    if not token or token.count('.') != 2:
+        return None
+
+    payload = token.split('.')[1]
+    try:
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except (binascii.Error, ValueError):
+        return None
+
+    expiry = claims.get('exp') if isinstance(claims, dict) else None
+    if isinstance(expiry, (int, float)) and not isinstance(expiry, bool):
+        return float(expiry)
+    return None
+
+
+class TokenManager:
+    """
+    Holds the bearer token used by all API classes of a PortalCX instance.
+
+    Once `login` is set (PortalCX.login does this), the token is refreshed by logging
+    in again when it is within `refresh_margin` seconds (at most half its lifetime)
+    of the expiry in its JWT claims, or when a request is answered with 401.
+    Refreshes are single-flight: when many threads find the token stale at once, one
+    of them logs in and the others wait for and reuse its token.
+    """
+
+    def __init__(self, token: Optional[str] = None, refresh_margin: float = 60.0):
+        """
+        :param token: The initial token (optional)
+        :param refresh_margin: Refresh this many seconds before the token expires
+        """
+        self.refresh_margin = refresh_margin
+        self.login: Optional[Callable[[], Any]] = None
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self.token = token
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        self._token = value
+        self.expires_at = jwt_expiry(value)
+        self.received_at = time.time()
+
+    @property
+    def can_refresh(self) -> bool:
+        return self.login is not None
+
+    def needs_refresh(self) -> bool:
+        """
+        Check whether the token should be refreshed before it is used.
+        """
+        if not self.can_refresh:
+            return False
+        if self._token is None:
+            return True
+        if self.expires_at is None:
+            return False
+
+        # Short-lived tokens are refreshed halfway through their life rather than on every use
+        margin = min(self.refresh_margin, (self.expires_at - self.received_at) / 2)
+        return time.time() >= self.expires_at - margin
+
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def get_token(self) -> Optional[str]:
+        """
+        Return the token to send, refreshing it first if it is about to expire.
+
+        If the refresh fails while the current token has not yet expired, the current
+        token is returned and the refresh is tried again on the next call.
+        """
+        token = self._token
+        if not self.needs_refresh():
+            return token
+
+        try:
+            return self.refresh(token)
+        except Exception as error:
+            if token is None or self.is_expired():
+                raise
+            self.logger.warning("Token refresh failed, using the current token until it expires: %s", error)
+            return token
+
+    def refresh(self, stale_token: Optional[str]) -> Optional[str]:
+        """
+        Replace a stale token by logging in again, unless another caller already did.
+
+        :param stale_token: The token the caller found stale or had rejected
+        :return: The new token
+        """
+        with self._lock:
+            if self._token != stale_token or self.login is None:
+                return self._token
+
+            self.logger.info("Refreshing the API token")
+            self.token = self.login()
+            return self._token
+
+
+class AsyncTokenManager(TokenManager):
+    """
+    Asyncio counterpart of TokenManager. `login` returns an awaitable, and concurrent
+    refreshes on one event loop are single-flight.
+    """
+
+    def __init__(self, token: Optional[str] = None, refresh_margin: float = 60.0):
+        super().__init__(token, refresh_margin)
+        self._async_lock: Optional[asyncio.Lock] = None
+
+    async def get_token(self) -> Optional[str]:
+        """
+        Return the token to send, refreshing it first if it is about to expire.
+        """
+        token = self._token
+        if not self.needs_refresh():
+            return token
+
+        try:
+            return await self.refresh(token)
+        except Exception as error:
+            if token is None or self.is_expired():
+                raise
+            self.logger.warning("Token refresh failed, using the current token until it expires: %s", error)
+            return token
+
+    async def refresh(self, stale_token: Optional[str]) -> Optional[str]:
+        """
+        Replace a stale token by logging in again, unless another task already did.
+
+        :param stale_token: The token the caller found stale or had rejected
+        :return: The new token
+        """
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            if self._token != stale_token or self.login is None:
+                return self._token
+
+            self.logger.info("Refreshing the API token")
+            self.token = await self.login()
+            return self._token
@@ -23,4 +23,9 @@ setup(
     url='https://github.com/portalcx/PortalCX-Customer-Portal-SDK',
     packages=find_packages(),
     install_requires=required,
+    entry_points={
+        'console_scripts': [
+            'portalcx=portalcx.cli:main',
+        ],
+    },
 )
\ No newline at end of file
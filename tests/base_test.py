@@ -4,14 +4,22 @@
 """
 tests/base_test.py
 ------------------
-Base test class for PortalCX tests.
+Base test class for PortalCX tests, and the mock servers and requests shared by
+the unit tests.
 """
 
 import os
+import threading
 
+import httpx
+import orjson
 import pytest
 
-from portalcx import PortalCX
+from portalcx import AsyncPortalCX, PortalCX
+from portalcx.models.admin_project_models import ProjectCreateRequest
+
+BASE_URL = "https://portalcx.test"
+TEMPLATE_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
 
 
 class BaseTest:
@@ -34,6 +42,65 @@ class BaseTest:
         self.pxc.token = auth_token
         request.cls.token = auth_token
 
+
+def mock_portalcx(handler, auth_token: str = "abc", **kwargs) -> PortalCX:
+    """
+    A client whose requests are answered by `handler` through an httpx.MockTransport.
+
+    :param handler: Takes an httpx.Request and returns an httpx.Response
+    :param auth_token: The token of the client (None to start logged out)
+    :param kwargs: Other PortalCX arguments
+    """
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return PortalCX(base_url=BASE_URL, auth_token=auth_token, client=client, **kwargs)
+
+
+def mock_async_portalcx(handler, auth_token: str = "abc", **kwargs) -> AsyncPortalCX:
+    """
+    The asyncio counterpart of mock_portalcx. `handler` may be a coroutine function.
+    """
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncPortalCX(base_url=BASE_URL, auth_token=auth_token, client=client, **kwargs)
+
+
+def project_request(index: int = 0, **overrides) -> ProjectCreateRequest:
+    """
+    A valid project creation request for "The Dude {index}".
+    """
+    fields = {"templateId": TEMPLATE_ID, "firstName": "The", "lastName": f"Dude {index}",
+              "email": "thedude@portalcx.com", "phoneNumber": "8016697921", "notifyViaEmail": True,
+              "notifyViaSMS": True, "completeFirstStage": False, "countryId": 1}
+    fields.update(overrides)
+    return ProjectCreateRequest(**fields)
+
+
+class ProjectServer:
+    """
+    Creates projects, failing those whose last name ends with "fail", and completes
+    project stages. Keeps the body of every accepted request and counts how often
+    each last name was created.
+    """
+
+    def __init__(self):
+        self.bodies = []
+        self.created = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        if request.url.path.endswith("/CompleteProjectStage"):
+            with self.lock:
+                self.bodies.append(body)
+            return httpx.Response(200, content=b"Project stage completed successfully")
+        if body["lastName"].endswith("fail"):
+            return httpx.Response(400, json={"errorMessage": "Rejected"})
+        with self.lock:
+            self.bodies.append(body)
+            self.created[body["lastName"]] = self.created.get(body["lastName"], 0) + 1
+            project_id = len(self.created)
+        return httpx.Response(200, json={"message": "Project created successfully", "projectId": project_id})
+
+
 class AssertResponse:
 
     @staticmethod
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_async_client.py
+--------------------------
+Unit tests for the asyncio client, AsyncPortalCX.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from portalcx.api.admin_templates import AsyncAdminTemplate
+from portalcx.api.api_base import APIBaseError
+from tests.base_test import BASE_URL, mock_async_portalcx, project_request
+
+
+class TestAsyncPortalCX:
+
+    def test_login_sets_token_on_all_api_classes(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"token": "async-token"})
+
+        async def run():
+            async with mock_async_portalcx(handler, auth_token=None) as pxc:
+                token = await pxc.login(email="thedude@portalcx.com", password="secret")
+                return pxc, token
+
+        pxc, token = asyncio.run(run())
+
+        assert token == "async-token"
+        assert pxc.admin_template.token == "async-token"
+        assert pxc.admin_project.token == "async-token"
+
+    def test_many_create_project_calls_in_flight(self):
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            assert request.headers["Authorization"] == "Bearer abc"
+            return httpx.Response(200, json={"message": "Project created successfully", "projectId": 1})
+
+        async def run():
+            async with mock_async_portalcx(handler) as pxc:
+                return await asyncio.gather(*(pxc.create_project(project_request(i)) for i in range(200)))
+
+        responses = asyncio.run(run())
+
+        assert len(responses) == 200
+        assert all(response["data"]["projectId"] == 1 for response in responses)
+        assert peak_in_flight > 1
+
+    def test_error_response_raises_api_base_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"errorMessage": "Invalid project"})
+
+        async def run():
+            async with mock_async_portalcx(handler) as pxc:
+                await pxc.delete_project(1)
+
+        with pytest.raises(APIBaseError) as exc_info:
+            asyncio.run(run())
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.error_message == "Invalid project"
+
+    def test_async_api_classes_refuse_sync_closing(self):
+        admin_template = AsyncAdminTemplate(BASE_URL, "abc")
+
+        with pytest.raises(TypeError, match="async with"):
+            with admin_template:
+                pass
+        with pytest.raises(TypeError, match="aclose"):
+            admin_template.close()
+
+        async def run():
+            async with admin_template:
+                assert isinstance(admin_template.client, httpx.AsyncClient)
+            assert admin_template._client is None
+
+        asyncio.run(run())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_batch_validation.py
+------------------------------
+Unit tests for columnar validation of request batches.
+"""
+
+import re
+
+from portalcx.models.admin_project_models import GetProjectDetailViewModel, ProjectCreateRequest, ProjectStatusEnum
+from portalcx.models.admin_template_models import ProjectStageCompleteRequest
+from portalcx.utils.batch_validation import BatchValidator, validate_project_rows
+from tests.base_test import TEMPLATE_ID
+
+
+def project_row(index: int, **overrides) -> dict:
+    row = {"templateId": TEMPLATE_ID, "firstName": "The", "lastName": f"Dude {index}",
+           "email": "thedude@portalcx.com", "phoneNumber": "8016697921", "notifyViaEmail": True,
+           "notifyViaSMS": False, "completeFirstStage": False, "countryId": 1,
+           "projectSubscribers": [{"firstName": "Walter", "lastName": "Sobchak", "email": "walter@portalcx.com",
+                                   "phonenumber": "8016697921", "notifyViaEmail": True, "notifyViaSMS": False,
+                                   "countryId": 1}]}
+    row.update(overrides)
+    return row
+
+
+class TestBatchValidation:
+
+    def test_errors_are_reported_per_row(self):
+        rows = [project_row(index) for index in range(6)]
+        rows[1]["countryId"] = "US"
+        del rows[2]["email"]
+        rows[3]["projectSubscribers"][0]["countryId"] = None
+        rows[4]["notifyViaEmail"] = "maybe"
+
+        result = validate_project_rows(rows)
+
+        assert result.errors == {
+            1: {"countryId": "value is not a valid integer"},
+            2: {"email": "field required"},
+            3: {"projectSubscribers.0.countryId": "none is not an allowed value"},
+            4: {"notifyViaEmail": "value could not be parsed to a boolean"},
+        }
+        assert result.valid_indices == [0, 5]
+
+    def test_errors_match_pydantic(self):
+        rows = [project_row(0, countryId="1.5", zip=None), project_row(1, phoneNumber=None)]
+        result = validate_project_rows(rows)
+
+        for index, row in enumerate(rows):
+            try:
+                ProjectCreateRequest(**row)
+            except ValueError as error:
+                assert {detail["loc"][0]: detail["msg"] for detail in error.errors()} == result.errors[index]
+
+    def test_values_are_coerced_like_pydantic(self):
+        result = validate_project_rows([project_row(0, countryId="44", notifyViaSMS="yes")])
+
+        [project] = result.models()
+        assert project.to_json() == ProjectCreateRequest(**project_row(0, countryId="44", notifyViaSMS="yes")).to_json()
+        assert project.countryId == 44 and project.notifyViaSMS is True
+
+    def test_columns_are_accepted(self):
+        columns = {key: [value, value] for key, value in project_row(0).items()}
+        columns["countryId"] = [1, "x"]
+
+        result = validate_project_rows(columns)
+
+        assert list(result.errors) == [1]
+        assert result.rows[0]["lastName"] == "Dude 0"
+
+    def test_enum_ranges(self):
+        validator = BatchValidator(GetProjectDetailViewModel)
+        rows = [{"projectId": index, "status": status, "notifyViaEmail": True, "notifyViaSMS": False}
+                for index, status in enumerate([0, 2, 7, "1"])]
+
+        result = validator.validate(rows)
+
+        assert list(result.errors) == [2]
+        assert result.errors[2]["status"].startswith("value is not a valid enumeration member")
+        assert result.rows[1]["status"] is ProjectStatusEnum.STATUS_2
+        assert result.rows[3]["status"] is ProjectStatusEnum.STATUS_1
+
+    def test_extra_checks_and_root_validators(self):
+        phone = re.compile(r"^\+?\d{10,15}$")
+        validator = BatchValidator(ProjectCreateRequest,
+                                   checks={"phoneNumber": lambda value: None if phone.match(value) else "invalid phone"})
+        result = validator.validate([project_row(0), project_row(1, phoneNumber="555-CALL-NOW")])
+        assert result.errors == {1: {"phoneNumber": "invalid phone"}}
+
+        stages = BatchValidator(ProjectStageCompleteRequest).validate([
+            {"projectId": 1, "completedStageLabel": "Design", "completedDate": "2023-06-01",
+             "notifyViaEmail": True, "notifyViaSms": False},
+            {"completedStageLabel": "Design", "completedDate": "2023-06-01", "notifyViaEmail": True,
+             "notifyViaSms": False},
+        ])
+        assert list(stages.errors) == [1]
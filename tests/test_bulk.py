@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_bulk.py
+------------------
+Unit tests for the bulk operations of the PortalCX and AsyncPortalCX classes.
+"""
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import orjson
+
+from portalcx.api.api_base import APIBaseError
+from portalcx.models.admin_project_models import ProjectCreateRequest
+from portalcx.models.admin_template_models import ProjectStageCompleteRequest
+from tests.base_test import mock_async_portalcx, mock_portalcx, project_request
+
+
+def numbered_projects(indices: range) -> List[ProjectCreateRequest]:
+    """
+    Project requests whose countryId, which create_project_response answers by, is their index.
+    """
+    return [project_request(index, countryId=index) for index in indices]
+
+
+def create_project_response(request: httpx.Request) -> httpx.Response:
+    """
+    Fails projects whose countryId is a multiple of 5.
+    """
+    country_id = orjson.loads(request.content)["countryId"]
+    if country_id % 5 == 0:
+        return httpx.Response(400, json={"errorMessage": f"Invalid country {country_id}"})
+    return httpx.Response(200, json={"message": "Project created successfully", "projectId": country_id})
+
+
+class TestCreateProjectsBulk:
+
+    def test_results_in_input_order_and_failures_do_not_abort(self):
+        lock = threading.Lock()
+        in_flight = 0
+        peak_in_flight = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak_in_flight
+            with lock:
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return create_project_response(request)
+
+        with mock_portalcx(handler) as pxc:
+            bulk = pxc.create_projects_bulk((project_request(i, countryId=i) for i in range(1, 41)), concurrency=4)
+            results = bulk.run()
+
+        assert [result.index for result in results] == list(range(40))
+        assert peak_in_flight == 4
+
+        failures = [result for result in results if not result.ok]
+        assert len(failures) == 8
+        assert all(isinstance(result.error, APIBaseError) for result in failures)
+        assert results[1].response["data"]["projectId"] == 2
+
+        assert bulk.stats.submitted == 40
+        assert bulk.stats.succeeded == 32
+        assert bulk.stats.failed == 8
+        assert bulk.stats.throughput > 0
+
+    def test_malformed_response_fails_only_its_item(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if orjson.loads(request.content)["countryId"] == 3:
+                return httpx.Response(200, content=b'{"projectId": ')
+            return create_project_response(request)
+
+        with mock_portalcx(handler) as pxc:
+            results = pxc.create_projects_bulk(numbered_projects(range(1, 9)), concurrency=2).run()
+
+        assert len(results) == 8
+        assert isinstance(results[2].error, ValueError)
+        assert [result.index for result in results if result.ok] == [0, 1, 3, 5, 6, 7]
+
+    def test_async_malformed_response_fails_only_its_item(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if orjson.loads(request.content)["countryId"] == 2:
+                return httpx.Response(200, content=b"[1, 2")
+            return create_project_response(request)
+
+        async def run():
+            async with mock_async_portalcx(handler) as pxc:
+                return await pxc.create_projects_bulk(numbered_projects(range(1, 5))).run()
+
+        results = asyncio.run(run())
+        assert [type(result.error) for result in results] == [type(None), ValueError, type(None), type(None)]
+
+    def test_async_results_in_completion_order(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            # Later projects answer sooner, so completion order differs from input order
+            country_id = orjson.loads(request.content)["countryId"]
+            await asyncio.sleep(0.001 * (20 - country_id))
+            return create_project_response(request)
+
+        async def run():
+            async with mock_async_portalcx(handler) as pxc:
+                bulk = pxc.create_projects_bulk(numbered_projects(range(1, 20)), concurrency=19, ordered=False)
+                return bulk, await bulk.run()
+
+        bulk, results = asyncio.run(run())
+
+        assert sorted(result.index for result in results) == list(range(19))
+        assert [result.index for result in results] != list(range(19))
+        assert bulk.stats.failed == 3
+
+
+def stage_request(project_id: int, stage: int) -> ProjectStageCompleteRequest:
+    return ProjectStageCompleteRequest(
+        projectId=project_id,
+        completedStageLabel=f"Stage {stage}",
+        completedDate="2023-06-01T00:00:00+00:00",
+        notifyViaEmail=False,
+        notifyViaSms=False,
+    )
+
+
+class TestCompleteProjectStagesBulk:
+
+    def test_same_project_never_races(self):
+        lock = threading.Lock()
+        in_flight = {}
+        peak_in_flight = 0
+        completed = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal peak_in_flight
+            body = orjson.loads(request.content)
+            project_id = body["projectId"]
+            with lock:
+                in_flight[project_id] = in_flight.get(project_id, 0) + 1
+                assert in_flight[project_id] == 1, f"Project {project_id} raced"
+                peak_in_flight = max(peak_in_flight, sum(in_flight.values()))
+            time.sleep(0.005)
+            with lock:
+                in_flight[project_id] -= 1
+                completed.setdefault(project_id, []).append(body["completedStageLabel"])
+            return httpx.Response(200, text="Project stage changed")
+
+        # Six stages for each of five projects, interleaved
+        stages = (stage_request(project_id, stage) for stage in range(6) for project_id in range(1, 6))
+
+        with mock_portalcx(handler) as pxc:
+            results = list(pxc.complete_project_stages_bulk(stages, concurrency=8))
+
+        assert len(results) == 30
+        assert all(result.ok for result in results)
+        assert peak_in_flight > 1
+        for labels in completed.values():
+            assert labels == [f"Stage {stage}" for stage in range(6)]
+
+    def test_input_is_read_lazily(self):
+        consumed = 0
+
+        def stages():
+            nonlocal consumed
+            for project_id in range(1, 10_001):
+                consumed += 1
+                yield stage_request(project_id, 1)
+
+        with mock_portalcx(lambda request: httpx.Response(200, text="ok")) as pxc:
+            bulk = pxc.complete_project_stages_bulk(stages(), concurrency=4)
+            first = next(iter(bulk))
+
+        assert first.index == 0
+        assert consumed <= bulk.window
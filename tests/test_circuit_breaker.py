@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_circuit_breaker.py
+-----------------------------
+Unit tests for the per-host circuit breaker.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from portalcx.api.api_base import APIBaseError, CircuitOpenError
+from portalcx.utils.circuit_breaker import CircuitBreaker, CircuitState
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+HOST = "portalcx.test"
+
+
+class Backend:
+    """
+    Answers with `status_code` and counts the requests it receives.
+    """
+
+    def __init__(self, status_code: int = 503):
+        self.status_code = status_code
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.status_code == 200:
+            return httpx.Response(200, text="ok")
+        return httpx.Response(self.status_code, json={"errorMessage": "Unavailable"})
+
+
+def server_error() -> httpx.HTTPStatusError:
+    response = httpx.Response(503, request=httpx.Request("GET", f"https://{HOST}/"))
+    return httpx.HTTPStatusError("Service Unavailable", request=response.request, response=response)
+
+
+class TestCircuitBreaker:
+
+    def test_opens_at_failure_rate(self):
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4, cooldown=60)
+
+        breaker.record(HOST, 0.01)
+        breaker.record(HOST, 0.01)
+        breaker.record(HOST, 0.01, server_error())
+        assert breaker.state(HOST) is CircuitState.CLOSED
+
+        breaker.record(HOST, 0.01, server_error())
+        assert breaker.state(HOST) is CircuitState.OPEN
+        assert breaker.before_request(HOST) > 0
+        assert breaker.before_request("other.test") == 0
+
+    def test_client_errors_do_not_count(self):
+        breaker = CircuitBreaker(minimum_calls=2)
+        response = httpx.Response(404, request=httpx.Request("GET", f"https://{HOST}/"))
+        not_found = httpx.HTTPStatusError("Not Found", request=response.request, response=response)
+
+        for _ in range(5):
+            breaker.record(HOST, 0.01, not_found)
+        assert breaker.state(HOST) is CircuitState.CLOSED
+
+    def test_slow_calls_open_the_circuit(self):
+        breaker = CircuitBreaker(slow_call_threshold=1.0, slow_call_rate_threshold=0.5, minimum_calls=2)
+
+        breaker.record(HOST, 2.0)
+        breaker.record(HOST, 2.0)
+        assert breaker.state(HOST) is CircuitState.OPEN
+
+    def test_half_open_trial_closes_or_reopens(self):
+        changes = []
+        breaker = CircuitBreaker(minimum_calls=1, cooldown=0)
+        breaker.add_listener(lambda host, old, new: changes.append((old, new)))
+
+        breaker.record(HOST, 0.01, server_error())
+        assert breaker.before_request(HOST) == 0      # the trial call
+        breaker.record(HOST, 0.01, server_error())
+
+        assert breaker.before_request(HOST) == 0
+        breaker.record(HOST, 0.01)
+
+        assert changes == [(CircuitState.CLOSED, CircuitState.OPEN),
+                           (CircuitState.OPEN, CircuitState.HALF_OPEN),
+                           (CircuitState.HALF_OPEN, CircuitState.OPEN),
+                           (CircuitState.OPEN, CircuitState.HALF_OPEN),
+                           (CircuitState.HALF_OPEN, CircuitState.CLOSED)]
+
+    def test_only_one_trial_call_at_a_time(self):
+        breaker = CircuitBreaker(minimum_calls=1, cooldown=0.5)
+        breaker.record(HOST, 0.01, server_error())
+        breaker._circuits[HOST].opened_at -= 1
+
+        assert breaker.before_request(HOST) == 0
+        assert breaker.before_request(HOST) > 0
+
+
+class TestCircuitBreakerClient:
+
+    def test_open_circuit_fails_fast(self):
+        backend = Backend()
+        breaker = CircuitBreaker(minimum_calls=3, cooldown=60)
+
+        with mock_portalcx(backend, retry_policy=None, circuit_breaker=breaker) as pxc:
+            for _ in range(3):
+                with pytest.raises(APIBaseError):
+                    pxc.delete_project(1)
+
+            with pytest.raises(CircuitOpenError) as exc_info:
+                pxc.delete_template(TEMPLATE_ID)
+
+        assert exc_info.value.host == HOST
+        assert exc_info.value.retry_after > 0
+        assert backend.calls == 3
+
+    def test_async_open_circuit_fails_fast(self):
+        backend = Backend()
+        breaker = CircuitBreaker(minimum_calls=2, cooldown=60)
+
+        async def run():
+            async with mock_async_portalcx(backend, retry_policy=None, circuit_breaker=breaker) as pxc:
+                for _ in range(2):
+                    with pytest.raises(APIBaseError):
+                        await pxc.delete_project(1)
+                with pytest.raises(CircuitOpenError):
+                    await pxc.delete_project(1)
+
+        asyncio.run(run())
+        assert backend.calls == 2
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_cli.py
+-----------------
+Unit tests for the `portalcx` bulk import command.
+"""
+
+import csv
+import io
+import logging
+import tracemalloc
+
+import httpx
+import orjson
+
+from portalcx.cli import import_file, main
+from portalcx.utils.logger import get_logger, set_log_level
+from tests.base_test import TEMPLATE_ID, ProjectServer, mock_portalcx
+
+CSV_FIELDS = ["templateId", "firstName", "lastName", "email", "phoneNumber", "city", "notifyViaEmail",
+              "notifyViaSMS", "completeFirstStage", "countryId", "projectSubscribers"]
+
+
+def csv_row(index: int, **overrides) -> dict:
+    row = {"templateId": TEMPLATE_ID, "firstName": "The", "lastName": f"Dude {index}",
+           "email": "thedude@portalcx.com", "phoneNumber": "8016697921", "city": "", "notifyViaEmail": "true",
+           "notifyViaSMS": "false", "completeFirstStage": "false", "countryId": "1", "projectSubscribers": ""}
+    row.update(overrides)
+    return row
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_results(output: io.BytesIO) -> dict:
+    return {result["row"]: result for result in map(orjson.loads, output.getvalue().splitlines())}
+
+
+class TestImportCommand:
+
+    def test_csv_rows_are_validated_and_submitted(self, tmp_path):
+        subscribers = orjson.dumps([{"firstName": "Walter", "lastName": "Sobchak", "email": "walter@portalcx.com",
+                                     "phonenumber": "8016697921", "notifyViaEmail": True, "notifyViaSMS": False,
+                                     "countryId": 1}]).decode()
+        write_csv(tmp_path / "projects.csv", [csv_row(1, city="Provo", projectSubscribers=subscribers),
+                                              csv_row(2, countryId="US"), csv_row(3, lastName="Must fail"),
+                                              csv_row(4)])
+        server = ProjectServer()
+        output = io.BytesIO()
+
+        summary = import_file(mock_portalcx(server), "create-projects", str(tmp_path / "projects.csv"), output,
+                              concurrency=4)
+
+        results = read_results(output)
+        assert summary["succeeded"] == 2 and summary["failed"] == 1 and summary["invalid"] == 1
+        assert results[1]["ok"] and results[1]["response"]["data"]["projectId"] in (1, 2)
+        assert results[2]["error"] == {"validation": {"countryId": "value is not a valid integer"}}
+        assert results[3]["error"] == {"status_code": 400, "message": "Rejected"}
+        assert len(server.bodies) == 2
+        first = next(body for body in server.bodies if body["lastName"] == "Dude 1")
+        assert first["city"] == "Provo" and first["countryId"] == 1 and first["projectSubscribers"][0]["countryId"] == 1
+        assert "city" not in next(body for body in server.bodies if body["lastName"] == "Dude 4")
+
+    def test_jsonl_stage_completions_keep_project_order(self, tmp_path):
+        rows = [{"projectId": index % 3, "completedStageLabel": f"Stage {index}", "completedDate": "2023-06-01",
+                 "notifyViaEmail": False, "notifyViaSms": False} for index in range(30)]
+        (tmp_path / "stages.jsonl").write_bytes(b"\n".join(map(orjson.dumps, rows)) + b"\n")
+        server = ProjectServer()
+        output = io.BytesIO()
+
+        summary = import_file(mock_portalcx(server), "complete-stages", str(tmp_path / "stages.jsonl"), output,
+                              concurrency=8)
+
+        assert summary["succeeded"] == 30
+        for project_id in range(3):
+            labels = [body["completedStageLabel"] for body in server.bodies if body["projectId"] == project_id]
+            assert labels == [f"Stage {index}" for index in range(project_id, 30, 3)]
+
+    def test_malformed_jsonl_lines_are_reported_as_invalid(self, tmp_path):
+        row = orjson.dumps({**csv_row(1), "notifyViaEmail": True, "notifyViaSMS": False,
+                            "completeFirstStage": False, "countryId": 1, "projectSubscribers": []})
+        (tmp_path / "projects.jsonl").write_bytes(b"\n".join([row, b'{"firstName": "The', b"", b"[1, 2]",
+                                                              b'"x"', row.replace(b"Dude 1", b"Dude 6")]))
+        server = ProjectServer()
+        output = io.BytesIO()
+
+        summary = import_file(mock_portalcx(server), "create-projects", str(tmp_path / "projects.jsonl"), output)
+
+        results = read_results(output)
+        assert summary["succeeded"] == 2 and summary["invalid"] == 3
+        assert results[1]["ok"] and results[6]["ok"] and 3 not in results
+        assert results[2]["error"]["validation"]["__root__"].startswith("invalid JSON")
+        assert results[4]["error"] == results[5]["error"] == {"validation": {"__root__": "value is not a valid dict"}}
+
+    def test_memory_does_not_grow_with_input(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"message": "Project created successfully", "projectId": 1})
+
+        def peak_memory(rows: int) -> int:
+            path = tmp_path / f"projects-{rows}.csv"
+            write_csv(path, (csv_row(index) for index in range(rows)))
+            with open(tmp_path / "results.jsonl", "wb") as output:
+                tracemalloc.start()
+                try:
+                    import_file(mock_portalcx(handler), "create-projects", str(path), output, concurrency=4,
+                                chunk_size=100)
+                    return tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+
+        logging.disable(logging.INFO)
+        try:
+            small, large = peak_memory(500), peak_memory(5_000)
+        finally:
+            logging.disable(logging.NOTSET)
+        assert large < small * 1.5
+
+    def test_main_reports_failures_in_exit_status(self, tmp_path, capsys):
+        write_csv(tmp_path / "projects.csv", [csv_row(1, email="")])
+
+        level = get_logger().level
+        try:
+            status = main(["create-projects", str(tmp_path / "projects.csv"), "--token", "abc",
+                           "--base-url", "https://portalcx.test", "-o", str(tmp_path / "results.jsonl")])
+        finally:
+            set_log_level(level)
+
+        assert status == 1
+        assert "0 succeeded, 0 failed, 1 invalid, 0 skipped" in capsys.readouterr().err
+        [result] = map(orjson.loads, (tmp_path / "results.jsonl").read_bytes().splitlines())
+        assert result["error"] == {"validation": {"email": "field required"}}
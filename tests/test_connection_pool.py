@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_connection_pool.py
+-----------------------------
+Unit tests for the shared, pooled HTTP client used by the PortalCX API classes.
+"""
+
+import httpx
+
+from portalcx import PortalCX
+from portalcx.api.admin_projects import AdminProject
+from tests.base_test import BASE_URL, mock_portalcx
+
+
+class TestConnectionPool:
+
+    def test_api_classes_share_one_client(self):
+        pxc = PortalCX(base_url=BASE_URL)
+
+        assert pxc.auth_management.client is pxc.client
+        assert pxc.admin_template.client is pxc.client
+        assert pxc.admin_project.client is pxc.client
+
+        pxc.close()
+        assert pxc.client.is_closed
+
+    def test_requests_go_through_supplied_client(self):
+        seen_requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_requests.append(request)
+            return httpx.Response(200, json={"token": "abc", "projectId": 1})
+
+        with mock_portalcx(handler, auth_token=None) as pxc:
+            client = pxc.client
+            pxc.login(email="thedude@portalcx.com", password="secret")
+            pxc.delete_project(1)
+
+        assert [r.url.path for r in seen_requests] == [
+            "/api/AuthManagement/Login",
+            "/api/Admin/Project/DeleteProject",
+        ]
+        # A client passed in by the caller is left open for the caller to manage
+        assert not client.is_closed
+        client.close()
+
+    def test_standalone_api_class_owns_its_client(self):
+        with AdminProject(BASE_URL, token="abc") as admin_project:
+            client = admin_project.client
+            assert admin_project.client is client
+
+        assert client.is_closed
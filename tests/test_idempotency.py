@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_idempotency.py
+-------------------------
+Unit tests for idempotency keys and duplicate suppression of POST requests.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from portalcx.api.api_base import APIBaseError
+from portalcx.models.admin_template_models import ProjectStageCompleteRequest, TemplateStageCreateRequest
+from portalcx.utils.idempotency import IDEMPOTENCY_HEADER, IdempotencyStore
+from portalcx.utils.retry import RetryPolicy
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx, project_request
+
+
+class RecordingServer:
+    """
+    Answers every POST with the given statuses in turn (200 once they run out) and
+    keeps the Idempotency-Key of each request.
+    """
+
+    def __init__(self, *statuses: int):
+        self.statuses = list(statuses)
+        self.keys = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.keys.append(request.headers.get(IDEMPOTENCY_HEADER))
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            return httpx.Response(status, json={"errorMessage": "Unavailable"})
+        return httpx.Response(200, json={"message": "Created", "projectId": len(self.keys)})
+
+
+class TestIdempotencyKeys:
+
+    def test_keys_are_derived_from_the_request_body(self):
+        server = RecordingServer()
+        pxc = mock_portalcx(server)
+
+        pxc.create_project(project_request())
+        pxc.create_project(project_request())
+        pxc.create_project(project_request(1))
+        pxc.create_project(project_request(), idempotency_key="order-42")
+        pxc.create_template_stage(TemplateStageCreateRequest(templateId=TEMPLATE_ID, stageName="Design",
+                                                             stageDescription=""))
+
+        assert len(server.keys) == 5 and server.keys[0] == server.keys[1]
+        assert len(set(server.keys)) == 4 and server.keys[3] == "order-42"
+        assert all(len(key) == 32 for key in server.keys if key != "order-42")
+
+    def test_store_suppresses_requests_that_already_succeeded(self):
+        server = RecordingServer(400)
+        store = IdempotencyStore()
+        pxc = mock_portalcx(server, idempotency_store=store)
+
+        with pytest.raises(APIBaseError):
+            pxc.create_project(project_request())
+        first = pxc.create_project(project_request())
+        second = pxc.create_project(project_request())
+        other = pxc.create_project(project_request(), idempotency_key="second-dude")
+
+        assert len(server.keys) == 3
+        assert second is first and other["data"]["projectId"] == 3
+        assert store.suppressed == 1 and len(store) == 2
+
+    def test_entries_expire_and_are_bounded(self):
+        store = IdempotencyStore(maxsize=2, window=60)
+        for key in ("a", "b", "c"):
+            store.record(key, {"data": key})
+        assert store.lookup("a") is None and store.lookup("c") == {"data": "c"}
+
+        store.forget("c")
+        assert store.lookup("c") is None
+
+        expired = IdempotencyStore(window=0)
+        expired.record("a", {})
+        assert expired.lookup("a") is None and len(expired) == 0
+
+    def test_keyed_posts_are_retried_when_the_store_allows_it(self):
+        policy = RetryPolicy(backoff_base=0)
+
+        server = RecordingServer(503)
+        with pytest.raises(APIBaseError):
+            pxc = mock_portalcx(server, retry_policy=policy, idempotency_store=IdempotencyStore())
+            pxc.create_project(project_request())
+        assert len(server.keys) == 1
+
+        server = RecordingServer(503)
+        pxc = mock_portalcx(server, retry_policy=policy, idempotency_store=IdempotencyStore(retry=True))
+        response = pxc.create_project(project_request())
+        assert response["data"]["projectId"] == 2
+        assert len(server.keys) == 2 and server.keys[0] == server.keys[1]
+
+    def test_async_stage_completion_is_suppressed(self):
+        server = RecordingServer()
+        stage = ProjectStageCompleteRequest(projectId=1, completedStageLabel="Design", completedDate="2023-06-01",
+                                            notifyViaEmail=False, notifyViaSms=False)
+
+        async def complete_twice():
+            async with mock_async_portalcx(server, idempotency_store=IdempotencyStore()) as pxc:
+                await pxc.complete_project_stage(stage)
+                await pxc.complete_project_stage(stage)
+
+        asyncio.run(complete_twice())
+        assert len(server.keys) == 1 and server.keys[0]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_instrumentation.py
+-----------------------------
+Unit tests for request hooks and per-endpoint metrics.
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from portalcx.api.api_base import APIBaseError
+from portalcx.utils.instrumentation import Histogram, Instrumentation, RequestTiming
+from tests.base_test import mock_async_portalcx, mock_portalcx
+
+DELETE_STAGE = "/api/Admin/Template/DeleteStage"
+OK_BODY = b'{"message":"ok"}'
+NOT_FOUND_BODY = b'{"errorMessage":"Not found"}'
+
+
+def backend(request: httpx.Request) -> httpx.Response:
+    if request.url.params.get("templateStageId") == "404":
+        return httpx.Response(404, content=NOT_FOUND_BODY)
+    return httpx.Response(200, content=OK_BODY)
+
+
+class TestHistogram:
+
+    def test_quantiles_use_bucket_bounds(self):
+        histogram = Histogram([1, 2, 4, 8])
+        for value in (0.5, 1.5, 1.5, 3, 7):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 5
+        assert snapshot["max"] == 7
+        assert snapshot["p50"] == 2
+        assert snapshot["p99"] == 7
+        assert snapshot["buckets"] == [[1, 1], [2, 2], [4, 1], [8, 1]]
+
+    def test_connection_phases_come_from_trace_events(self):
+        timing = RequestTiming("GET", "/x", "https://portalcx.test/x", {}, 1)
+        for event in ("connection.connect_tcp.started", "connection.connect_tcp.complete",
+                      "connection.start_tls.started", "connection.start_tls.complete",
+                      "http11.send_request_body.complete", "http11.receive_response_headers.complete"):
+            timing.trace(event, {})
+
+        assert timing.connect >= 0
+        assert timing.tls >= 0
+        assert timing.server >= 0
+
+
+class TestInstrumentedClient:
+
+    def test_series_are_keyed_by_path_without_query(self):
+        instrumentation = Instrumentation()
+
+        with mock_portalcx(backend, instrumentation=instrumentation) as pxc:
+            pxc.delete_stage(123)
+            pxc.delete_stage(456)
+            with pytest.raises(APIBaseError):
+                pxc.delete_stage(404)
+
+        snapshot = instrumentation.snapshot()
+        assert list(snapshot) == [DELETE_STAGE]
+        series = snapshot[DELETE_STAGE]
+        assert series["requests"] == 3
+        assert series["errors"] == 1
+        assert series["total"]["count"] == 3
+        assert series["parse"]["count"] == 2
+        assert series["response_bytes"]["sum"] == 2 * len(OK_BODY) + len(NOT_FOUND_BODY)
+        # Mock transports do not connect, so only reused-connection phases are recorded
+        assert series["connect"]["count"] == 0
+        assert orjson.loads(orjson.dumps(snapshot)) == snapshot
+
+    def test_hooks_see_each_attempt(self):
+        instrumentation = Instrumentation()
+        sent, received = [], []
+        instrumentation.add_pre_request_hook(lambda timing: timing.headers.update({"X-Request-Id": "42"}))
+        instrumentation.add_pre_request_hook(sent.append)
+        instrumentation.add_post_response_hook(received.append)
+
+        with mock_portalcx(backend, instrumentation=instrumentation) as pxc:
+            pxc.delete_project(1)
+
+        assert sent == received
+        assert received[0].method == "DELETE"
+        assert received[0].status_code == 200
+        assert received[0].total > 0
+        assert received[0].headers["X-Request-Id"] == "42"
+
+    def test_async_requests_are_recorded(self):
+        instrumentation = Instrumentation()
+
+        async def run():
+            async with mock_async_portalcx(backend, instrumentation=instrumentation) as pxc:
+                await asyncio.gather(*(pxc.delete_stage(i) for i in range(5)))
+
+        asyncio.run(run())
+        assert instrumentation.snapshot()[DELETE_STAGE]["requests"] == 5
+
+    def test_caller_extensions_are_kept(self):
+        instrumentation = Instrumentation()
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(dict(request.extensions))
+            return httpx.Response(200, content=OK_BODY)
+
+        extensions = {"timeout": {"connect": 1.0, "read": 2.0, "write": 2.0, "pool": 1.0}}
+        with mock_portalcx(handler, instrumentation=instrumentation) as pxc:
+            pxc.admin_project.request("DELETE", DELETE_STAGE, extensions=extensions)
+
+        assert seen[0]["timeout"] == extensions["timeout"] and "trace" in seen[0]
+        assert extensions == {"timeout": {"connect": 1.0, "read": 2.0, "write": 2.0, "pool": 1.0}}
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_journal.py
+---------------------
+Unit tests for resuming bulk jobs from a BulkJournal.
+"""
+
+import asyncio
+import io
+import sqlite3
+
+import orjson
+
+from portalcx.cli import import_file
+from portalcx.utils.journal import BulkJournal, item_digest
+from tests.base_test import ProjectServer, mock_async_portalcx, mock_portalcx, project_request
+
+
+def committed_rows(path) -> int:
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM completed").fetchone()[0]
+
+
+class TestBulkJournal:
+
+    def test_records_are_committed_in_batches_and_survive_reopening(self, tmp_path):
+        path = str(tmp_path / "jobs.journal")
+        digests = [item_digest(project_request(index), "create_project") for index in range(5)]
+
+        journal = BulkJournal(path, batch_size=3, flush_interval=60)
+        for index, digest in enumerate(digests[:4]):
+            journal.record(digest, {"status": 200, "data": {"projectId": index}})
+        assert committed_rows(path) == 3
+        assert journal.get(digests[3]) == {"status": 200, "data": {"projectId": 3}}
+        journal.close()
+
+        with BulkJournal(path) as journal:
+            assert len(journal) == 4 and digests[3] in journal and digests[4] not in journal
+            assert journal.get(digests[0])["data"]["projectId"] == 0
+        assert sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_digest_depends_on_request_body_and_operation(self):
+        assert item_digest(project_request(1), "create_project") == item_digest(project_request(1), "create_project")
+        assert item_digest(project_request(1), "create_project") != item_digest(project_request(2), "create_project")
+        assert item_digest(project_request(1), "create_project") != item_digest(project_request(1), "other")
+        assert item_digest({"a": 1, "b": 2}) == item_digest({"b": 2, "a": 1})
+
+    def test_interrupted_bulk_creation_resumes_without_duplicates(self, tmp_path):
+        path = str(tmp_path / "projects.journal")
+        server = ProjectServer()
+        pxc = mock_portalcx(server)
+        projects = [project_request(index) for index in range(50)]
+
+        with BulkJournal(path, batch_size=8) as journal:
+            for result in pxc.create_projects_bulk(iter(projects), concurrency=4, journal=journal):
+                if result.index == 20:
+                    break  # the job dies part way
+
+        with BulkJournal(path) as journal:
+            created_before = len(journal)
+            results = pxc.create_projects_bulk(projects, concurrency=4, journal=journal).run()
+
+        assert created_before >= 21
+        assert [result.index for result in results] == list(range(50)) and all(result.ok for result in results)
+        assert sum(result.skipped for result in results) == created_before
+        assert len(server.created) == 50 and set(server.created.values()) == {1}
+
+    def test_resumed_results_keep_their_input_index(self, tmp_path):
+        server = ProjectServer()
+        pxc = mock_portalcx(server)
+        projects = [project_request(index) for index in range(4)]
+
+        with BulkJournal(str(tmp_path / "projects.journal")) as journal:
+            pxc.create_projects_bulk([projects[0], projects[2]], journal=journal).run()
+            ordered = pxc.create_projects_bulk(projects, concurrency=2, journal=journal).run()
+            unordered = pxc.create_projects_bulk(projects[::-1], concurrency=2, ordered=False, journal=journal).run()
+
+        assert [(result.index, result.item.lastName, result.skipped) for result in ordered] == [
+            (0, "Dude 0", True), (1, "Dude 1", False), (2, "Dude 2", True), (3, "Dude 3", False)]
+        assert ordered[2].response["data"]["projectId"] == 2
+        assert sorted((result.index, result.item.lastName) for result in unordered) == [
+            (0, "Dude 3"), (1, "Dude 2"), (2, "Dude 1"), (3, "Dude 0")]
+        assert all(result.skipped for result in unordered)
+        assert set(server.created.values()) == {1}
+
+    def test_async_bulk_creation_records_and_skips(self, tmp_path):
+        path = str(tmp_path / "projects.journal")
+        server = ProjectServer()
+        projects = [project_request(index) for index in range(10)]
+
+        async def create(journal: BulkJournal) -> list:
+            async with mock_async_portalcx(server) as pxc:
+                return await pxc.create_projects_bulk(projects, concurrency=4, journal=journal).run()
+
+        with BulkJournal(path) as journal:
+            assert not any(result.skipped for result in asyncio.run(create(journal)))
+            assert [result.index for result in asyncio.run(create(journal)) if result.skipped] == list(range(10))
+        assert set(server.created.values()) == {1}
+
+    def test_import_command_skips_journaled_rows(self, tmp_path):
+        rows = [project_request(index).to_dict() for index in range(6)]
+        (tmp_path / "projects.jsonl").write_bytes(b"\n".join(map(orjson.dumps, rows)))
+        server = ProjectServer()
+        pxc = mock_portalcx(server)
+
+        with BulkJournal(str(tmp_path / "import.journal")) as journal:
+            first = import_file(pxc, "create-projects", str(tmp_path / "projects.jsonl"), io.BytesIO(),
+                                journal=journal)
+            output = io.BytesIO()
+            second = import_file(pxc, "create-projects", str(tmp_path / "projects.jsonl"), output, journal=journal)
+
+        assert first["succeeded"] == 6 and second["succeeded"] == 0 and second["skipped"] == 6
+        results = [orjson.loads(line) for line in output.getvalue().splitlines()]
+        assert all(result["skipped"] and result["response"]["data"]["projectId"] for result in results)
+        assert set(server.created.values()) == {1}
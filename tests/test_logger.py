@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_logger.py
+--------------------
+Unit tests for the SDK logger configuration.
+"""
+
+import logging
+import threading
+
+from portalcx import PortalCX
+from portalcx.api.admin_projects import AdminProject
+from portalcx.api.admin_templates import AdminTemplate
+from portalcx.utils.logger import (LOGGER_NAME, disable_queue_logging, enable_queue_logging, get_logger,
+                                   set_log_level)
+
+
+class RecordingHandler(logging.Handler):
+    """
+    Collects records together with the thread that handled them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+class TestLogger:
+
+    def test_handlers_are_attached_once(self):
+        for _ in range(20):
+            get_logger()
+            PortalCX(base_url="https://portalcx.test").close()
+
+        assert len(logging.getLogger(LOGGER_NAME).handlers) == 1
+
+    def test_queue_logging_moves_io_off_the_calling_thread(self):
+        logger = get_logger()
+        handler = RecordingHandler()
+        logger.addHandler(handler)
+
+        try:
+            listener = enable_queue_logging()
+            assert enable_queue_logging() is listener
+
+            logger.info("Deleting project with id: 1")
+        finally:
+            disable_queue_logging()
+            logger.removeHandler(handler)
+
+        assert [record.getMessage() for record in handler.records] == ["Deleting project with id: 1"]
+        assert threading.current_thread().name not in handler.threads
+        assert len(logger.handlers) == 1
+
+    def test_per_module_verbosity(self):
+        assert AdminProject("https://portalcx.test").logger.name == "portalcx.api.admin_projects"
+
+        set_log_level(logging.WARNING, "api.admin_projects")
+        try:
+            assert not AdminProject("https://portalcx.test").logger.isEnabledFor(logging.INFO)
+            assert AdminTemplate("https://portalcx.test").logger.isEnabledFor(logging.INFO)
+        finally:
+            set_log_level(logging.NOTSET, "api.admin_projects")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_model_serialization.py
+---------------------------------
+Unit tests for trusted model construction and the cached JSON serializers.
+"""
+
+import io
+from decimal import Decimal
+from typing import List, Optional
+
+import httpx
+import orjson
+import pytest
+from pydantic import Field
+
+from portalcx.api.api_base import json_body
+from portalcx.models.admin_project_models import ProjectCreateRequest
+from portalcx.models.admin_template_models import CreateTemplate
+from portalcx.models.base_model import BaseModel
+from tests.base_test import TEMPLATE_ID, mock_portalcx
+
+SUBSCRIBER = {"firstName": "Walter", "lastName": "Sobchak", "email": "walter@portalcx.com",
+              "phonenumber": "8016697921", "notifyViaEmail": True, "notifyViaSMS": False, "countryId": 1}
+PROJECT = {"templateId": TEMPLATE_ID, "firstName": "The", "lastName": "Dude",
+           "email": "thedude@portalcx.com", "phoneNumber": "8016697921", "addressLine1": None,
+           "notifyViaEmail": True, "notifyViaSMS": True, "completeFirstStage": False, "countryId": 1,
+           "projectSubscribers": [SUBSCRIBER]}
+
+
+class Invoice(BaseModel):
+    amount: Decimal
+    lines: List[str] = Field(default_factory=list)
+    note: Optional[str] = Field(None, alias="memo")
+
+
+class TestModelSerialization:
+
+    def test_to_json_matches_to_dict(self):
+        project = ProjectCreateRequest(**PROJECT)
+
+        assert orjson.loads(project.to_json()) == project.to_dict()
+        assert "addressLine1" not in orjson.loads(project.to_json())
+        assert "projectSubscriberId" not in orjson.loads(project.to_json())["projectSubscribers"][0]
+
+    def test_trusted_models_match_validated_models(self):
+        validated = ProjectCreateRequest(**PROJECT)
+        trusted = ProjectCreateRequest.trusted(**PROJECT)
+
+        assert trusted.to_json() == validated.to_json()
+        assert trusted.__fields_set__ == validated.__fields_set__
+        assert trusted.projectId is None
+        assert isinstance(trusted.projectSubscribers[0], BaseModel)
+
+    def test_trusted_models_are_not_validated(self):
+        trusted = ProjectCreateRequest.trusted(**{**PROJECT, "countryId": "not a number"})
+
+        assert orjson.loads(trusted.to_json())["countryId"] == "not a number"
+
+    def test_aliases_and_default_factories(self):
+        invoice = Invoice.trusted(amount=Decimal("12.50"), memo="Paid")
+
+        assert invoice.lines == []
+        assert invoice.note == "Paid"
+        assert invoice.__fields_set__ == {"amount", "note"}
+        assert orjson.loads(invoice.to_json()) == {"amount": 12.5, "note": "Paid"}
+
+    def test_file_uploads_are_refused_with_the_field_name(self):
+        template = CreateTemplate(templateName="Solar", projectTitle="Install", supportEmailAddress="a@portalcx.com",
+                                  supportPhoneNumber="8016697921", companyName="PortalCX", isCustomerReferrals=False,
+                                  templateAppLogoUpload=io.BytesIO(b"\x89PNG"))
+
+        with pytest.raises(TypeError, match="CreateTemplate .* field 'templateAppLogoUpload' holds a FileUpload"):
+            json_body(template)
+
+    def test_requests_send_the_serialized_body(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"message": "Project created successfully", "projectId": 1})
+
+        with mock_portalcx(handler) as pxc:
+            pxc.create_project(ProjectCreateRequest.trusted(**PROJECT))
+
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert requests[0].content == ProjectCreateRequest(**PROJECT).to_json()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_provisioning.py
+--------------------------
+Unit tests for provisioning a template together with its stages.
+"""
+
+import asyncio
+import itertools
+import threading
+
+import httpx
+import orjson
+import pytest
+
+from portalcx.models.admin_template_models import CreateTemplate, TemplateStageCreateRequest
+from portalcx.utils.provisioning import ProvisioningError
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+TEMPLATE = CreateTemplate(templateName="Solar", projectTitle="Install", supportEmailAddress="pm@portalcx.com",
+                          supportPhoneNumber="8016697921", companyName="PortalCX", isCustomerReferrals=False)
+
+
+def stage_requests(count: int):
+    return [TemplateStageCreateRequest(templateId="", stageName=f"Stage {index}",
+                                       stageDescription=f"Stage number {index}")
+            for index in range(1, count + 1)]
+
+
+class TemplateServer:
+    """
+    Keeps the stages of one template in memory. Creating the stage named
+    `failing_stage` answers 500.
+    """
+
+    def __init__(self, failing_stage: str = None):
+        self.failing_stage = failing_stage
+        self.stages = {}
+        self.template_deleted = False
+        self.lock = threading.Lock()
+        self._ids = itertools.count(101)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/CreateTemplate"):
+            return httpx.Response(200, content=orjson.dumps(TEMPLATE_ID))
+        if path.endswith("/CreateStage"):
+            stage = orjson.loads(request.content)
+            assert stage["templateId"] == TEMPLATE_ID
+            if stage["stageName"] == self.failing_stage:
+                return httpx.Response(500, json={"errorMessage": "Stage rejected"})
+            with self.lock:
+                stage["templateStageId"] = next(self._ids)
+                self.stages[stage["templateStageId"]] = stage
+            return httpx.Response(200, content=b"Template Stage created successfully")
+        if path.endswith("/GetAllStagesByTemplateId"):
+            return httpx.Response(200, json={"templateStages": list(self.stages.values())})
+        if path.endswith("/DeleteStage"):
+            del self.stages[int(request.url.params["templateStageId"])]
+            return httpx.Response(200, content=b"Template Stage deleted successfully")
+        if path.endswith("/DeleteTemplate"):
+            self.template_deleted = True
+            return httpx.Response(200, content=b"Template deleted successfully")
+        return httpx.Response(404, json={"errorMessage": "Not found"})
+
+
+class TestProvisionTemplate:
+
+    def test_stages_are_created_in_order(self):
+        server = TemplateServer()
+
+        provisioned = mock_portalcx(server, retry_policy=None).provision_template(TEMPLATE, stage_requests(5))
+
+        assert provisioned.template_id == TEMPLATE_ID
+        assert list(provisioned.stage_ids) == [f"Stage {index}" for index in range(1, 6)]
+        assert list(provisioned.stage_ids.values()) == [101, 102, 103, 104, 105]
+
+    def test_unordered_stages_are_created_concurrently(self):
+        server = TemplateServer()
+
+        pxc = mock_portalcx(server, retry_policy=None)
+        provisioned = pxc.provision_template(TEMPLATE, stage_requests(20), preserve_order=False)
+
+        assert sorted(provisioned.stage_ids.values()) == list(range(101, 121))
+        assert provisioned.stage_ids["Stage 7"] == next(stage_id for stage_id, stage in server.stages.items()
+                                                        if stage["stageName"] == "Stage 7")
+
+    def test_partial_failure_rolls_back(self):
+        server = TemplateServer(failing_stage="Stage 3")
+
+        with pytest.raises(ProvisioningError) as exc_info:
+            mock_portalcx(server, retry_policy=None).provision_template(TEMPLATE, stage_requests(5))
+
+        assert exc_info.value.template_id == TEMPLATE_ID
+        assert exc_info.value.rolled_back
+        assert exc_info.value.status_code == 500
+        assert server.stages == {}
+        assert server.template_deleted
+
+    def test_duplicate_stage_names_are_rejected_up_front(self):
+        server = TemplateServer()
+
+        with pytest.raises(ValueError):
+            pxc = mock_portalcx(server, retry_policy=None)
+            pxc.provision_template(TEMPLATE, stage_requests(2) + stage_requests(1))
+        assert server.stages == {}
+
+    def test_async_provisioning_rolls_back(self):
+        server = TemplateServer(failing_stage="Stage 4")
+
+        async def run():
+            async with mock_async_portalcx(server, retry_policy=None) as pxc:
+                provisioned = await pxc.provision_template(TEMPLATE, stage_requests(3))
+                assert list(provisioned.stage_ids.values()) == [101, 102, 103]
+
+                server.stages.clear()
+                with pytest.raises(ProvisioningError):
+                    await pxc.provision_template(TEMPLATE, stage_requests(6), preserve_order=False)
+
+        asyncio.run(run())
+        assert server.stages == {}
+        assert server.template_deleted
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_rate_limiter.py
+--------------------------
+Unit tests for client-side rate limiting.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from portalcx.utils.rate_limiter import RateLimiter, TokenBucket
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+
+def ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, text="ok")
+
+
+class TestTokenBucket:
+
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_endpoint_buckets_ignore_query_strings(self):
+        limiter = RateLimiter(endpoint_limits={"/api/Admin/Project/DeleteProject": (10, 1)})
+
+        assert limiter.reserve("/api/Admin/Project/DeleteProject?projectId=1") == 0
+        assert limiter.reserve("/api/Admin/Project/DeleteProject?projectId=2") > 0
+        assert limiter.reserve("/api/Admin/Template/DeleteStage?templateStageId=3") == 0
+
+
+class TestRateLimitedClient:
+
+    def test_limiter_is_shared_by_all_api_classes(self):
+        limiter = RateLimiter(rate=50, burst=1)
+
+        with mock_portalcx(ok, rate_limiter=limiter) as pxc:
+            assert pxc.admin_template.rate_limiter is pxc.admin_project.rate_limiter is limiter
+
+            start = time.monotonic()
+            for _ in range(3):
+                pxc.delete_project(1)
+                pxc.delete_template(TEMPLATE_ID)
+            elapsed = time.monotonic() - start
+
+        # Six requests with one token up front at 50/s need at least 0.1s
+        assert elapsed >= 0.09
+
+    def test_async_requests_are_paced(self):
+        async def run():
+            limiter = RateLimiter(endpoint_limits={"/api/Admin/Project/DeleteProject": (50, 1)})
+            async with mock_async_portalcx(ok, rate_limiter=limiter) as pxc:
+                start = time.monotonic()
+                await asyncio.gather(*(pxc.delete_project(i) for i in range(6)))
+                return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.09
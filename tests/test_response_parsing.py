@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_response_parsing.py
+------------------------------
+Unit tests for response parsing in APIBase, including lazy APIResponse envelopes.
+"""
+
+import httpx
+import pytest
+
+from portalcx.api.admin_templates import AdminTemplate
+from portalcx.api.api_base import APIResponse
+from tests.base_test import mock_portalcx
+
+
+@pytest.fixture
+def api():
+    return AdminTemplate("https://portalcx.test")
+
+
+class TestParseResponseData:
+
+    def test_json_object_goes_to_data(self, api):
+        response = httpx.Response(200, content=b'  {"projectId": 1}')
+        assert api.parse_response_data(response) == {"status": 200, "message": "", "data": {"projectId": 1}}
+
+    def test_text_and_json_strings_go_to_message(self, api):
+        response = httpx.Response(200, content=b'"3fa85f64-5717-4562-b3fc-2c963f66afa6"')
+        assert api.parse_response_data(response)["message"] == '"3fa85f64-5717-4562-b3fc-2c963f66afa6"'
+
+        response = httpx.Response(200, content=b"Stage {name} changed")
+        assert api.parse_response_data(response) == {"status": 200, "message": "Stage {name} changed", "data": None}
+
+    def test_malformed_json_raises_value_error(self, api):
+        with pytest.raises(ValueError):
+            api.parse_response_data(httpx.Response(200, content=b'{"projectId": '))
+
+    def test_error_message_from_bytes(self, api):
+        assert api.get_error_message_from_response(httpx.Response(400, json={"errorMessage": "Bad"})) == "Bad"
+        assert api.get_error_message_from_response(httpx.Response(400, json=["Bad"])) == '["Bad"]'
+        assert api.get_error_message_from_response(httpx.Response(400, text="Bad")) == "Bad"
+
+
+class TestAPIResponse:
+
+    def test_behaves_like_the_dict_envelope(self):
+        response = APIResponse(200, b'{"token": "abc"}')
+
+        assert response["data"]["token"] == "abc"
+        assert response.get("message") == ""
+        assert dict(response) == {"status": 200, "message": "", "data": {"token": "abc"}}
+        assert response == {"status": 200, "message": "", "data": {"token": "abc"}}
+        with pytest.raises(KeyError):
+            response["errorMessage"]
+
+    def test_parses_only_on_access(self):
+        response = APIResponse(200, b'{"broken": ')
+
+        assert response.status == 200
+        with pytest.raises(ValueError):
+            response.data
+
+    def test_portalcx_lazy_responses(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="Project deleted successfully")
+
+        with mock_portalcx(handler, lazy_responses=True) as pxc:
+            response_data = pxc.delete_project(1)
+
+        assert isinstance(response_data, APIResponse)
+        assert response_data["message"] == "Project deleted successfully"
+        assert response_data["data"] is None
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_retry.py
+-------------------
+Unit tests for retrying failed requests with backoff.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from portalcx.api.api_base import APIBaseError
+from portalcx.models.admin_template_models import ProjectStageCompleteRequest
+from portalcx.utils.retry import RetryPolicy, parse_retry_after
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+# No waiting between attempts in tests
+FAST_RETRIES = RetryPolicy(max_attempts=3, backoff_base=0)
+
+COMPLETE_STAGE = ProjectStageCompleteRequest(projectId=1,
+                                             completedStageLabel="Stage 1",
+                                             completedDate="2023-06-01T00:00:00+00:00",
+                                             notifyViaEmail=False,
+                                             notifyViaSms=False)
+
+
+class FlakyServer:
+    """
+    Fails the first `failures` requests, then succeeds.
+    """
+
+    def __init__(self, failures: int, status_code: int = 503, headers: dict = None, exception: Exception = None):
+        self.failures = failures
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.exception = exception
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.calls <= self.failures:
+            if self.exception is not None:
+                raise self.exception
+            return httpx.Response(self.status_code, headers=self.headers, json={"errorMessage": "Unavailable"})
+        return httpx.Response(200, text="ok")
+
+
+class ExpiringTokenServer:
+    """
+    Answers logins with a token, and other requests with the given statuses in turn
+    (200 once they run out). A 401 answer is sent as a rejected token.
+    """
+
+    def __init__(self, *statuses: int):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/AuthManagement/Login":
+            return httpx.Response(200, json={"token": "fresh"})
+        self.calls += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status != 200:
+            return httpx.Response(status, json={"errorMessage": "Unavailable"})
+        return httpx.Response(200, json={"templateStages": []})
+
+
+class TestRetry:
+
+    def test_delete_is_retried_on_503(self):
+        server = FlakyServer(failures=2)
+
+        assert mock_portalcx(server, retry_policy=FAST_RETRIES).delete_project(1)["message"] == "ok"
+        assert server.calls == 3
+
+    def test_gives_up_after_max_attempts(self):
+        server = FlakyServer(failures=5)
+
+        with pytest.raises(APIBaseError) as exc_info:
+            mock_portalcx(server, retry_policy=FAST_RETRIES).delete_project(1)
+
+        assert exc_info.value.status_code == 503
+        assert server.calls == 3
+
+    def test_connection_errors_are_retried(self):
+        server = FlakyServer(failures=1, exception=httpx.ConnectError("Connection reset"))
+
+        mock_portalcx(server, retry_policy=FAST_RETRIES).get_all_stages_by_template_id(TEMPLATE_ID)
+        assert server.calls == 2
+
+    def test_post_is_not_retried_unless_opted_in(self):
+        server = FlakyServer(failures=1)
+        with pytest.raises(APIBaseError):
+            mock_portalcx(server, retry_policy=FAST_RETRIES).complete_project_stage(COMPLETE_STAGE)
+        assert server.calls == 1
+
+        server = FlakyServer(failures=1)
+        post_retries = RetryPolicy(backoff_base=0, retry_methods={"GET", "DELETE", "POST"})
+        mock_portalcx(server, retry_policy=post_retries).complete_project_stage(COMPLETE_STAGE)
+        assert server.calls == 2
+
+    def test_non_retryable_status_fails_immediately(self):
+        server = FlakyServer(failures=1, status_code=400)
+
+        with pytest.raises(APIBaseError):
+            mock_portalcx(server, retry_policy=FAST_RETRIES).delete_project(1)
+        assert server.calls == 1
+
+    def test_retry_after_is_honored(self):
+        policy = RetryPolicy(backoff_base=0)
+        response = httpx.Response(429, headers={"Retry-After": "2"}, request=httpx.Request("GET", "https://x"))
+        error = httpx.HTTPStatusError("Too Many Requests", request=response.request, response=response)
+
+        assert policy.get_delay("GET", 1, error) == 2.0
+        assert RetryPolicy(max_retry_after=1).get_delay("GET", 1, error) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+
+    def test_full_jitter_stays_under_the_ceiling(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=4)
+
+        assert all(0 <= policy.backoff(attempt) <= min(4, 2 ** (attempt - 1))
+                   for attempt in range(1, 8) for _ in range(50))
+
+    def test_token_refresh_does_not_use_a_retry_attempt(self):
+        server = ExpiringTokenServer(401, 503, 503)
+        pxc = mock_portalcx(server, auth_token=None, retry_policy=FAST_RETRIES)
+        pxc.login("thedude@portalcx.com", "secret")
+
+        assert pxc.get_all_stages_by_template_id(TEMPLATE_ID)["status"] == 200
+        assert server.calls == 4
+
+    def test_async_token_refresh_does_not_use_a_retry_attempt(self):
+        server = ExpiringTokenServer(401, 503, 503)
+
+        async def run():
+            async with mock_async_portalcx(server, auth_token=None, retry_policy=FAST_RETRIES) as pxc:
+                await pxc.login("thedude@portalcx.com", "secret")
+                return await pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+
+        assert asyncio.run(run())["status"] == 200
+        assert server.calls == 4
+
+    def test_async_delete_is_retried(self):
+        server = FlakyServer(failures=2, status_code=502)
+
+        async def run():
+            async with mock_async_portalcx(server, retry_policy=FAST_RETRIES) as pxc:
+                return await pxc.delete_template(TEMPLATE_ID)
+
+        assert asyncio.run(run())["message"] == "ok"
+        assert server.calls == 3
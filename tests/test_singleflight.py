@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_singleflight.py
+--------------------------
+Unit tests for coalescing identical in-flight requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from portalcx.api.api_base import APIBaseError
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+OTHER_TEMPLATE_ID = "9b2e7c1a-5717-4562-b3fc-2c963f66afa6"
+STAGES = {"templateStages": [{"templateStageId": 1, "stageName": "Stage 1"}]}
+
+
+class SlowServer:
+    """
+    Answers after `delay` seconds and counts requests per URL.
+    """
+
+    def __init__(self, delay: float = 0.2, status_code: int = 200):
+        self.delay = delay
+        self.status_code = status_code
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.calls.append(str(request.url))
+        time.sleep(self.delay)
+        return httpx.Response(self.status_code, json=STAGES)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(str(request.url))
+        await asyncio.sleep(self.delay)
+        return httpx.Response(self.status_code, json=STAGES)
+
+
+def concurrently(func, args: list):
+    barrier = threading.Barrier(len(args))
+
+    def call(arg):
+        barrier.wait()
+        return func(arg)
+
+    with ThreadPoolExecutor(max_workers=len(args)) as executor:
+        return list(executor.map(call, args))
+
+
+class TestSingleFlight:
+
+    def test_identical_gets_share_one_request(self):
+        server = SlowServer()
+        pxc = mock_portalcx(server, coalesce_requests=True)
+
+        responses = concurrently(pxc.get_all_stages_by_template_id, [TEMPLATE_ID] * 8)
+
+        assert len(server.calls) == 1
+        assert all(response["data"] == STAGES for response in responses)
+        assert pxc.single_flight.coalesced == 7
+
+    def test_different_urls_are_not_coalesced(self):
+        server = SlowServer()
+        pxc = mock_portalcx(server, coalesce_requests=True)
+
+        concurrently(pxc.get_all_stages_by_template_id, [TEMPLATE_ID, OTHER_TEMPLATE_ID] * 3)
+
+        assert sorted(set(server.calls)) == sorted(server.calls)
+        assert len(server.calls) == 2
+
+    def test_errors_are_shared(self):
+        server = SlowServer(status_code=404)
+        pxc = mock_portalcx(server, coalesce_requests=True)
+
+        def get_stages(template_id):
+            with pytest.raises(APIBaseError):
+                pxc.get_all_stages_by_template_id(template_id)
+
+        concurrently(get_stages, [TEMPLATE_ID] * 4)
+        assert len(server.calls) == 1
+
+    def test_sequential_gets_are_sent_again(self):
+        server = SlowServer(delay=0)
+        pxc = mock_portalcx(server, coalesce_requests=True)
+
+        pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+        pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+
+        assert len(server.calls) == 2
+
+    def test_async_gets_share_one_request(self):
+        server = SlowServer(delay=0.05)
+
+        async def run():
+            async with mock_async_portalcx(server.handle_async, coalesce_requests=True) as pxc:
+                return await asyncio.gather(*(pxc.get_all_stages_by_template_id(TEMPLATE_ID) for _ in range(10)))
+
+        responses = asyncio.run(run())
+        assert len(server.calls) == 1
+        assert all(response["data"] == STAGES for response in responses)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_stages_cache.py
+--------------------------
+Unit tests for caching the result of get_all_stages_by_template_id.
+"""
+
+import asyncio
+
+import httpx
+
+from portalcx.models.admin_template_models import TemplateStageCreateRequest
+from portalcx.utils.cache import ResponseCache
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+STAGES = {"data": {"templateStages": [{"stageName": "Stage 1", "templateStageId": 11},
+                                      {"stageName": "Stage 2", "templateStageId": 12}]}}
+
+
+class StagesServer:
+    """
+    Records requests and answers GetAllStagesByTemplateId with an ETag.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path.endswith("GetAllStagesByTemplateId"):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=STAGES, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text="ok")
+
+    @property
+    def stage_requests(self) -> list:
+        return [r for r in self.requests if r.url.path.endswith("GetAllStagesByTemplateId")]
+
+
+class TestStagesCache:
+
+    def test_fresh_entries_are_served_without_requests(self):
+        server = StagesServer()
+        pxc = mock_portalcx(server, stages_cache=ResponseCache(ttl=60))
+
+        first = pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+        second = pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+
+        assert first == second
+        assert second["data"] == STAGES
+        assert len(server.stage_requests) == 1
+        assert pxc.stages_cache.hits == 1
+        assert pxc.stages_cache.misses == 1
+
+    def test_stale_entries_are_revalidated_with_etag(self):
+        server = StagesServer()
+        pxc = mock_portalcx(server, stages_cache=ResponseCache(ttl=0))
+
+        pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+        response_data = pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+
+        assert response_data["data"] == STAGES
+        assert server.stage_requests[1].headers["If-None-Match"] == '"v1"'
+        assert pxc.stages_cache.revalidations == 1
+
+    def test_stage_changes_invalidate_the_template(self):
+        server = StagesServer()
+        pxc = mock_portalcx(server, stages_cache=ResponseCache(ttl=60))
+
+        pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+        pxc.create_template_stage(TemplateStageCreateRequest(templateId=TEMPLATE_ID,
+                                                             stageName="Stage 3",
+                                                             stageDescription="Third stage"))
+        pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+
+        pxc.delete_stage(12)
+        pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+
+        # A stage that is not in any cached template leaves the cache alone
+        pxc.delete_stage(99)
+        pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+
+        pxc.delete_template(TEMPLATE_ID)
+        assert len(pxc.stages_cache) == 0
+
+        assert len(server.stage_requests) == 3
+        assert pxc.stages_cache.hits == 1
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=2, ttl=60)
+        response = httpx.Response(200)
+
+        for key in ("a", "b", "c"):
+            cache.store(key, {"data": key}, response)
+
+        assert cache.lookup("a") == (None, {})
+        assert cache.lookup("c")[0] == {"data": "c"}
+
+    def test_async_client_uses_cache(self):
+        server = StagesServer()
+
+        async def run():
+            async with mock_async_portalcx(server, stages_cache=ResponseCache(ttl=60)) as pxc:
+                await pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+                await pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+                await pxc.delete_template(TEMPLATE_ID)
+                await pxc.get_all_stages_by_template_id(TEMPLATE_ID)
+                return pxc.stages_cache.stats()
+
+        stats = asyncio.run(run())
+
+        assert len(server.stage_requests) == 2
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_teardown.py
+----------------------
+Unit tests for bulk teardown of projects, stages and templates.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+ID_PARAMS = {"DeleteProject": "projectId", "DeleteStage": "templateStageId", "DeleteTemplate": "templateId"}
+
+
+class DeleteServer:
+    """
+    Records deletes per endpoint. Ids in `missing` answer 404 and ids in `failing` 500.
+    """
+
+    def __init__(self, missing=(), failing=(), delay: float = 0.0):
+        self.missing = set(missing)
+        self.failing = set(failing)
+        self.delay = delay
+        self.deleted = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        item_id = request.url.params[ID_PARAMS[endpoint]]
+        if item_id in self.missing:
+            return httpx.Response(404, json={"errorMessage": "Not found"})
+        if item_id in self.failing:
+            return httpx.Response(500, json={"errorMessage": "Server error"})
+        with self.lock:
+            self.deleted.append((endpoint, item_id))
+        return httpx.Response(200, content=b"Deleted successfully")
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        try:
+            return self.respond(request)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay)
+        return self.respond(request)
+
+
+class TestTeardown:
+
+    def test_deletes_in_dependency_order_with_bounded_concurrency(self):
+        server = DeleteServer(delay=0.01)
+        progress = []
+
+        pxc = mock_portalcx(server, retry_policy=None)
+        report = pxc.teardown(project_ids=range(1, 41), template_stage_ids=[101, 102], template_ids=[TEMPLATE_ID],
+                              concurrency=8, progress=lambda *args: progress.append(args))
+
+        assert report.ok
+        assert [endpoint for endpoint, _ in server.deleted] == (["DeleteProject"] * 40 + ["DeleteStage"] * 2
+                                                                + ["DeleteTemplate"])
+        assert 1 < server.peak_in_flight <= 8
+        assert progress[-1] == ("templates", 1, 1)
+        assert ("projects", 40, 40) in progress
+
+    def test_missing_items_count_as_deleted(self):
+        server = DeleteServer(missing={"2", "102"})
+
+        report = mock_portalcx(server, retry_policy=None).teardown(project_ids=[1, 2], template_stage_ids=[101, 102])
+
+        assert report.ok
+        assert report.to_dict()["projects"] == {"total": 2, "deleted": 1, "missing": 1, "failed": 0,
+                                                "skipped": False}
+        assert report.missing["stages"] == 1
+
+    def test_failures_skip_later_phases(self):
+        server = DeleteServer(failing={"3"})
+
+        pxc = mock_portalcx(server, retry_policy=None)
+        report = pxc.teardown(project_ids=[1, 2, 3], template_stage_ids=[101], template_ids=[TEMPLATE_ID])
+
+        assert not report.ok
+        assert [result.item for result in report.failures["projects"]] == [3]
+        assert report.skipped == ["stages", "templates"]
+        assert all(endpoint == "DeleteProject" for endpoint, _ in server.deleted)
+
+    def test_async_teardown(self):
+        server = DeleteServer(missing={"5"}, delay=0.01)
+
+        async def run():
+            async with mock_async_portalcx(server.handle_async, retry_policy=None) as pxc:
+                return await pxc.teardown(project_ids=range(1, 101), template_ids=[TEMPLATE_ID], concurrency=50)
+
+        started = time.perf_counter()
+        report = asyncio.run(run())
+
+        assert report.ok
+        assert report.deleted == {"projects": 99, "stages": 0, "templates": 1}
+        assert report.missing["projects"] == 1
+        assert time.perf_counter() - started < 0.5
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_template_upload.py
+-----------------------------
+Unit tests for streaming logo uploads in CreateTemplate requests.
+"""
+
+import asyncio
+import io
+import tracemalloc
+from contextlib import contextmanager
+
+import httpx
+import orjson
+
+from portalcx import PortalCX
+from portalcx.api.admin_templates import created_template_id
+from portalcx.models.admin_template_models import CreateTemplate, FileUpload
+from tests.base_test import TEMPLATE_ID, mock_async_portalcx, mock_portalcx
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+
+
+def template(**logos) -> CreateTemplate:
+    return CreateTemplate(templateName="Solar", projectTitle="Install", supportEmailAddress="pm@portalcx.com",
+                          supportPhoneNumber="8016697921", companyName="PortalCX", isCustomerReferrals=False,
+                          **logos)
+
+
+class StreamingTransport(httpx.BaseTransport):
+    """
+    Consumes request bodies chunk by chunk, like a socket, and keeps only their size.
+    """
+
+    def __init__(self):
+        self.body_size = 0
+        self.largest_chunk = 0
+        self.headers = None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.headers = request.headers
+        for chunk in request.stream:
+            self.body_size += len(chunk)
+            self.largest_chunk = max(self.largest_chunk, len(chunk))
+        return httpx.Response(200, content=orjson.dumps(TEMPLATE_ID))
+
+
+class TrackedUpload(FileUpload):
+    """
+    Remembers the file objects it opened.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.opened = []
+
+    @contextmanager
+    def open(self):
+        with super().open() as fileobj:
+            self.opened.append(fileobj)
+            yield fileobj
+
+
+def multipart_parts(request: httpx.Request) -> dict:
+    """
+    Split a multipart body into {field name: (part headers, content)}.
+    """
+    boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+    parts = {}
+    for part in request.read().split(b"--" + boundary)[1:-1]:
+        headers, content = part.split(b"\r\n\r\n", 1)
+        name = headers.split(b'name="')[1].split(b'"')[0].decode()
+        parts[name] = (headers.decode(), content[:-2])
+    return parts
+
+
+class TestTemplateUpload:
+
+    def test_logo_paths_are_sent_as_file_parts(self, tmp_path):
+        logo_path = tmp_path / "brand-logo.png"
+        logo_path.write_bytes(PNG)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=orjson.dumps(TEMPLATE_ID))
+
+        with mock_portalcx(handler) as pxc:
+            pxc.create_template(template(templateAppLogoUpload=logo_path,
+                                         emailLogoUpload=FileUpload(io.BytesIO(b"GIF89a"), "email.gif")))
+
+        parts = multipart_parts(requests[0])
+        headers, content = parts["templateAppLogoUpload"]
+        assert 'filename="brand-logo.png"' in headers
+        assert "Content-Type: image/png" in headers
+        assert content == PNG
+        assert "Content-Type: image/gif" in parts["emailLogoUpload"][0]
+        assert parts["templateName"][1] == b"Solar"
+        assert "Content-Length" in requests[0].headers
+
+    def test_large_logos_are_streamed(self, tmp_path):
+        logo_path = tmp_path / "logo.png"
+        logo_path.write_bytes(b"\0" * (16 * 1024 * 1024))
+        transport = StreamingTransport()
+
+        with PortalCX(base_url="https://portalcx.test", auth_token="abc",
+                      client=httpx.Client(transport=transport)) as pxc:
+            tracemalloc.start()
+            try:
+                pxc.create_template(template(templateAppLogoUpload=logo_path))
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert transport.body_size > 16 * 1024 * 1024
+        assert int(transport.headers["Content-Length"]) == transport.body_size
+        assert transport.largest_chunk <= 64 * 1024
+        assert peak < 2 * 1024 * 1024
+
+    def test_plain_strings_stay_text_fields(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=orjson.dumps(TEMPLATE_ID))
+
+        with mock_portalcx(handler) as pxc:
+            pxc.create_template(template(templateAppLogoUpload="https://cdn.portalcx.com/logo.png"))
+
+        headers, content = multipart_parts(requests[0])["templateAppLogoUpload"]
+        assert "filename" not in headers
+        assert content == b"https://cdn.portalcx.com/logo.png"
+
+    def test_async_upload_closes_opened_files(self, tmp_path):
+        logo_path = tmp_path / "logo.svg"
+        logo_path.write_bytes(b"<svg/>")
+        upload = TrackedUpload(logo_path)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await request.aread()
+            return httpx.Response(200, content=orjson.dumps(TEMPLATE_ID))
+
+        async def run():
+            async with mock_async_portalcx(handler) as pxc:
+                return await pxc.create_template(template(templateAppLogoUpload=upload))
+
+        assert created_template_id(asyncio.run(run())) == TEMPLATE_ID
+        assert upload.content_type == "image/svg+xml"
+        assert len(upload.opened) == 1 and upload.opened[0].closed
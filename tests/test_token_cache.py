@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_token_cache.py
+-------------------------
+Unit tests for the on-disk token cache.
+"""
+
+import asyncio
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from portalcx.utils.token_cache import TokenCache
+from tests.base_test import BASE_URL, mock_async_portalcx, mock_portalcx
+from tests.test_token_manager import AuthServer, jwt
+
+EMAIL = "user@portalcx.com"
+
+
+class TestTokenCache:
+
+    def test_cold_start_reuses_the_cached_token(self, tmp_path):
+        server = AuthServer()
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+
+        first = mock_portalcx(server, auth_token=None, token_cache=cache).login(EMAIL, "secret")
+        second = mock_portalcx(server, auth_token=None, token_cache=cache).login(EMAIL, "secret")
+
+        assert first == second
+        assert server.logins == 1
+        assert EMAIL not in (tmp_path / "tokens.json").read_text()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_cache_file_is_private(self, tmp_path):
+        cache = TokenCache(str(tmp_path / "portalcx" / "tokens.json"))
+        mock_portalcx(AuthServer(), auth_token=None, token_cache=cache).login(EMAIL, "secret")
+
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(tmp_path / "portalcx").st_mode) == 0o700
+
+    def test_tokens_close_to_expiry_are_not_reused(self, tmp_path):
+        cache = TokenCache(str(tmp_path / "tokens.json"), min_ttl=300)
+        lock = cache.acquire()
+        try:
+            cache.store(BASE_URL, EMAIL, jwt(120))
+            assert cache.load(BASE_URL, EMAIL) is None
+            cache.store(BASE_URL, EMAIL, "opaque-token")
+            assert cache.load(BASE_URL, EMAIL) is None
+        finally:
+            cache.release(lock)
+
+    def test_concurrent_workers_log_in_once(self, tmp_path):
+        server = AuthServer(login_delay=0.05)
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+
+        def login(_) -> str:
+            return mock_portalcx(server, auth_token=None, token_cache=cache).login(EMAIL, "secret")
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            tokens = set(executor.map(login, range(6)))
+
+        assert len(tokens) == 1
+        assert server.logins == 1
+
+    def test_rejected_cached_token_triggers_a_login(self, tmp_path):
+        server = AuthServer()
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        mock_portalcx(server, auth_token=None, token_cache=cache).login(EMAIL, "secret")
+        server.token = "revoked"
+
+        pxc = mock_portalcx(server, auth_token=None, token_cache=cache)
+        pxc.login(EMAIL, "secret")
+        assert pxc.delete_project(1)["message"] == "ok"
+        assert server.logins == 2
+
+    def test_async_login_uses_the_cache(self, tmp_path):
+        server = AuthServer()
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        token = mock_portalcx(server, auth_token=None, token_cache=cache).login(EMAIL, "secret")
+
+        async def run():
+            async with mock_async_portalcx(server, auth_token=None, token_cache=cache) as pxc:
+                return await pxc.login(EMAIL, "secret")
+
+        assert asyncio.run(run()) == token
+        assert server.logins == 1
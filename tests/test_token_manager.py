@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+tests/test_token_manager.py
+---------------------------
+Unit tests for the shared token manager.
+"""
+
+import asyncio
+import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import orjson
+import pytest
+
+from portalcx.api.api_base import APIBaseError
+from portalcx.utils.token_manager import TokenManager, jwt_expiry
+from tests.base_test import mock_async_portalcx, mock_portalcx
+
+
+def jwt(expires_in: float, subject: str = "user") -> str:
+    def encode(value: dict) -> str:
+        return base64.urlsafe_b64encode(orjson.dumps(value)).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'HS256'})}.{encode({'sub': subject, 'exp': time.time() + expires_in})}.signature"
+
+
+class AuthServer:
+    """
+    Issues a new JWT on every login and accepts only the latest one.
+    """
+
+    def __init__(self, expires_in: float = 3600, login_delay: float = 0.0, password: str = "secret"):
+        self.expires_in = expires_in
+        self.login_delay = login_delay
+        self.password = password
+        self.logins = 0
+        self.token = None
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/AuthManagement/Login":
+            time.sleep(self.login_delay)
+            if orjson.loads(request.content).get("password") != self.password:
+                return httpx.Response(401, json={"errorMessage": "Invalid credentials"})
+            with self.lock:
+                self.logins += 1
+                self.token = jwt(self.expires_in, subject=str(self.logins))
+            return httpx.Response(200, json={"token": self.token})
+
+        if request.headers.get("Authorization") != f"Bearer {self.token}":
+            return httpx.Response(401, json={"errorMessage": "Unauthorized"})
+        return httpx.Response(200, text="ok")
+
+
+def age(manager: TokenManager):
+    """
+    Make the current 30s token look 25s old, so it is due for refresh.
+    """
+    manager.received_at = time.time() - 25
+    manager.expires_at = time.time() + 5
+
+
+class TestTokenManager:
+
+    def test_jwt_expiry(self):
+        token = jwt(600)
+
+        assert abs(jwt_expiry(token) - (time.time() + 600)) < 5
+        assert jwt_expiry("opaque-token") is None
+        assert jwt_expiry("a.!!!.c") is None
+
+    def test_one_token_for_all_api_classes(self):
+        pxc = mock_portalcx(AuthServer(), auth_token=None)
+
+        pxc.token = "abc"
+        assert pxc.auth_token == "abc"
+        assert pxc.admin_template.token == pxc.admin_project.auth_token == "abc"
+
+    def test_expiring_token_is_refreshed_once(self):
+        server = AuthServer(expires_in=30, login_delay=0.05)
+        pxc = mock_portalcx(server, auth_token=None)
+        pxc.login("user@portalcx.com", "secret")
+        age(pxc.token_manager)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(pxc.delete_project, range(16)))
+
+        assert all(response["message"] == "ok" for response in responses)
+        assert server.logins == 2
+
+    def test_rejected_token_is_replaced_and_retried(self):
+        server = AuthServer()
+        pxc = mock_portalcx(server, auth_token=None)
+        pxc.login("user@portalcx.com", "secret")
+        server.token = "revoked"
+
+        assert pxc.delete_project(1)["message"] == "ok"
+        assert server.logins == 2
+
+    def test_failed_login_is_not_repeated(self):
+        server = AuthServer()
+        pxc = mock_portalcx(server, auth_token=None)
+
+        with pytest.raises(APIBaseError) as error:
+            pxc.login("user@portalcx.com", "wrong")
+        assert error.value.status_code == 401
+        assert pxc.token_manager.login is None
+
+        with pytest.raises(APIBaseError) as error:
+            pxc.delete_project(1)
+        assert error.value.error_message == "Unauthorized"
+        assert server.logins == 0
+
+    def test_failed_refresh_keeps_a_valid_token(self):
+        manager = TokenManager(jwt(30))
+        age(manager)
+
+        def failing_login():
+            raise httpx.ConnectError("Connection refused")
+
+        manager.login = failing_login
+        assert manager.get_token() == manager.token
+
+    def test_async_refresh_is_single_flight(self):
+        server = AuthServer(expires_in=30)
+
+        async def run():
+            async with mock_async_portalcx(server, auth_token=None) as pxc:
+                await pxc.login("user@portalcx.com", "secret")
+                age(pxc.token_manager)
+                return await asyncio.gather(*(pxc.delete_project(i) for i in range(10)))
+
+        assert all(response["message"] == "ok" for response in asyncio.run(run()))
+        assert server.logins == 2